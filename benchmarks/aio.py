@@ -0,0 +1,53 @@
+import asyncio
+import time
+import numpy as np
+import pystable
+from pystable import aio
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+N = 20_000
+TICK = 0.001
+
+
+async def heartbeat(stop: asyncio.Event) -> float:
+    '''Longest gap between event loop ticks scheduled every `TICK` s'''
+    worst = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(TICK)
+        now = time.perf_counter()
+        worst = max(worst, now - last - TICK)
+        last = now
+    return worst
+
+
+async def measure(dist, x, use_aio: bool) -> float:
+    stop = asyncio.Event()
+    beat = asyncio.ensure_future(heartbeat(stop))
+    await asyncio.sleep(0.01)
+    if use_aio:
+        await aio.apdf(dist, x)
+    else:
+        dist.pdf(x)
+    stop.set()
+    return await beat
+
+
+async def main() -> None:
+    x = np.linspace(-10, 10, N)
+    with pystable.StableDistribution(*PARAMS.values(), 1) as dist:
+        for use_aio in (False, True):
+            start = time.perf_counter()
+            stall = await measure(dist, x, use_aio)
+            print('{:>14}: {:.3f} s, longest event loop stall {:.4f} s'
+                  .format('apdf' if use_aio else 'dist.pdf',
+                          time.perf_counter() - start, stall))
+
+
+def run() -> None:
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    run()
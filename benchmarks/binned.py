@@ -0,0 +1,34 @@
+import time
+import pystable
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+N = 100_000
+
+
+def run() -> None:
+    dist = pystable.create(PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                           PARAMS['mu'], 1)
+    data = pystable.rnd(dist, N, seed=1)
+
+    exact = None
+    for mode, bins in (('quantile', 250), ('quantile', 1000),
+                       ('histogram', 1000), ('subsample', 1000)):
+        start = time.perf_counter()
+        result = pystable.fit_binned(data, mode, bins, seed=1,
+                                     reference='loglike' if exact else 'fit')
+        elapsed = time.perf_counter() - start
+        if exact is None:
+            exact = result.exact
+            print('exact fit: {:.2f} s, alpha {:.4f}, beta {:.4f}'
+                  .format(exact.elapsed, exact.alpha, exact.beta))
+        print('{:>9} {:>5} bins: {:.3f} s fit ({:.0f}x), {:.2f} s total, '
+              'alpha {:+.4f}, beta {:+.4f}, loglike rel. error {:.1e}'
+              .format(mode, result.points, result.elapsed,
+                      exact.elapsed / result.elapsed, elapsed,
+                      result.alpha - exact.alpha, result.beta - exact.beta,
+                      result.loglike_error))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,30 @@
+import timeit
+import numpy as np
+import pystable
+
+
+CASES = {'gauss': (2.0, 0.0, 1.0, 0.0), 'cauchy': (1.0, 0.0, 1.0, 0.0),
+         'levy': (0.5, 1.0, 1.0, 0.0)}
+SIZES = (1, 100, 1000, 100_000)
+
+
+def best(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number
+
+
+def run() -> None:
+    for name, params in CASES.items():
+        dist = pystable.create(*params, 1)
+        for n in SIZES:
+            x = np.linspace(-10, 10, n)
+            number = max(1, 10_000 // n)
+            for kind, fn in (('pdf', pystable.pdf_array),
+                             ('cdf', pystable.cdf_array)):
+                c = best(lambda: fn(dist, x, fast=False), number)
+                fast = best(lambda: fn(dist, x), number)
+                print('{:>6} {} n={:<6}: C {:.2e} s, closed form {:.2e} s '
+                      '({:.1f}x)'.format(name, kind, n, c, fast, c / fast))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,38 @@
+import time
+import numpy as np
+import pystable
+
+
+FIT = {
+    "alpha": 1.4430192097069168,
+    "beta": 0.042938293127910906,
+    "sigma": 0.004747879945834797,
+    "mu": -0.0004197632840157609,
+    "parameterization": 1,
+}
+N = 10000
+THREADS = [1, 2, 4, 0]
+RELTOLS = [1e-12, 1e-8, 1e-6, 1e-4]
+
+
+def run() -> None:
+    x = np.linspace(-0.05, 0.05, N)
+    with pystable.StableDistribution(**FIT) as dist:
+        with pystable.configure(reltol=1e-14):
+            exact = dist.pdf(x)
+
+        print('{:>8} {:>8} {:>10} {:>12}'.format('threads', 'reltol',
+                                                 'time [s]', 'max rel err'))
+        for threads in THREADS:
+            for reltol in RELTOLS:
+                with pystable.configure(threads=threads, reltol=reltol):
+                    start = time.perf_counter()
+                    actual = dist.pdf(x)
+                    elapsed = time.perf_counter() - start
+                err = np.max(np.abs(actual - exact) / exact)
+                print('{:>8} {:>8.0e} {:>10.4f} {:>12.2e}'
+                      .format(threads or 'all', reltol, elapsed, err))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,36 @@
+import os
+import time
+import pystable
+
+
+FIT = {
+    "alpha": 1.4430192097069168,
+    "beta": 0.042938293127910906,
+    "sigma": 0.004747879945834797,
+    "mu": -0.0004197632840157609,
+    "parameterization": 1,
+}
+SERIES = 32
+LENGTH = 2000
+
+
+def run() -> None:
+    dist = pystable.create(FIT['alpha'], FIT['beta'], FIT['sigma'],
+                           FIT['mu'], FIT['parameterization'])
+    datasets = [pystable.rnd(dist, LENGTH, seed=i + 1) for i in range(SERIES)]
+
+    cpus = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    baseline = None
+    print('{} series x {} points'.format(SERIES, LENGTH))
+    for n in workers:
+        start = time.perf_counter()
+        pystable.fit_many(datasets, workers=n)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print('{:>3} workers: {:.2f} s ({:.2f}x)'
+              .format(n, elapsed, baseline / elapsed))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,42 @@
+import time
+import numpy as np
+import pystable
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+SIZES = [10**3, 10**4, 10**5, 10**6]
+# Largest sample each method is run on; ML fits scale with
+# iterations x points and take hours at 10^6
+MAX_SIZE = {
+    'mcculloch': 10**6,
+    'koutrouvelis': 10**6,
+    'mle2d': 10**5,
+    'mle': 10**4,
+}
+
+
+def run() -> None:
+    dist = pystable.create(PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                           PARAMS['mu'], 1)
+    truth = np.array([PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                      PARAMS['mu']])
+
+    print('{:>13} {:>8} {:>10}   abs error (alpha, beta, sigma, mu_1)'
+          .format('method', 'points', 'time [s]'))
+    for n in SIZES:
+        data = pystable.rnd(dist, n, seed=1)
+        for method, max_size in MAX_SIZE.items():
+            if n > max_size:
+                continue
+            fitted = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+            start = time.perf_counter()
+            pystable.fit_array(fitted, data, method)
+            elapsed = time.perf_counter() - start
+            c = fitted.contents
+            err = np.abs(np.array([c.alpha, c.beta, c.sigma, c.mu_1]) - truth)
+            print('{:>13} {:>8} {:>10.3f}   {}'
+                  .format(method, n, elapsed, np.round(err, 4)))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,38 @@
+import time
+import numpy as np
+import pystable
+
+
+K = 400
+N = 50
+
+
+def run() -> None:
+    '''
+    A K x N likelihood surface over (alpha, beta) with `pdf_grid` against
+    a `create` and `pdf` call per parameter set.
+    '''
+    alpha, beta = np.meshgrid(np.linspace(1.1, 1.9, 20),
+                              np.linspace(-0.5, 0.5, K // 20))
+    alpha, beta = alpha.ravel(), beta.ravel()
+    x = np.linspace(-5, 5, N).tolist()
+
+    start = time.perf_counter()
+    expected = np.array([pystable.pdf(pystable.create(a, b, 1.0, 0.0, 1), x,
+                                      N) for a, b in zip(alpha, beta)])
+    before = time.perf_counter() - start
+    print('create + pdf per row: {:.3f} s'.format(before))
+
+    for workers in (1, 2, 4):
+        with pystable.configure(threads=1):
+            start = time.perf_counter()
+            actual = pystable.pdf_grid(alpha, beta, 1.0, 0.0, x,
+                                       workers=workers)
+            after = time.perf_counter() - start
+        print('pdf_grid, {} workers: {:.3f} s ({:.1f}x), max rel diff {:.1e}'
+              .format(workers, after, before / after,
+                      np.max(np.abs(actual - expected) / expected)))
+
+
+if __name__ == "__main__":
+    run()
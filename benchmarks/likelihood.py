@@ -0,0 +1,49 @@
+import time
+import numpy as np
+import pystable
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+N = 2000
+EVALS = 50
+
+
+def list_loglikelihood(row, data) -> float:
+    dist = pystable.create(*row, 0)
+    pdf = np.array(pystable.pdf(dist, data.tolist(), data.size))
+    pystable.free(dist)
+    return np.log(pdf[pdf > 0]).sum()
+
+
+def run() -> None:
+    dist = pystable.create(PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                           PARAMS['mu'], 0)
+    data = pystable.rnd(dist, N, seed=1)
+    rng = np.random.default_rng(1)
+    params = np.column_stack((rng.uniform(1.3, 1.6, EVALS),
+                              rng.uniform(-0.2, 0.2, EVALS),
+                              rng.uniform(0.8, 1.2, EVALS),
+                              rng.uniform(-0.1, 0.1, EVALS)))
+
+    start = time.perf_counter()
+    expected = [list_loglikelihood(row, data) for row in params]
+    lists = (time.perf_counter() - start) / EVALS
+
+    with pystable.LogLikelihood(data) as ll:
+        start = time.perf_counter()
+        actual = ll(params)
+        batch = (time.perf_counter() - start) / EVALS
+
+        start = time.perf_counter()
+        ll.gradient(params[:5])
+        gradient = (time.perf_counter() - start) / 5
+
+    print('max abs difference: {:.2e}'.format(np.abs(actual - expected).max()))
+    print('pdf lists + np.log: {:.5f} s/eval'.format(lists))
+    print('LogLikelihood:      {:.5f} s/eval ({:.2f}x)'
+          .format(batch, lists / batch))
+    print('gradient:           {:.5f} s/vector (9 evals)'.format(gradient))
+
+
+if __name__ == "__main__":
+    run()
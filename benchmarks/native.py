@@ -0,0 +1,75 @@
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pystable
+from pystable import native
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+SIZES = (1, 10, 1000)
+THREADS = 4
+FUNCTIONS = (pystable.c_stable_pdf, pystable.c_stable_cdf,
+             pystable.c_stable_q, pystable.c_stable_rnd,
+             pystable.c_stable_fit)
+
+
+def best(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def ctypes_only(lib, on: bool) -> None:
+    '''Call the wrapped functions of `lib` through ctypes (or natively)'''
+    for c_fn in FUNCTIONS:
+        f = c_fn(lib)
+        f.native = None if on else native.function(lib, f.__name__)
+
+
+def run() -> None:
+    '''
+    Time the wrappers through the compiled binding `pystable._native` and
+    through ctypes on the same library, per call and from `THREADS`
+    threads (both release the GIL while libstable runs).
+    '''
+    if not native.AVAILABLE:
+        print('pystable._native is not built, run `python build.py '
+              'build_ext`')
+        return
+    lib = pystable.load_libstable()
+    dist = pystable.create(PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                           PARAMS['mu'], 1)
+    data = pystable.rnd(dist, 200, seed=1)
+    for n in SIZES:
+        x = np.linspace(-10, 10, n)
+        p = np.linspace(0.01, 0.99, n)
+        out = np.empty(n)
+        cases = (('pdf_array', lambda: pystable.pdf_array(dist, x, out)),
+                 ('cdf_array', lambda: pystable.cdf_array(dist, x, out)),
+                 ('q_array', lambda: pystable.q_array(dist, p, out)),
+                 ('rnd', lambda: pystable.rnd(dist, out=out)))
+        for name, fn in cases:
+            number = max(1, 20_000 // (n * (20 if name == 'q_array' else 1)))
+            ctypes_only(lib, True)
+            before = best(fn, number)
+            ctypes_only(lib, False)
+            after = best(fn, number)
+            print('{:>9} n={:<5}: ctypes {:.2e} s, native {:.2e} s ({:.2f}x)'
+                  .format(name, n, before, after, before / after))
+
+    def fit(_):
+        return pystable.fit_array(pystable.create(1.5, 0.0, 1.0, 0.0, 1),
+                                  data)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        for on in (True, False):
+            ctypes_only(lib, on)
+            serial = best(lambda: list(map(fit, range(THREADS))), 1)
+            threaded = best(lambda: list(executor.map(fit, range(THREADS))),
+                            1)
+            print('{} fit x{}: serial {:.3f} s, {} threads {:.3f} s ({:.1f}x)'
+                  .format('ctypes' if on else 'native', THREADS, serial,
+                          THREADS, threaded, serial / threaded))
+    ctypes_only(lib, False)
+
+
+if __name__ == "__main__":
+    run()
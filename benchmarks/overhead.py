@@ -0,0 +1,52 @@
+import ctypes as ct
+import time
+import pystable
+from pystable import utils
+
+
+FIT = {
+    "alpha": 1.4430192097069168,
+    "beta": 0.042938293127910906,
+    "sigma": 0.004747879945834797,
+    "mu": -0.0004197632840157609,
+    "parameterization": 1,
+}
+CALLS = 20000
+X = [-0.01, 0.0, 0.01]
+
+
+def uncached_pdf(dist: pystable.STABLE_DIST, x, Nx: int):
+    '''Per-call library load and function binding, as before the registry'''
+    lib = ct.cdll.LoadLibrary(utils.libstable_path())
+    func = lib.__getattr__('stable_pdf')
+    func.restype = ct.c_void_p
+    func.argtypes = (ct.POINTER(pystable.STABLE_DIST),
+                     ct.POINTER(ct.c_double), ct.c_uint,
+                     ct.POINTER(ct.c_double), ct.POINTER(ct.c_double))
+    array_type = ct.c_double * Nx
+    pdf = (ct.c_double * Nx)()
+    func(dist, array_type(*x), Nx, pdf, ct.POINTER(ct.c_double)())
+    return list(pdf)
+
+
+def timeit(fn, *args) -> float:
+    '''Mean wall time per call in microseconds'''
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        fn(*args)
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+
+def run() -> None:
+    dist = pystable.create(FIT['alpha'], FIT['beta'], FIT['sigma'],
+                           FIT['mu'], FIT['parameterization'])
+
+    before = timeit(uncached_pdf, dist, X, len(X))
+    after = timeit(pystable.pdf, dist, X, len(X))
+    print('pdf per-call (uncached): {:.2f} us'.format(before))
+    print('pdf per-call (registry): {:.2f} us'.format(after))
+    print('speedup: {:.2f}x'.format(before / after))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,34 @@
+import time
+import numpy as np
+import pystable
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+N = 10_000
+
+
+def run() -> None:
+    dist = pystable.create(PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                           PARAMS['mu'], 1)
+    ladders = {'uniform': np.linspace(1e-4, 1 - 1e-4, N),
+               'tails': np.concatenate((np.geomspace(1e-6, 0.05, N // 2),
+                                        1 - np.geomspace(0.05, 1e-6,
+                                                         N // 2)))}
+    for name, q in ladders.items():
+        start = time.perf_counter()
+        expected = pystable.q_array(dist, q)
+        per_point = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = pystable.q_sorted(dist, q)
+        curve = time.perf_counter() - start
+
+        diff = np.abs(actual - expected) / np.maximum(np.abs(expected),
+                                                      PARAMS['sigma'])
+        print('{:>7}: stable_q {:.3f} s, q_sorted {:.3f} s ({:.1f}x), '
+              'max rel diff {:.1e}'.format(name, per_point, curve,
+                                           per_point / curve, diff.max()))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,55 @@
+import time
+import numpy as np
+import pystable
+
+
+FIT = {
+    "alpha": 1.4430192097069168,
+    "beta": 0.042938293127910906,
+    "sigma": 0.004747879945834797,
+    "mu": -0.0004197632840157609,
+    "parameterization": 1,
+}
+SIMS = 100
+STEPS = 12960  # 90d of 10 min periods
+WORKERS = [1, 2, 4, 8]
+
+
+def loop_rnd(lib, dist, n: int) -> np.ndarray:
+    '''One ctypes round trip per sample'''
+    return np.asarray([pystable.stable_rnd_point(lib, dist)
+                       for _ in range(n)])
+
+
+def run() -> None:
+    lib = pystable.load_libstable()
+    dist = pystable.create(FIT['alpha'], FIT['beta'], FIT['sigma'],
+                           FIT['mu'], FIT['parameterization'])
+    n = SIMS * STEPS
+
+    start = time.perf_counter()
+    loop_rnd(lib, dist, n)
+    loop = time.perf_counter() - start
+
+    out = np.empty((SIMS, STEPS))
+    start = time.perf_counter()
+    pystable.rnd(dist, out=out)
+    bulk = time.perf_counter() - start
+
+    print('samples: {}'.format(n))
+    print('stable_rnd_point loop: {:.3f} s ({:.2e} samples/s)'
+          .format(loop, n / loop))
+    print('stable_rnd bulk:       {:.3f} s ({:.2e} samples/s)'
+          .format(bulk, n / bulk))
+    print('speedup: {:.1f}x'.format(loop / bulk))
+
+    for workers in WORKERS:
+        start = time.perf_counter()
+        pystable.rnd_parallel(dist, out=out, seed=1, workers=workers)
+        elapsed = time.perf_counter() - start
+        print('rnd_parallel ({:2d} workers): {:.3f} s ({:.2e} samples/s)'
+              .format(workers, elapsed, n / elapsed))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,35 @@
+import time
+import pystable
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+WINDOW = 5000
+STEP = 100  # 2% of the window
+WINDOWS = 20
+
+
+def run() -> None:
+    dist = pystable.create(PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                           PARAMS['mu'], 1)
+    data = pystable.rnd(dist, WINDOW + STEP * WINDOWS, seed=1)
+
+    start = time.perf_counter()
+    for i in range(WINDOWS + 1):
+        fitted = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+        pystable.fit_array(fitted, data[i * STEP:i * STEP + WINDOW])
+        pystable.free(fitted)
+    fresh = (time.perf_counter() - start) / (WINDOWS + 1)
+
+    for drift in (0.0, 0.02):
+        start = time.perf_counter()
+        results = list(pystable.rolling_fit(data, WINDOW, STEP, drift))
+        rolling = (time.perf_counter() - start) / len(results)
+        refits = sum(r.refit for r in results)
+        print('drift {:.2f}: {:.4f} s/window vs {:.4f} s fresh ({:.1f}x), '
+              '{} of {} windows refit'.format(drift, rolling, fresh,
+                                              fresh / rolling, refits,
+                                              len(results)))
+
+
+if __name__ == "__main__":
+    run()
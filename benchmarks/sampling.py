@@ -0,0 +1,61 @@
+import time
+import numpy as np
+import pystable
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+N = 1_000_000
+KS_N = 100_000
+REPS = 50
+REP_N = 4096
+
+
+def ks(dist, samples: np.ndarray) -> float:
+    '''Kolmogorov-Smirnov distance to the exact cdf'''
+    x = np.sort(samples)
+    F = pystable.cdf_array(dist, x)
+    n = x.size
+    return max(np.max(np.arange(1, n + 1) / n - F),
+               np.max(F - np.arange(n) / n))
+
+
+def run() -> None:
+    dist = pystable.create(PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                           PARAMS['mu'], 1)
+    start = time.perf_counter()
+    table = pystable.DEFAULT_CACHE.quantile_table(dist.contents.alpha,
+                                                  dist.contents.beta)
+    print('table build: {:.2f} s, errors {}'
+          .format(time.perf_counter() - start, table.errors))
+
+    start = time.perf_counter()
+    pystable.rnd(dist, N, seed=1)
+    cms = time.perf_counter() - start
+    start = time.perf_counter()
+    pystable.rnd_table(dist, N, seed=1)
+    inverse = time.perf_counter() - start
+    print('{} samples: stable_rnd {:.3f} s, rnd_table {:.3f} s ({:.1f}x)'
+          .format(N, cms, inverse, cms / inverse))
+
+    print('KS distance to the exact cdf, {} samples (1/sqrt(n) = {:.1e}): '
+          'stable_rnd {:.1e}, rnd_table {:.1e}'
+          .format(KS_N, KS_N ** -0.5, ks(dist, pystable.rnd(dist, KS_N, 2)),
+                  ks(dist, pystable.rnd_table(dist, KS_N, 2))))
+
+    # Standard error of E[tanh(X - 1)] over repeated estimates
+    def spread(draw) -> float:
+        return np.std([np.tanh(draw(seed) - 1).mean()
+                       for seed in range(1, REPS + 1)])
+
+    base = spread(lambda s: pystable.rnd(dist, REP_N, s))
+    print('std of E[tanh(X - 1)] over {} runs of {}: stable_rnd {:.2e}'
+          .format(REPS, REP_N, base))
+    for method in pystable.UNIFORM_METHODS:
+        std = spread(lambda s: pystable.rnd_table(dist, REP_N, s,
+                                                  method=method))
+        print('{:>10}: {:.2e} (variance / {:.1f})'
+              .format(method, std, (base / std) ** 2))
+
+
+if __name__ == "__main__":
+    run()
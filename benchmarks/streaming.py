@@ -0,0 +1,46 @@
+import os
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pystable
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+N = 200_000
+CHUNK = 1 << 14
+
+
+def measure(fn) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run() -> None:
+    dist = pystable.create(PARAMS['alpha'], PARAMS['beta'], PARAMS['sigma'],
+                           PARAMS['mu'], 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'returns.bin')
+        target = os.path.join(tmp, 'cdf.bin')
+        pystable.rnd(dist, N, seed=1).tofile(source)
+
+        def lists():
+            x = np.fromfile(source).tolist()
+            pystable.cdf(dist, x, len(x))
+
+        def mapped():
+            pystable.evaluate_file(dist, source, target, chunk_size=CHUNK)
+
+        for name, fn in (('list + cdf', lists), ('evaluate_file', mapped)):
+            elapsed, peak = measure(fn)
+            print('{:>13}: {:.2f} s, peak Python allocations {:.1f} MiB'
+                  .format(name, elapsed, peak / 2**20))
+
+
+if __name__ == "__main__":
+    run()
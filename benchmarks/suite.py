@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import typing as tp
+import numpy as np
+import pystable
+from pystable import utils
+
+
+# (region, alpha, beta): quadrature is hardest near alpha = 1 and alpha = 2
+# and in the heavy tails of small alpha
+REGIONS = (('near1', 1.01, 0.3), ('near2', 1.95, 0.1), ('heavy', 0.6, 0.5))
+# Small batches measure per-call overhead, large ones the integration
+SIZES = (10, 10_000)
+# libstable pthreads per call (0 => all available CPUs)
+THREADS = (1, 0)
+# Samples fitted by each of `pystable.FIT_METHODS`
+FIT_SIZE = 200
+
+# A case is slower than its baseline when the ratio of the best times
+# exceeds 1 + threshold
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_OUTPUT = os.path.join('.benchmarks', 'results.json')
+DEFAULT_BASELINE = os.path.join('.benchmarks', 'baseline.json')
+# Each timing repeat runs the case for at least this long [s]
+MIN_TIME = 0.05
+REPEAT = 5
+
+Case = tp.Tuple[str, tp.Callable[[], tp.Any], tp.Dict[str, tp.Any]]
+
+
+def cases() -> tp.Iterator[Case]:
+    '''(name, function, libstable settings) of every benchmark'''
+    yield 'load', lambda: (pystable.clear_registry(),
+                           pystable.load_libstable()), {}
+    yield 'create', lambda: pystable.free(pystable.create(1.5, 0.5, 1.0,
+                                                          0.0, 1)), {}
+
+    for region, alpha, beta in REGIONS:
+        dist = pystable.create(alpha, beta, 1.0, 0.0, 1)
+        for n in SIZES:
+            x = np.linspace(-10, 10, n)
+            p = np.linspace(0.01, 0.99, n)
+            for threads in THREADS:
+                tag = '[{},n={},threads={}]'.format(region, n, threads)
+                config = {'threads': threads}
+                yield ('pdf' + tag, lambda d=dist, x=x:
+                       pystable.pdf_array(d, x), config)
+                yield ('cdf' + tag, lambda d=dist, x=x:
+                       pystable.cdf_array(d, x), config)
+                yield ('q' + tag, lambda d=dist, p=p:
+                       pystable.q_array(d, p), config)
+            yield ('rnd[{},n={}]'.format(region, n), lambda d=dist, n=n:
+                   pystable.rnd(d, n, seed=1), {})
+
+    data = pystable.rnd(pystable.create(1.5, 0.3, 1.0, 0.0, 1), FIT_SIZE,
+                        seed=1)
+    for method in pystable.FIT_METHODS:
+        yield ('fit[{},n={}]'.format(method, FIT_SIZE), lambda m=method:
+               pystable.fit_array(pystable.create(1.5, 0.3, 1.0, 0.0, 1),
+                                  data, m), {})
+
+
+def measure(fn: tp.Callable[[], tp.Any], repeat: int = REPEAT,
+            min_time: float = MIN_TIME) -> tp.Dict[str, float]:
+    '''
+    Time `fn` as `timeit` does: the number of calls per repeat is
+    calibrated to take at least `min_time`, and the best and median time
+    per call over `repeat` repeats are returned.
+    '''
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed) + 1)
+
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    return {'best': min(times), 'median': statistics.median(times),
+            'number': number, 'repeat': repeat}
+
+
+def run(patterns: tp.Sequence[str] = (), repeat: int = REPEAT,
+        min_time: float = MIN_TIME) -> tp.Dict[str, tp.Any]:
+    '''Run the cases whose names contain any of `patterns` (all if empty)'''
+    results = {}
+    for name, fn, config in cases():
+        if patterns and not any(p in name for p in patterns):
+            continue
+        with pystable.configure(**config):
+            results[name] = measure(fn, repeat, min_time)
+        print('{:<36} {:>10.3e} s'.format(name, results[name]['best']),
+              flush=True)
+    return {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'libstable': utils.libstable_path(),
+        },
+        'results': results,
+    }
+
+
+def compare(current: tp.Dict[str, tp.Any], baseline: tp.Dict[str, tp.Any],
+            threshold: float = DEFAULT_THRESHOLD) -> tp.List[str]:
+    '''
+    Print the ratio of the best times of `current` to `baseline` for every
+    case in both, and return the names of those slower by more than
+    `threshold`.
+    '''
+    regressions = []
+    print('\n{:<36} {:>10} {:>10} {:>7}'.format(
+        'case', 'baseline', 'current', 'ratio'))
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print('{:<36} {:>10} {:>10.3e}'.format(
+                name, 'new', result['best']))
+            continue
+        ratio = result['best'] / base['best']
+        slower = ratio > 1.0 + threshold
+        if slower:
+            regressions.append(name)
+        print('{:<36} {:>10.3e} {:>10.3e} {:>6.2f}x{}'.format(
+            name, base['best'], result['best'], ratio,
+            '  SLOWER' if slower else ''))
+    return regressions
+
+
+def write(path: str, results: tp.Dict[str, tp.Any]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv: tp.Optional[tp.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Time the public entry points of pystable and compare '
+                    'them against a stored baseline.')
+    parser.add_argument('-k', dest='patterns', action='append', default=[],
+                        help='only run cases whose name contains this '
+                             '(repeatable)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help='JSON file for the results (default: '
+                             '%(default)s)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='JSON results to compare against (default: '
+                             '%(default)s)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed relative slowdown (default: '
+                             '%(default)s)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store the results as the new baseline')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--min-time', type=float, default=MIN_TIME)
+    args = parser.parse_args(argv)
+
+    results = run(args.patterns, args.repeat, args.min_time)
+    write(args.output, results)
+    if args.save_baseline:
+        write(args.baseline, results)
+        print('\nbaseline saved to {}'.format(args.baseline))
+        return 0
+    if not os.path.exists(args.baseline):
+        print('\nno baseline at {}, run with --save-baseline to store one'
+              .format(args.baseline))
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print('\n{} case(s) more than {:.0%} slower than the baseline: {}'
+              .format(len(regressions), args.threshold,
+                      ', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
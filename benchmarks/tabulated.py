@@ -0,0 +1,46 @@
+import time
+import numpy as np
+import pystable
+
+
+FIT = {
+    "alpha": 1.4430192097069168,
+    "beta": 0.042938293127910906,
+    "sigma": 0.004747879945834797,
+    "mu": -0.0004197632840157609,
+    "parameterization": 1,
+}
+N = 100000
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    rng = np.random.default_rng(0)
+    x = rng.normal(0, 0.02, N)
+    p = rng.uniform(0, 1, N // 100)
+
+    with pystable.StableDistribution(**FIT) as dist:
+        build = timed(dist.tabulate)
+        table = dist.tabulate()
+        print('table build: {:.3f} s'.format(build))
+        print('declared errors: {}'.format(table.errors))
+
+        print('{:>4} {:>8} {:>12} {:>12} {:>9}'
+              .format('fn', 'points', 'exact [s]', 'table [s]', 'speedup'))
+        for name, exact, approx, arg in [('pdf', dist.pdf, table.pdf, x),
+                                         ('cdf', dist.cdf, table.cdf, x),
+                                         ('ppf', dist.ppf, table.ppf, p)]:
+            t_exact = timed(exact, arg)
+            t_table = timed(approx, arg)
+            print('{:>4} {:>8} {:>12.4f} {:>12.4f} {:>8.0f}x'
+                  .format(name, len(arg), t_exact, t_table,
+                          t_exact / t_table))
+
+
+if __name__ == "__main__":
+    run()
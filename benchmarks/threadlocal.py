@@ -0,0 +1,43 @@
+import threading
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import pystable
+
+
+PARAMS = {"alpha": 1.45, "beta": 0.05, "sigma": 1.0, "mu": 0.0}
+THREADS = 4
+CALLS = 64
+N = 200
+
+
+def run() -> None:
+    x = np.linspace(-10, 10, N)
+    pystable.set_threads(1)  # measure concurrency across Python threads
+
+    with pystable.StableDistribution(*PARAMS.values(), 1) as dist:
+        lock = threading.Lock()
+
+        def locked(_):
+            with lock:
+                return dist.pdf(x)
+
+        with ThreadPoolExecutor(THREADS) as pool:
+            start = time.perf_counter()
+            list(pool.map(locked, range(CALLS)))
+            serialized = time.perf_counter() - start
+
+    with pystable.ThreadLocalDistribution(*PARAMS.values(), 1) as dist:
+        with ThreadPoolExecutor(THREADS) as pool:
+            start = time.perf_counter()
+            list(pool.map(lambda _: dist.pdf(x), range(CALLS)))
+            local = time.perf_counter() - start
+
+    print('{} threads, {} calls of {} points'.format(THREADS, CALLS, N))
+    print('global lock:          {:.3f} s'.format(serialized))
+    print('per-thread clones:    {:.3f} s ({:.1f}x)'
+          .format(local, serialized / local))
+
+
+if __name__ == "__main__":
+    run()
@@ -6,20 +6,28 @@ from distutils.command.build_ext import build_ext
 from distutils.core import setup, Extension
 
 
-libstable_module = Extension('libstable',
-                             libraries=["blas", "gsl", "m", "gslcblas"],
-                             sources=[
-                                "./libstable/stable/src/mcculloch.c",
-                                "./libstable/stable/src/methods.c",
-                                "./libstable/stable/src/stable_cdf.c",
-                                "./libstable/stable/src/stable_common.c",
-                                "./libstable/stable/src/stable_dist.c",
-                                "./libstable/stable/src/stable_fit.c",
-                                "./libstable/stable/src/stable_integration.c",
-                                "./libstable/stable/src/stable_koutrouvelis.c",
-                                "./libstable/stable/src/stable_pdf.c",
-                                "./libstable/stable/src/stable_q.c",
-                                "./libstable/stable/src/stable_rnd.c"])
+LIBRARIES = ["blas", "gsl", "m", "gslcblas"]
+SOURCES = ["./libstable/stable/src/mcculloch.c",
+           "./libstable/stable/src/methods.c",
+           "./libstable/stable/src/stable_cdf.c",
+           "./libstable/stable/src/stable_common.c",
+           "./libstable/stable/src/stable_dist.c",
+           "./libstable/stable/src/stable_fit.c",
+           "./libstable/stable/src/stable_integration.c",
+           "./libstable/stable/src/stable_koutrouvelis.c",
+           "./libstable/stable/src/stable_pdf.c",
+           "./libstable/stable/src/stable_q.c",
+           "./libstable/stable/src/stable_rnd.c",
+           "./libstable/stable/src/stable_vector.c"]
+
+libstable_module = Extension('libstable', libraries=LIBRARIES,
+                             sources=SOURCES)
+
+# CPython binding compiled with the libstable sources, see
+# `pystable/native.py`. Built from source, so it needs no prebuilt library
+native_module = Extension('pystable._native', libraries=LIBRARIES,
+                          include_dirs=["./libstable/stable/src"],
+                          sources=["./pystable/_native.c"] + SOURCES)
 
 
 # SEE: https://github.com/python-poetry/poetry/issues/11
@@ -35,15 +43,21 @@ class ExtensionBuild(build_ext):
                 continue
 
             relative_extension = os.path.relpath(output, self.build_lib)
-            file_extension = pathlib.Path(relative_extension).suffix
-            dest = os.path.join(
-                "./pystable/_extensions",  # TODO: remove hard code
-                ext.name+file_extension
-            )
+            if '.' in ext.name:
+                # Package modules go next to their package, keeping the
+                # ABI tag of their file name
+                dest = os.path.join(".", relative_extension)
+            else:
+                file_extension = pathlib.Path(relative_extension).suffix
+                dest = os.path.join(
+                    "./pystable/_extensions",  # TODO: remove hard code
+                    ext.name+file_extension
+                )
             shutil.copyfile(output, dest)
             mode = os.stat(dest).st_mode
             mode |= (mode & 0o444) >> 2
             os.chmod(dest, mode)
 
 
-setup(ext_modules=[libstable_module], cmdclass=dict(build_ext=ExtensionBuild))
+setup(ext_modules=[libstable_module, native_module],
+      cmdclass=dict(build_ext=ExtensionBuild))
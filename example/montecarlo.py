@@ -24,31 +24,32 @@ def rescale_dist(dist: pystable.STABLE_DIST,
     beta = dist.contents.beta
     sigma = dist.contents.sigma * (rescale) ** (1/alpha)
     mu_1 = dist.contents.mu_1 * rescale
-    return pystable.create(alpha, beta, sigma, mu_1, 1)
+    # Reparameterize in place rather than allocating a new dist
+    pystable.setparams(dist, alpha, beta, sigma, mu_1, 1)
+    return dist
 
 
 def generate_ts(period: float, n: int) -> np.ndarray:
     return np.arange(0, (n+1)*period, period)
 
 
-def generate_rs(dist: pystable.STABLE_DIST, n: int) -> np.ndarray:
-    rs = np.asarray([0] + pystable.rnd(dist, n))  # 0 added for e^0 * p0
+def generate_rs(dist: pystable.STABLE_DIST, n: int,
+                sims: int) -> np.ndarray:
+    rs = np.zeros((sims, n+1))  # 0 added for e^0 * p0
+    rs[:, 1:] = pystable.rnd(dist, size=(sims, n))
     return rs
 
 
 def generate_sims(dist: pystable.STABLE_DIST,
                   period: int, n: int, sims: int, p0: float) -> pd.DataFrame:
-    p_data = []
-    for i in range(sims):
-        rs = generate_rs(dist, n)
-        print(f'rs-{i}', rs)
-        dp = np.cumsum(rs)
-        dp = np.exp(dp)
-        p = P0 * dp
-        p_data.append(p)
+    rs = generate_rs(dist, n, sims)
+    print('rs', rs)
+    dp = np.cumsum(rs, axis=1)
+    dp = np.exp(dp)
+    p_data = P0 * dp
 
     ts = generate_ts(period, n)
-    print(f'ts-{i}', ts)
+    print('ts', ts)
     df = pd.DataFrame(data=[ts, *p_data]).T
 
     columns = ['timestamp'] + [f"sim-{i}" for i in range(sims)]
@@ -318,6 +318,14 @@ void   stable_q(StableDist *dist, const double* q, const unsigned int Nq,
   evaluation is observed.
 */
 
+/* Vectorial PDF and CDF. Points are interpolated from integrals tabulated
+   once per call, and evaluated by the point methods where the estimated
+   error of the tables exceeds relTOL. */
+void   stable_pdf_v(StableDist *dist, const double* x, const unsigned int Nx,
+                    double *pdf, double *err);
+void   stable_cdf_v(StableDist *dist, const double* x, const unsigned int Nx,
+                    double *cdf, double *err);
+
 /* Stable distribution structure for vectorial methods*/
 
 typedef struct
@@ -0,0 +1,503 @@
+/* stable/stable_vector.c
+ *
+ * Vectorial (non-parallelized) evaluation of the PDF and CDF of an
+ * alpha-stable distribution at many points.
+ *
+ * Expresions presented in [1] are employed. For a given distribution
+ * the integrands of every point share the same function V(theta) and
+ * differ only by the additive constant xxipow:
+ *
+ *   pdf ~ int h(V(theta)+xxipow) dtheta,  h(u) = exp(u)*exp(-exp(u))
+ *   cdf ~ int H(V(theta)+xxipow) dtheta,  H(u) = exp(-exp(u))
+ *
+ * V is monotone, so changing the variable to s = V(theta) gives
+ *
+ *   P(L) = int h(s+L) rho(s) ds,  C(L) = int H(s+L) rho(s) ds,
+ *
+ * with rho = dtheta/ds. rho is evaluated once on an evenly spaced grid
+ * of s, P and C (and their derivatives) are tabulated by trapezoidal sums
+ * on a grid of L with the same spacing, and every point is interpolated
+ * from the tables. The error of each tabulated value is estimated by the
+ * sum with twice the spacing. Points whose error estimate exceeds relTOL,
+ * points in the far tails (where the tabulated integrals underflow), and
+ * points near xi are evaluated by the point methods instead.
+ *
+ * [1] Nolan, J. P. Numerical Calculation of Stable Densities and
+ *     Distribution Functions Stochastic Models, 1997, 13, 759-774
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; version 3 of the License.
+ *
+ * This program is distributed in the hope that it will be useful, but
+ * WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program; If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "stable.h"
+
+#include <stdlib.h>
+#include <math.h>
+#include <float.h>
+
+#define VEC_DS    0.05     /* Spacing of the s and xxipow grids */
+#define VEC_U_LO  -60.0    /* h(u) < exp(VEC_U_LO) and H(u) = 1 below */
+#define VEC_U_HI  6.6      /* h(u), H(u) < 1e-310 above */
+#define VEC_C_MIN 1e-280   /* Smallest tabulated cdf integral used */
+#define VEC_MAX_NODES 200000  /* Larger tables fall back to point methods */
+#define VEC_MAXITER 100    /* Iterations of the inversion of V */
+#define VEC_V_TOL 1e-12    /* Relative tolerance of the inversion of V */
+#define VEC_THETA_TOL 1e-13  /* Absolute tolerance in theta */
+
+/* Tabulated integrals of one side of xi (or of the whole real line when
+   alpha == 1) */
+typedef struct
+  {
+    double L0;       /* first tabulated xxipow */
+    int J;           /* number of tabulated values */
+    double *P, *dP, *Perr;
+    double *C, *Cerr;
+  }
+StableVTable;
+
+/* V(theta), as in stable_g_aux1 and stable_g_aux2 with xxipow = 0 */
+static double
+stable_vector_V(StableDist *dist, double theta)
+{
+  double aux, cos_theta;
+
+  cos_theta = cos(theta);
+  if (dist->alphainvalpha1 == 0.0)
+    {
+      aux = (dist->beta_*theta+M_PI_2)/cos_theta;
+      return sin(theta)*aux/dist->beta_ + log(aux) + dist->k1;
+    }
+  aux = (dist->theta0_+theta)*dist->alpha;
+  return log(cos_theta/sin(aux))*dist->alphainvalpha1 +
+         log(cos(aux-theta)/cos_theta) + dist->k1;
+}
+
+/* dV/dtheta */
+static double
+stable_vector_dV(StableDist *dist, double theta)
+{
+  double aux, daux, cos_theta, sin_theta;
+
+  cos_theta = cos(theta);
+  sin_theta = sin(theta);
+  if (dist->alphainvalpha1 == 0.0)
+    {
+      aux = (dist->beta_*theta+M_PI_2)/cos_theta;
+      daux = (dist->beta_+aux*sin_theta)/cos_theta;
+      return (cos_theta*aux+sin_theta*daux)/dist->beta_ + daux/aux;
+    }
+  aux = (dist->theta0_+theta)*dist->alpha;
+  return -dist->alphainvalpha1*(sin_theta/cos_theta +
+                                dist->alpha*cos(aux)/sin(aux)) -
+         (dist->alpha-1.0)*tan(aux-theta) + sin_theta/cos_theta;
+}
+
+/* theta in [lo, hi] such that V(theta) = s, with V(lo) <= s <= V(hi)
+   when dir = 1 and V(lo) >= s >= V(hi) when dir = -1. Newton's method
+   safeguarded by bisection, starting from guess. */
+static double
+stable_vector_theta(StableDist *dist, double s, double lo, double hi,
+                    double guess, int dir)
+{
+  double theta = guess, f, df, step;
+  int k;
+
+  for (k = 0; k < VEC_MAXITER; k++)
+    {
+      f = dir*(stable_vector_V(dist, theta)-s);
+      if (fabs(f) <= VEC_V_TOL*(1.0+fabs(s))) break;
+      if (f < 0.0) lo = theta;
+      else hi = theta;
+
+      df = dir*stable_vector_dV(dist, theta);
+      step = theta - f/df;
+      if (!(step > lo && step < hi)) step = 0.5*(lo+hi);
+      if (fabs(step-theta) <= VEC_THETA_TOL)
+        {
+          theta = step;
+          break;
+        }
+      theta = step;
+    }
+  return theta;
+}
+
+static void
+stable_vector_free(StableVTable *t)
+{
+  free(t->P);
+  t->P = NULL;
+}
+
+/* Gregory correction of the trapezoidal rule at its first node kmin
+   (H*rho is not negligible there), from forward differences of H*rho on
+   the nodes kmin, kmin+stride, ..., kmin+4*stride. In units of the
+   step. */
+static double
+stable_vector_gregory(const double *H, const double *rho, int kmin, int j,
+                      int stride)
+{
+  double f[5];
+  int i, n;
+
+  for (i = 0; i < 5; i++)
+    f[i] = H[kmin+i*stride+j]*rho[kmin+i*stride];
+  /* f[n] <- n-th forward difference at kmin */
+  for (n = 1; n < 5; n++)
+    for (i = 4; i >= n; i--)
+      f[i] -= f[i-1];
+
+  return -f[1]/12.0 - f[2]/24.0 - 19.0*f[3]/720.0 - 3.0*f[4]/160.0;
+}
+
+/* Tabulate P, P' and C for xxipow in [Lmin, Lmax]. dist->theta0_ and
+   dist->beta_ must be set for the side. Returns 0 on success. */
+static int
+stable_vector_table(StableDist *dist, double Lmin, double Lmax,
+                    StableVTable *t)
+{
+  double theta_a, theta_b, Va, Vb, s_lo, s_hi, LJ, u, eu, delta;
+  double *theta, *rho, *h, *dh, *H;
+  double P, dP, C, P2, C2, meas;
+  int dir, M, J, m_lo, m_hi, m, j, k, kmin, kmax;
+
+  t->P = NULL;
+  theta_a = -dist->theta0_ + THETA_TH;
+  theta_b = M_PI_2 - THETA_TH;
+  if (!(theta_b > theta_a)) return -1;
+
+  J = (int)floor((Lmax-Lmin)/VEC_DS) + 4;
+  t->L0 = Lmin - VEC_DS;
+  t->J = J;
+  LJ = t->L0 + (J-1)*VEC_DS;
+
+  Va = stable_vector_V(dist, theta_a);
+  Vb = stable_vector_V(dist, theta_b);
+  if (!isfinite(Va) || !isfinite(Vb) || Va == Vb) return -1;
+  dir = Vb > Va ? 1 : -1;
+
+  /* Only s with s+xxipow inside [VEC_U_LO, VEC_U_HI] for some tabulated
+     xxipow contribute */
+  s_lo = fmax(fmin(Va, Vb), VEC_U_LO - LJ);
+  s_hi = fmin(fmax(Va, Vb), VEC_U_HI - t->L0);
+  if (!(s_hi > s_lo)) return -1;
+
+  /* With |beta| = 1, V has a finite limit at one end of the interval,
+     where rho is singular. The tables are not used if that end is inside
+     the range of s. */
+  delta = 1e-3*(theta_b-theta_a);
+  if ((fabs(stable_vector_V(dist, theta_a+delta)-Va) < 1.0 &&
+       Va >= s_lo && Va <= s_hi) ||
+      (fabs(stable_vector_V(dist, theta_b-delta)-Vb) < 1.0 &&
+       Vb >= s_lo && Vb <= s_hi))
+    return -1;
+  if ((s_hi-s_lo)/VEC_DS + J > VEC_MAX_NODES) return -1;
+  M = (int)floor((s_hi-s_lo)/VEC_DS) + 1;
+
+  t->P = (double*)malloc((5*J + 2*M + 3*(M+J))*sizeof(double));
+  if (t->P == NULL) return -1;
+  t->dP = t->P + J;
+  t->Perr = t->dP + J;
+  t->C = t->Perr + J;
+  t->Cerr = t->C + J;
+  theta = t->Cerr + J;
+  rho = theta + M;
+  h = rho + M;
+  dh = h + M + J;
+  H = dh + M + J;
+
+  /* Nodes theta_k = V^-1(s_k) and rho_k = 1/|V'(theta_k)| */
+  for (k = 0; k < M; k++)
+    {
+      u = s_lo + k*VEC_DS;
+      if (k == 0)
+        {
+          if (u == fmin(Va, Vb)) theta[k] = dir > 0 ? theta_a : theta_b;
+          else theta[k] = stable_vector_theta(dist, u, theta_a, theta_b,
+                                              0.5*(theta_a+theta_b), dir);
+        }
+      /* Start from the tangent at the previous node */
+      else if (dir > 0)
+        theta[k] = stable_vector_theta(dist, u, theta[k-1], theta_b,
+                                       fmin(theta[k-1]+rho[k-1]*VEC_DS,
+                                            0.5*(theta[k-1]+theta_b)), 1);
+      else
+        theta[k] = stable_vector_theta(dist, u, theta_a, theta[k-1],
+                                       fmax(theta[k-1]-rho[k-1]*VEC_DS,
+                                            0.5*(theta[k-1]+theta_a)), -1);
+
+      rho[k] = 1.0/fabs(stable_vector_dV(dist, theta[k]));
+      if (!isfinite(rho[k])) rho[k] = 0.0;
+    }
+
+  /* h, h' and H at u_m = s_lo + L0 + m*VEC_DS, inside the window only */
+  m_lo = (int)ceil((VEC_U_LO - s_lo - t->L0)/VEC_DS);
+  m_hi = (int)floor((VEC_U_HI - s_lo - t->L0)/VEC_DS);
+  for (m = 0; m < M+J-1; m++)
+    {
+      if (m < m_lo || m > m_hi)
+        {
+          h[m] = dh[m] = H[m] = 0.0;
+          continue;
+        }
+      eu = exp(s_lo + t->L0 + m*VEC_DS);
+      H[m] = exp(-eu);
+      h[m] = eu*H[m];
+      dh[m] = h[m]*(1.0-eu);
+    }
+
+  for (j = 0; j < J; j++)
+    {
+      kmin = m_lo - j > 0 ? m_lo - j : 0;
+      kmax = m_hi - j < M-1 ? m_hi - j : M-1;
+      if (kmin > kmax)
+        {
+          /* Every node is above the window (C = 0) or below it (C is the
+             whole interval) */
+          t->P[j] = t->dP[j] = t->Perr[j] = t->Cerr[j] = 0.0;
+          t->C[j] = kmin > M-1 ? theta_b - theta_a : 0.0;
+          continue;
+        }
+
+      /* Below the window H = 1: its integral is the measure of
+         {theta : V(theta) < s_kmin} */
+      meas = dir > 0 ? theta[kmin] - theta_a : theta_b - theta[kmin];
+      P = dP = C = P2 = C2 = 0.0;
+      for (k = kmin; k <= kmax; k++)
+        {
+          P += h[k+j]*rho[k];
+          dP += dh[k+j]*rho[k];
+          C += H[k+j]*rho[k];
+          if (((k-kmin) & 1) == 0)
+            {
+              P2 += h[k+j]*rho[k];
+              C2 += H[k+j]*rho[k];
+            }
+        }
+      C -= 0.5*H[kmin+j]*rho[kmin];
+      C2 -= 0.5*H[kmin+j]*rho[kmin];
+      if (kmax-kmin >= 8)
+        {
+          C += stable_vector_gregory(H, rho, kmin, j, 1);
+          C2 += stable_vector_gregory(H, rho, kmin, j, 2);
+        }
+
+      t->P[j] = VEC_DS*P;
+      t->dP[j] = VEC_DS*dP;
+      t->C[j] = meas + VEC_DS*C;
+      t->Perr[j] = fabs(t->P[j] - 2*VEC_DS*P2);
+      t->Cerr[j] = fabs(t->C[j] - meas - 2*VEC_DS*C2);
+    }
+
+  return 0;
+}
+
+/* Cubic Hermite interpolation of log(f) at xxipow = L, from the values
+   of f on the table and its derivatives sign*df. Returns the smaller of
+   the two tabulated values used (stored from index *j), or a negative
+   value if L is outside the table or f is not positive there. */
+static double
+stable_vector_interp(const StableVTable *t, const double *f,
+                     const double *df, double sign, double L, double *logf,
+                     int *j)
+{
+  double pos, s, s2, s3, f0, f1;
+
+  pos = (L - t->L0)/VEC_DS;
+  *j = (int)floor(pos);
+  if (*j < 0 || *j > t->J-2) return -1.0;
+  f0 = f[*j];
+  f1 = f[*j+1];
+  if (!(f0 > 0.0 && f1 > 0.0)) return -1.0;
+
+  s = pos - *j;
+  s2 = s*s;
+  s3 = s2*s;
+  *logf = (2*s3-3*s2+1)*log(f0) + (s3-2*s2+s)*VEC_DS*sign*df[*j]/f0 +
+          (3*s2-2*s3)*log(f1) + (s3-s2)*VEC_DS*sign*df[*j+1]/f1;
+  return fmin(f0, f1);
+}
+
+static void
+stable_vector_eval(StableDist *dist, const double *x, const unsigned int Nx,
+                   double *out, double *err, int cdf)
+{
+  double (*point)(StableDist*, const double, double*);
+  double *L, x_, xxi, Lmin, Lmax, fmin_, logf, e, value, I;
+  signed char *side;
+  StableVTable t;
+  int alpha1, sd, n, j;
+  unsigned int i;
+
+  point = cdf ? dist->stable_cdf_point : dist->stable_pdf_point;
+
+  alpha1 = dist->ZONE == ALPHA_1 || dist->ZONE == ALPHA_1_B1;
+  L = NULL;
+  side = NULL;
+  if (alpha1 || dist->ZONE == STABLE || dist->ZONE == STABLE_B1)
+    {
+      L = (double*)malloc(Nx*sizeof(double));
+      side = (signed char*)malloc(Nx*sizeof(signed char));
+    }
+  if (L == NULL || side == NULL)
+    {
+      /* Closed forms and other zones are evaluated point by point */
+      for (i = 0; i < Nx; i++)
+        out[i] = (*point)(dist, x[i], err+i);
+      free(L);
+      free(side);
+      return;
+    }
+
+  /* Side of xi (+1, -1) and xxipow of each point; 0 marks the points
+     evaluated by the point methods */
+  for (i = 0; i < Nx; i++)
+    {
+      side[i] = 0;
+      if (!isfinite(x[i])) continue;
+      x_ = (x[i]-dist->mu_0)/dist->sigma;
+      if (alpha1)
+        {
+          if (dist->beta < 0.0) x_ = -x_;
+          L[i] = -M_PI*x_*0.5/fabs(dist->beta);
+          side[i] = 1;
+          continue;
+        }
+      xxi = x_-dist->xi;
+      if (fabs(xxi) <= XXI_TH) continue;
+      L[i] = dist->alphainvalpha1*log(fabs(xxi));
+      side[i] = xxi > 0 ? 1 : -1;
+    }
+
+  for (sd = 1; sd >= -1; sd -= 2)
+    {
+      n = 0;
+      Lmin = HUGE_VAL;
+      Lmax = -HUGE_VAL;
+      for (i = 0; i < Nx; i++)
+        {
+          if (side[i] != sd) continue;
+          n++;
+          Lmin = fmin(Lmin, L[i]);
+          Lmax = fmax(Lmax, L[i]);
+        }
+      if (n == 0) continue;
+
+      if (alpha1)
+        {
+          dist->theta0_ = dist->theta0;
+          dist->beta_ = fabs(dist->beta);
+        }
+      else
+        {
+          dist->theta0_ = sd*dist->theta0;
+          dist->beta_ = sd*dist->beta;
+        }
+      dist->xxipow = 0.0;
+      t.P = NULL;
+
+      /* Empty integration interval (beta = +-1 and alpha < 1) */
+      if (fabs(dist->theta0_+M_PI_2) < 2*THETA_TH ||
+          stable_vector_table(dist, Lmin, Lmax, &t) != 0)
+        {
+          stable_vector_free(&t);
+          for (i = 0; i < Nx; i++)
+            if (side[i] == sd) side[i] = 0;
+          continue;
+        }
+
+      for (i = 0; i < Nx; i++)
+        {
+          if (side[i] != sd) continue;
+          if (!cdf)
+            {
+              fmin_ = stable_vector_interp(&t, t.P, t.dP, 1.0, L[i], &logf,
+                                           &j);
+              if (fmin_ <= 0.0) { side[i] = 0; continue; }
+              /* Truncation below VEC_U_LO adds at most pi*exp(VEC_U_LO) */
+              e = fmax(t.Perr[j], t.Perr[j+1]) + M_PI*exp(VEC_U_LO);
+              if (e > relTOL*fmin_) { side[i] = 0; continue; }
+
+              value = exp(logf);
+              if (alpha1)
+                {
+                  out[i] = dist->c2_part*value/dist->sigma;
+                  err[i] = dist->c2_part*e/dist->sigma;
+                }
+              else
+                {
+                  xxi = fabs((x[i]-dist->mu_0)/dist->sigma-dist->xi);
+                  out[i] = dist->c2_part/xxi*value/dist->sigma;
+                  err[i] = dist->c2_part/xxi*e/dist->sigma;
+                }
+              continue;
+            }
+
+          /* dC/dxxipow = -P */
+          fmin_ = stable_vector_interp(&t, t.C, t.P, -1.0, L[i], &logf, &j);
+          if (fmin_ <= VEC_C_MIN) { side[i] = 0; continue; }
+          e = fmax(t.Cerr[j], t.Cerr[j+1]);
+          if (e > relTOL*fmin_) { side[i] = 0; continue; }
+
+          I = exp(logf);
+          if (alpha1)
+            value = dist->beta > 0 ? dist->c3*I : 1.0 - dist->c3*I;
+          else if (sd > 0)
+            value = dist->c1 + dist->c3*I;
+          else if (dist->alpha > 1.0)
+            value = -dist->c3*I;
+          else
+            value = 0.5 - (dist->theta0 + I)*M_1_PI;
+
+          /* The error is also relative to the smaller tail, where the
+             formulas above cancel */
+          e *= fabs(dist->c3);
+          if (e > relTOL*fmax(fmin(value, 1.0-value), DBL_EPSILON))
+            { side[i] = 0; continue; }
+          out[i] = value;
+          err[i] = e;
+        }
+      stable_vector_free(&t);
+    }
+
+  for (i = 0; i < Nx; i++)
+    if (side[i] == 0)
+      out[i] = (*point)(dist, x[i], err+i);
+
+  free(L);
+  free(side);
+}
+
+/******************************************************************************/
+/*   Vectorial PDF and CDF                                                    */
+/******************************************************************************/
+
+void
+stable_pdf_v(StableDist *dist, const double *x, const unsigned int Nx,
+             double *pdf, double *err)
+{
+  double *err_ = err;
+
+  if (err == NULL) err_ = (double*)malloc(Nx*sizeof(double));
+  stable_vector_eval(dist, x, Nx, pdf, err_, 0);
+  if (err == NULL) free(err_);
+}
+
+void
+stable_cdf_v(StableDist *dist, const double *x, const unsigned int Nx,
+             double *cdf, double *err)
+{
+  double *err_ = err;
+
+  if (err == NULL) err_ = (double*)malloc(Nx*sizeof(double));
+  stable_vector_eval(dist, x, Nx, cdf, err_, 1);
+  if (err == NULL) free(err_);
+}
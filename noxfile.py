@@ -4,7 +4,7 @@ import nox
 @nox.session(python=['3.9'])
 def tests(session):
     session.install('poetry')
-    session.run('poetry', 'install')
+    session.run('poetry', 'install', '-E', 'qmc')
     session.run('coverage', 'run', '-m', 'pytest')
     session.run('coverage', 'report')
 
@@ -14,3 +14,11 @@ def lint(session):
     session.install('poetry')
     session.run('poetry', 'install')
     session.run('flake8', 'pystable', 'tests')
+
+
+@nox.session(python=['3.9'])
+def benchmarks(session):
+    # Arguments are passed on, e.g. `nox -s benchmarks -- --save-baseline`
+    session.install('poetry')
+    session.run('poetry', 'install')
+    session.run('python', 'benchmarks/suite.py', *session.posargs)
@@ -1 +1,27 @@
 from .pystable import *  # NOQA: F403, F401
+from .arrays import *  # NOQA: F403, F401
+from .parallel import *  # NOQA: F403, F401
+from .config import *  # NOQA: F403, F401
+from .stable_dist import Zone  # NOQA: F401
+from .distribution import StableDistribution  # NOQA: F401
+from .tabulated import (MAX_ERRORS, MAX_QUANTILE_ERRORS,  # NOQA: F401
+                        QuantileTable, StableTable, TabulatedDistribution,
+                        tabulate)
+from .cache import (CachedDistribution, CacheStats,  # NOQA: F401
+                    DistributionCache, DEFAULT_CACHE, create_cached,
+                    tabulate_cached)
+from .batch import (cdf_batch, cdf_grid, mu_0_of, pdf_batch,  # NOQA: F401
+                    pdf_grid, stable_cdf_grid, stable_pdf_grid)
+from .fitting import (FitPreset, FitResult, PRESETS, fit_iter,  # NOQA: F401
+                      fit_many, resolve_method)
+from .rolling import (RollingFit, RollingFitResult, SortedWindow,  # NOQA
+                      rolling_fit)
+from .likelihood import LogLikelihood, loglikelihood  # NOQA: F401
+from .binned import (BinnedFitResult, compress, fit_binned,  # NOQA: F401
+                     histogram_bins, quantile_bins, stratified_subsample)
+from .quantile import q_sorted, stable_q_sorted  # NOQA: F401
+from .sampling import UNIFORM_METHODS, rnd_table, uniforms  # NOQA: F401
+from . import aio, metrics  # NOQA: F401
+from .threadlocal import ThreadLocalDistribution  # NOQA: F401
+from .streaming import (evaluate_file, iter_chunks, open_input,  # NOQA: F401
+                        open_output, stream)
@@ -0,0 +1,247 @@
+/* pystable/_native.c
+ *
+ * CPython binding of libstable's array functions. The extension is
+ * compiled together with the libstable sources (see `build.py`), so the
+ * shared object also exports libstable's C API and is loaded by ctypes
+ * as the library itself: distributions created and configured through
+ * ctypes are the ones evaluated here.
+ *
+ * Every function takes the address of a StableDist and C-contiguous
+ * float64 buffers (NumPy arrays, memoryviews, array.array('d')), and
+ * releases the GIL while libstable runs.
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; version 3 of the License.
+ *
+ * This program is distributed in the hope that it will be useful, but
+ * WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program; If not, see <http://www.gnu.org/licenses/>.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <limits.h>
+#include <string.h>
+#include "stable.h"
+
+typedef void (*array_function)(StableDist *, const double *,
+                               const unsigned int, double *, double *);
+typedef int (*fit_function)(StableDist *, const double *,
+                            const unsigned int);
+
+/* Get a C-contiguous float64 buffer of `obj`, optionally writable and of
+ * length n (n < 0: any length). Returns 0 on success. */
+static int
+get_doubles(PyObject *obj, Py_buffer *view, int writable, Py_ssize_t n,
+            const char *name)
+{
+  int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+  const char *format;
+  Py_ssize_t len;
+
+  if (writable)
+    flags |= PyBUF_WRITABLE;
+  if (PyObject_GetBuffer(obj, view, flags) < 0)
+    return -1;
+
+  /* Native doubles: "d", "@d" or "=d" */
+  format = view->format;
+  if (format != NULL && (format[0] == '@' || format[0] == '='))
+    format++;
+  if (view->itemsize != sizeof(double) || format == NULL ||
+      strcmp(format, "d") != 0)
+    {
+      PyErr_Format(PyExc_TypeError, "`%s` must be a float64 buffer", name);
+      PyBuffer_Release(view);
+      return -1;
+    }
+
+  len = view->len / (Py_ssize_t)sizeof(double);
+  if (n >= 0 && len != n)
+    {
+      PyErr_Format(PyExc_ValueError, "`%s` must have length %zd, got %zd",
+                   name, n, len);
+      PyBuffer_Release(view);
+      return -1;
+    }
+  if ((size_t)len > UINT_MAX)
+    {
+      PyErr_Format(PyExc_OverflowError, "`%s` is too long for libstable",
+                   name);
+      PyBuffer_Release(view);
+      return -1;
+    }
+  return 0;
+}
+
+static StableDist *
+get_dist(PyObject *address)
+{
+  StableDist *dist = (StableDist *)PyLong_AsVoidPtr(address);
+
+  if (dist == NULL && !PyErr_Occurred())
+    PyErr_SetString(PyExc_ValueError, "NULL StableDist");
+  return dist;
+}
+
+/* f(dist, x, out, err=None) for the stable_pdf/cdf/q signature */
+static PyObject *
+call_array(array_function f, PyObject *args)
+{
+  PyObject *address, *x_obj, *out_obj, *err_obj = Py_None;
+  Py_buffer x, out, err;
+  StableDist *dist;
+  unsigned int n;
+
+  if (!PyArg_ParseTuple(args, "OOO|O", &address, &x_obj, &out_obj,
+                        &err_obj))
+    return NULL;
+  if ((dist = get_dist(address)) == NULL)
+    return NULL;
+  if (get_doubles(x_obj, &x, 0, -1, "x") < 0)
+    return NULL;
+  n = (unsigned int)(x.len / (Py_ssize_t)sizeof(double));
+  if (get_doubles(out_obj, &out, 1, n, "out") < 0)
+    {
+      PyBuffer_Release(&x);
+      return NULL;
+    }
+  if (err_obj != Py_None && get_doubles(err_obj, &err, 1, n, "err") < 0)
+    {
+      PyBuffer_Release(&x);
+      PyBuffer_Release(&out);
+      return NULL;
+    }
+
+  if (n > 0)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      f(dist, (const double *)x.buf, n, (double *)out.buf,
+        err_obj != Py_None ? (double *)err.buf : NULL);
+      Py_END_ALLOW_THREADS
+    }
+
+  PyBuffer_Release(&x);
+  PyBuffer_Release(&out);
+  if (err_obj != Py_None)
+    PyBuffer_Release(&err);
+  Py_RETURN_NONE;
+}
+
+/* f(dist, data) -> status for the stable_fit_* signature */
+static PyObject *
+call_fit(fit_function f, PyObject *args)
+{
+  PyObject *address, *data_obj;
+  Py_buffer data;
+  StableDist *dist;
+  int status;
+
+  if (!PyArg_ParseTuple(args, "OO", &address, &data_obj))
+    return NULL;
+  if ((dist = get_dist(address)) == NULL)
+    return NULL;
+  if (get_doubles(data_obj, &data, 0, -1, "data") < 0)
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  status = f(dist, (const double *)data.buf,
+             (unsigned int)(data.len / (Py_ssize_t)sizeof(double)));
+  Py_END_ALLOW_THREADS
+
+  PyBuffer_Release(&data);
+  return PyLong_FromLong(status);
+}
+
+static PyObject *
+native_rnd(PyObject *self, PyObject *args)
+{
+  PyObject *address, *out_obj;
+  Py_buffer out;
+  StableDist *dist;
+  unsigned int n;
+
+  if (!PyArg_ParseTuple(args, "OO", &address, &out_obj))
+    return NULL;
+  if ((dist = get_dist(address)) == NULL)
+    return NULL;
+  if (get_doubles(out_obj, &out, 1, -1, "out") < 0)
+    return NULL;
+
+  n = (unsigned int)(out.len / (Py_ssize_t)sizeof(double));
+  if (n > 0)
+    {
+      Py_BEGIN_ALLOW_THREADS
+      stable_rnd(dist, (double *)out.buf, n);
+      Py_END_ALLOW_THREADS
+    }
+
+  PyBuffer_Release(&out);
+  Py_RETURN_NONE;
+}
+
+#define ARRAY_FUNCTION(name)                                  \
+  static PyObject *                                           \
+  native_##name(PyObject *self, PyObject *args)               \
+  {                                                           \
+    return call_array(name, args);                            \
+  }
+
+#define FIT_FUNCTION(name)                                    \
+  static PyObject *                                           \
+  native_##name(PyObject *self, PyObject *args)               \
+  {                                                           \
+    return call_fit(name, args);                              \
+  }
+
+ARRAY_FUNCTION(stable_pdf)
+ARRAY_FUNCTION(stable_cdf)
+ARRAY_FUNCTION(stable_q)
+ARRAY_FUNCTION(stable_pdf_v)
+ARRAY_FUNCTION(stable_cdf_v)
+FIT_FUNCTION(stable_fit)
+FIT_FUNCTION(stable_fit_koutrouvelis)
+FIT_FUNCTION(stable_fit_mle)
+
+#define ARRAY_DOC(name) \
+  #name "(dist, x, out, err=None)\n--\n\n`" #name \
+  "` of the float64 buffer x into out (and err)."
+#define FIT_DOC(name) \
+  #name "(dist, data)\n--\n\n`" #name "` of dist to data. Returns its status."
+
+static PyMethodDef native_methods[] = {
+  {"stable_pdf", native_stable_pdf, METH_VARARGS, ARRAY_DOC(stable_pdf)},
+  {"stable_cdf", native_stable_cdf, METH_VARARGS, ARRAY_DOC(stable_cdf)},
+  {"stable_q", native_stable_q, METH_VARARGS, ARRAY_DOC(stable_q)},
+  {"stable_pdf_v", native_stable_pdf_v, METH_VARARGS,
+   ARRAY_DOC(stable_pdf_v)},
+  {"stable_cdf_v", native_stable_cdf_v, METH_VARARGS,
+   ARRAY_DOC(stable_cdf_v)},
+  {"stable_rnd", native_rnd, METH_VARARGS,
+   "stable_rnd(dist, out)\n--\n\nFill the float64 buffer out with samples."},
+  {"stable_fit", native_stable_fit, METH_VARARGS, FIT_DOC(stable_fit)},
+  {"stable_fit_koutrouvelis", native_stable_fit_koutrouvelis, METH_VARARGS,
+   FIT_DOC(stable_fit_koutrouvelis)},
+  {"stable_fit_mle", native_stable_fit_mle, METH_VARARGS,
+   FIT_DOC(stable_fit_mle)},
+  {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef native_module = {
+  PyModuleDef_HEAD_INIT,
+  "_native",
+  "CPython binding of libstable, see `pystable.native`",
+  -1,
+  native_methods,
+  NULL, NULL, NULL, NULL
+};
+
+PyMODINIT_FUNC
+PyInit__native(void)
+{
+  return PyModule_Create(&native_module);
+}
@@ -0,0 +1,316 @@
+import asyncio
+import ctypes as ct
+import os
+import threading
+import typing as tp
+import weakref
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from pystable.pystable import (load_libstable, c_stable_cdf, c_stable_pdf,
+                               c_stable_q, stable_rnd, stable_rnd_seed)
+from pystable.arrays import (ArrayResult, DEFAULT_METHOD, _evaluate,
+                             stable_fit_array)
+from pystable.config import _GATE, _RegimeGate, aux_regime
+from pystable.distribution import StableDistribution
+from pystable.stable_dist import STABLE_DIST
+from pystable import utils
+from pystable.utils import ArrayLike
+
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+# Points per C call in `apdf`/`acdf`/`aq`; cancellation takes effect
+# between chunks
+DEFAULT_CHUNK_SIZE = 1 << 14
+
+Distribution = tp.Union[STABLE_DIST, StableDistribution]
+_C_FUNCTIONS = {'pdf': c_stable_pdf, 'cdf': c_stable_cdf, 'q': c_stable_q}
+
+# Locks by struct address, dropped once no caller holds them so that the
+# table does not grow with every distribution ever used (a freed address
+# reused by a new struct then gets a fresh lock)
+_LOCKS: tp.MutableMapping[int, threading.Lock] = \
+    weakref.WeakValueDictionary()
+_LOCKS_LOCK = threading.Lock()
+
+
+def dist_lock(dist: Distribution) -> threading.Lock:
+    '''
+    Lock serializing calls on one `StableDist`, whose integration workspace
+    and random number generator are not thread safe. Synchronous code
+    sharing a distribution with `pystable.aio` should hold it as well.
+    '''
+    if isinstance(dist, StableDistribution):
+        dist = dist.dist
+    key = ct.addressof(dist.contents)
+    with _LOCKS_LOCK:
+        lock = _LOCKS.get(key)
+        if lock is None:
+            lock = _LOCKS[key] = threading.Lock()
+        return lock
+
+
+def _gated(lib: ct.CDLL, dist: STABLE_DIST, exclusive: bool,
+           fn: tp.Callable[..., tp.Any], *args) -> tp.Any:
+    '''`fn(*args)` within `_GATE`, called with the lock of `dist` held'''
+    d = dist.contents
+    regime = (_RegimeGate.EXCLUSIVE if exclusive
+              else aux_regime(d.ZONE, d.alpha, d.beta))
+    with _GATE.hold(lib, regime):
+        return fn(*args)
+
+
+class AsyncExecutor:
+    '''
+    Bounded thread pool running libstable calls off the event loop. ctypes
+    releases the GIL during foreign calls, so calls on different
+    distributions overlap.
+
+    libstable keeps integration constants in process-wide globals that
+    differ between alpha < 1 and alpha > 1, so the coroutines of this
+    module only overlap calls on the same side of alpha = 1 and run fits
+    alone, sharing this gate with `fit_many` on threads. Other synchronous
+    code reparameterizing or evaluating distributions concurrently with
+    them may still interfere.
+
+    At most `max_pending` calls are queued or running; further callers wait
+    (without blocking the loop) until a slot frees up. A call cancelled
+    before it starts never runs; a running call stops at the next chunk
+    boundary where it has one, and its result is discarded.
+
+    Parameters:
+      workers     [int]: number of threads
+      max_pending [int]: bound on queued and running calls, default
+                         4 * workers
+    '''
+
+    def __init__(self, workers: int = DEFAULT_WORKERS,
+                 max_pending: tp.Optional[int] = None):
+        if workers < 1:
+            raise ValueError('`workers` must be positive')
+        self.workers = workers
+        self.max_pending = 4 * workers if max_pending is None else max_pending
+        if self.max_pending < 1:
+            raise ValueError('`max_pending` must be positive')
+        self._pool = ThreadPoolExecutor(workers, 'pystable-aio')
+        self._semaphores: tp.MutableMapping[
+            asyncio.AbstractEventLoop, asyncio.Semaphore] = \
+            weakref.WeakKeyDictionary()
+        self._pending = 0
+
+    async def __aenter__(self) -> 'AsyncExecutor':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.shutdown()
+
+    @property
+    def pending(self) -> int:
+        '''Calls currently queued or running'''
+        return self._pending
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait, cancel_futures=True)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = \
+                asyncio.Semaphore(self.max_pending)
+        return semaphore
+
+    async def run(self, fn: tp.Callable[..., tp.Any], *args,
+                  lock: tp.Optional[threading.Lock] = None) -> tp.Any:
+        '''
+        Run `fn(*args, cancelled)` in the pool, holding `lock` if given.
+        `cancelled` is a `threading.Event` set when the awaiting task is
+        cancelled, for `fn` to poll.
+        '''
+        cancelled = threading.Event()
+
+        def call():
+            if cancelled.is_set():
+                return None
+            if lock is None:
+                return fn(*args, cancelled)
+            with lock:
+                if cancelled.is_set():
+                    return None
+                return fn(*args, cancelled)
+
+        # The slot is released when the call has finished in its thread,
+        # not when the awaiting task is cancelled, so cancelled calls still
+        # running count against `max_pending`
+        semaphore = self._semaphore()
+        await semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+
+        def release() -> None:
+            self._pending -= 1
+            semaphore.release()
+
+        def done(_) -> None:
+            try:
+                loop.call_soon_threadsafe(release)
+            except RuntimeError:
+                # The loop is closed; nobody waits on its semaphore
+                pass
+
+        try:
+            future = self._pool.submit(call)
+        except BaseException:
+            release()
+            raise
+        future.add_done_callback(done)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            future.cancel()
+            raise
+
+
+_DEFAULT_EXECUTOR: tp.Optional[AsyncExecutor] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def get_executor() -> AsyncExecutor:
+    '''Shared `AsyncExecutor` used when none is passed'''
+    global _DEFAULT_EXECUTOR
+    with _DEFAULT_LOCK:
+        if _DEFAULT_EXECUTOR is None:
+            _DEFAULT_EXECUTOR = AsyncExecutor()
+        return _DEFAULT_EXECUTOR
+
+
+def set_executor(executor: tp.Optional[AsyncExecutor]) -> None:
+    '''Replace the shared executor (None creates a new one on next use)'''
+    global _DEFAULT_EXECUTOR
+    with _DEFAULT_LOCK:
+        _DEFAULT_EXECUTOR = executor
+
+
+def _resolve(dist: Distribution, path) -> tp.Tuple[ct.CDLL, STABLE_DIST]:
+    if isinstance(dist, StableDistribution):
+        return dist._lib, dist.dist
+    return load_libstable(path), dist
+
+
+def _evaluate_chunks(c_fn: ct.CDLL._FuncPtr, kind: str,
+                     dist: STABLE_DIST, x: np.ndarray, out: np.ndarray,
+                     err: tp.Optional[np.ndarray], chunk_size: int,
+                     cancelled: threading.Event) -> None:
+    for start in range(0, x.size, chunk_size):
+        if cancelled.is_set():
+            return
+        stop = start + chunk_size
+        _evaluate(c_fn, dist, x[start:stop], out[start:stop],
+                  None if err is None else err[start:stop], False, kind)
+
+
+async def _aevaluate(kind: str, dist: Distribution, x: ArrayLike,
+                     out: tp.Optional[np.ndarray], return_err: bool,
+                     executor: tp.Optional[AsyncExecutor],
+                     chunk_size: int, path) -> ArrayResult:
+    lib, dist_ptr = _resolve(dist, path)
+    x = utils.as_double_array(x)
+    out = utils.output_array(out, x.size, 'out')
+    err = utils.output_array(None, x.size, 'err') if return_err else None
+    executor = executor or get_executor()
+    await executor.run(_gated, lib, dist_ptr, False, _evaluate_chunks,
+                       _C_FUNCTIONS[kind](lib), kind, dist_ptr, x, out, err,
+                       chunk_size, lock=dist_lock(dist_ptr))
+    if return_err:
+        return out, err
+    return out
+
+
+async def apdf(dist: Distribution, x: ArrayLike,
+               out: tp.Optional[np.ndarray] = None, return_err: bool = False,
+               executor: tp.Optional[AsyncExecutor] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               path=None) -> ArrayResult:
+    '''
+    Evaluate the pdf at `x` in a worker thread. See `pdf_array`.
+
+    Inputs:
+      dist       [Distribution]:  `StableDist` pointer or `StableDistribution`
+      x          [ArrayLike]:     evaluation points
+      out        [np.ndarray]:    optional float64 output buffer, len(x);
+                                  partially written if cancelled
+      return_err [bool]:          also return the error estimates
+      executor   [AsyncExecutor]: executor, default `get_executor()`
+      chunk_size [int]:           points per C call
+      path       [str]:           optional path to `libstable.so`
+
+    Outputs:
+      [np.ndarray]:               pdf values, or (pdf, err) if requested
+    '''
+    return await _aevaluate('pdf', dist, x, out, return_err, executor,
+                            chunk_size, path)
+
+
+async def acdf(dist: Distribution, x: ArrayLike,
+               out: tp.Optional[np.ndarray] = None, return_err: bool = False,
+               executor: tp.Optional[AsyncExecutor] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               path=None) -> ArrayResult:
+    '''Evaluate the cdf at `x` in a worker thread. See `apdf`'''
+    return await _aevaluate('cdf', dist, x, out, return_err, executor,
+                            chunk_size, path)
+
+
+async def aq(dist: Distribution, q: ArrayLike,
+             out: tp.Optional[np.ndarray] = None, return_err: bool = False,
+             executor: tp.Optional[AsyncExecutor] = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE,
+             path=None) -> ArrayResult:
+    '''Evaluate the quantiles at `q` in a worker thread. See `apdf`'''
+    return await _aevaluate('q', dist, q, out, return_err, executor,
+                            chunk_size, path)
+
+
+def _fit(lib: ct.CDLL, dist: STABLE_DIST, data: np.ndarray, method: str,
+         cancelled: threading.Event) -> int:
+    return stable_fit_array(lib, dist, data, method)
+
+
+async def afit(dist: Distribution, data: ArrayLike,
+               method: str = DEFAULT_METHOD,
+               executor: tp.Optional[AsyncExecutor] = None,
+               path=None) -> int:
+    '''
+    Fit `dist` to `data` in place in a worker thread. See `fit_array`. A
+    fit cannot be interrupted once started; cancelling it then only
+    discards the status.
+    '''
+    lib, dist_ptr = _resolve(dist, path)
+    data = utils.as_double_array(data)
+    executor = executor or get_executor()
+    return await executor.run(_gated, lib, dist_ptr, True, _fit, lib,
+                              dist_ptr, data, method,
+                              lock=dist_lock(dist_ptr))
+
+
+def _rnd(lib: ct.CDLL, dist: STABLE_DIST, seed: tp.Optional[int],
+         out: np.ndarray, cancelled: threading.Event) -> None:
+    if seed:
+        stable_rnd_seed(lib, dist, seed)
+    stable_rnd(lib, dist, out.size, out)
+
+
+async def arnd(dist: Distribution, n: tp.Optional[int] = None,
+               seed: tp.Optional[int] = None,
+               out: tp.Optional[np.ndarray] = None,
+               size: tp.Union[int, tp.Tuple[int, ...]] = None,
+               executor: tp.Optional[AsyncExecutor] = None,
+               path=None) -> np.ndarray:
+    '''Draw random samples in a worker thread. See `rnd`'''
+    lib, dist_ptr = _resolve(dist, path)
+    shape = utils.sample_shape(n, size, out)
+    out = utils.output_array(out, int(np.prod(shape)), 'out')
+    executor = executor or get_executor()
+    await executor.run(_rnd, lib, dist_ptr, seed, out,
+                       lock=dist_lock(dist_ptr))
+    return out.reshape(shape)
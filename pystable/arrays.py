@@ -0,0 +1,242 @@
+import ctypes as ct
+import typing as tp
+import numpy as np
+from pystable.pystable import (load_libstable, c_stable_cdf, c_stable_cdf_v,
+                               c_stable_fit, c_stable_fit_init,
+                               c_stable_fit_koutrouvelis, c_stable_fit_mle,
+                               c_stable_pdf, c_stable_pdf_v, c_stable_q,
+                               stable_setparams)
+from pystable.stable_dist import STABLE_DIST
+from pystable.closed_form import closed_form
+from pystable import metrics, utils
+from pystable.utils import ArrayLike, as_double_array
+
+
+ArrayResult = tp.Union[np.ndarray, tp.Tuple[np.ndarray, np.ndarray]]
+
+# Evaluation engines of the pdf and cdf:
+#   point:  `stable_pdf`/`stable_cdf`, one adaptive quadrature per point
+#   vector: `stable_pdf_v`/`stable_cdf_v`, which interpolate all points from
+#           integrals tabulated once per call and fall back to the point
+#           methods where the error estimate of the tables exceeds relTOL.
+#           Faster from about a thousand points on; needs a libstable built
+#           with `stable_vector.c`
+ENGINES = ('point', 'vector')
+DEFAULT_ENGINE = 'point'
+
+_ENGINE_FUNCTIONS = {('pdf', 'point'): c_stable_pdf,
+                     ('pdf', 'vector'): c_stable_pdf_v,
+                     ('cdf', 'point'): c_stable_cdf,
+                     ('cdf', 'vector'): c_stable_cdf_v}
+
+# Function names in `metrics` of the C array functions
+_METRIC_NAMES = {'stable_pdf': 'pdf_array',
+                 'stable_pdf_v': 'pdf_array[vector]',
+                 'stable_cdf': 'cdf_array',
+                 'stable_cdf_v': 'cdf_array[vector]',
+                 'stable_q': 'q_array'}
+
+
+def engine_function(lib: ct.CDLL, kind: str,
+                    engine: str = DEFAULT_ENGINE) -> ct.CDLL._FuncPtr:
+    '''C function evaluating the pdf or cdf (`kind`) with `engine`'''
+    if engine not in ENGINES:
+        raise ValueError('unknown engine {!r}, expected one of {}'
+                         .format(engine, ', '.join(ENGINES)))
+    try:
+        return _ENGINE_FUNCTIONS[kind, engine](lib)
+    except AttributeError as e:
+        raise NotImplementedError(
+            "engine {!r} is not available in this libstable build, rebuild "
+            "it with `build.py`".format(engine)) from e
+
+
+def _evaluate(c_fn: ct.CDLL._FuncPtr, dist: STABLE_DIST, x: ArrayLike,
+              out: tp.Optional[np.ndarray], err: tp.Optional[np.ndarray],
+              return_err: bool, kind: tp.Optional[str] = None,
+              fast: bool = True) -> ArrayResult:
+    '''
+    Run one of the `stable_pdf`/`stable_cdf`/`stable_q` array functions,
+    or its NumPy closed form (see `closed_form`) when `kind` is given and
+    the distribution is Gauss, Cauchy or Levy
+    '''
+    started = metrics.start()
+    x = as_double_array(x)
+    n = x.size
+    out = utils.output_array(out, n, 'out')
+    if err is not None or return_err:
+        err = utils.output_array(err, n, 'err')
+    elif started is not None:
+        err = np.empty(n)
+
+    if n > 0:
+        if fast and kind is not None and closed_form(kind, dist, x, out):
+            if err is not None:
+                err.fill(0.0)
+        elif c_fn.native is not None:
+            c_fn.native(ct.addressof(dist.contents), x, out, err)
+        else:
+            c_fn(dist, utils.pointer(x), n, utils.pointer(out),
+                 utils.pointer(err))
+    if started is not None:
+        metrics.record(_METRIC_NAMES.get(c_fn.__name__, c_fn.__name__), dist,
+                       n, started, out, err)
+
+    if return_err:
+        return out, err
+    return out
+
+
+def pdf_array(dist: STABLE_DIST, x: ArrayLike,
+              out: tp.Optional[np.ndarray] = None,
+              err: tp.Optional[np.ndarray] = None,
+              return_err: bool = False, path=None,
+              fast: bool = True, engine: str = DEFAULT_ENGINE) -> ArrayResult:
+    lib = load_libstable(path)
+    return stable_pdf_array(lib, dist, x, out, err, return_err, fast, engine)
+
+
+def stable_pdf_array(lib: ct.CDLL, dist: STABLE_DIST, x: ArrayLike,
+                     out: tp.Optional[np.ndarray] = None,
+                     err: tp.Optional[np.ndarray] = None,
+                     return_err: bool = False,
+                     fast: bool = True,
+                     engine: str = DEFAULT_ENGINE) -> ArrayResult:
+    '''
+    Evaluate the pdf at every point of `x` without copying the input.
+    Gauss, Cauchy and Levy distributions are evaluated in closed form with
+    NumPy unless `fast` is False; the others with one of `ENGINES`.
+
+    Inputs:
+      lib        [ct.CDLL]:     libstable dynamically linked library
+      dist       [STABLE_DIST]: pointer to `StableDist` struct
+      x          [ArrayLike]:   evaluation points (float64 buffer)
+      out        [np.ndarray]:  optional float64 output buffer, len(x)
+      err        [np.ndarray]:  optional float64 buffer for error estimates
+      return_err [bool]:        also return the per-point error estimates
+      fast       [bool]:        use closed forms where available
+      engine     [str]:         'point' or 'vector'
+
+    Outputs:
+      [np.ndarray]:             pdf values, or (pdf, err) if requested
+    '''
+    return _evaluate(engine_function(lib, 'pdf', engine), dist, x, out, err,
+                     return_err, 'pdf', fast)
+
+
+def cdf_array(dist: STABLE_DIST, x: ArrayLike,
+              out: tp.Optional[np.ndarray] = None,
+              err: tp.Optional[np.ndarray] = None,
+              return_err: bool = False, path=None,
+              fast: bool = True, engine: str = DEFAULT_ENGINE) -> ArrayResult:
+    lib = load_libstable(path)
+    return stable_cdf_array(lib, dist, x, out, err, return_err, fast, engine)
+
+
+def stable_cdf_array(lib: ct.CDLL, dist: STABLE_DIST, x: ArrayLike,
+                     out: tp.Optional[np.ndarray] = None,
+                     err: tp.Optional[np.ndarray] = None,
+                     return_err: bool = False,
+                     fast: bool = True,
+                     engine: str = DEFAULT_ENGINE) -> ArrayResult:
+    '''Evaluate the cdf at every point of `x`. See `stable_pdf_array`'''
+    return _evaluate(engine_function(lib, 'cdf', engine), dist, x, out, err,
+                     return_err, 'cdf', fast)
+
+
+def q_array(dist: STABLE_DIST, q: ArrayLike,
+            out: tp.Optional[np.ndarray] = None,
+            err: tp.Optional[np.ndarray] = None,
+            return_err: bool = False, path=None,
+            fast: bool = True) -> ArrayResult:
+    lib = load_libstable(path)
+    return stable_q_array(lib, dist, q, out, err, return_err, fast)
+
+
+def stable_q_array(lib: ct.CDLL, dist: STABLE_DIST, q: ArrayLike,
+                   out: tp.Optional[np.ndarray] = None,
+                   err: tp.Optional[np.ndarray] = None,
+                   return_err: bool = False,
+                   fast: bool = True) -> ArrayResult:
+    '''Evaluate the quantiles at probabilities `q`. See `stable_pdf_array`'''
+    return _evaluate(c_stable_q(lib), dist, q, out, err, return_err, 'q',
+                     fast)
+
+
+# Estimation methods of libstable. All but 'mle2d' (`stable_fit`, which
+# initializes itself) are started from the McCulloch estimate, as in
+# libstable's own test programs.
+#   mcculloch:    quantile estimator (`stable_fit_init`), no iterations
+#   koutrouvelis: regression on the sample characteristic function
+#   mle2d:        ML over (alpha, beta), sigma and mu from McCulloch
+#   mle:          ML over all four parameters (`stable_fit_mle`)
+#   whole:        alias of 'mle' (`stable_fit_whole`)
+FIT_METHODS = ('mcculloch', 'koutrouvelis', 'mle2d', 'mle', 'whole')
+DEFAULT_METHOD = 'mle2d'
+# Status of a fit whose McCulloch estimate failed (e.g. on data with a zero
+# interquartile range); the parameters are left unchanged
+FIT_INIT_FAILED = -1
+
+
+def fit_array(dist: STABLE_DIST, data: ArrayLike,
+              method: str = DEFAULT_METHOD, path=None) -> int:
+    lib = load_libstable(path)
+    return stable_fit_array(lib, dist, data, method)
+
+
+def stable_fit_array(lib: ct.CDLL, dist: STABLE_DIST, data: ArrayLike,
+                     method: str = DEFAULT_METHOD) -> int:
+    '''
+    Fit `dist` to `data` in place, passing the data buffer to libstable
+    without copying.
+
+    Inputs:
+      lib    [ct.CDLL]:     libstable dynamically linked library
+      dist   [STABLE_DIST]: pointer to `StableDist` struct, updated in place
+      data   [ArrayLike]:   float64 sample
+      method [str]:         estimation method, one of `FIT_METHODS`
+
+    Outputs:
+        [int]:              libstable status code (0 on success), or
+                            `FIT_INIT_FAILED`
+    '''
+    if method not in FIT_METHODS:
+        raise ValueError('unknown fit method {!r}, expected one of {}'
+                         .format(method, ', '.join(FIT_METHODS)))
+    started = metrics.start()
+    data = as_double_array(data)
+    status = _fit(lib, dist, data, method)
+    if started is not None:
+        metrics.record('fit_array[{}]'.format(method), dist, data.size,
+                       started)
+    return status
+
+
+def _call_fit(c_fn: ct.CDLL._FuncPtr, dist: STABLE_DIST,
+              data: np.ndarray) -> int:
+    if c_fn.native is not None:
+        return c_fn.native(ct.addressof(dist.contents), data)
+    return c_fn(dist, utils.pointer(data), data.size)
+
+
+def _fit(lib: ct.CDLL, dist: STABLE_DIST, data: np.ndarray,
+         method: str) -> int:
+    if method == 'mle2d':
+        return _call_fit(c_stable_fit(lib), dist, data)
+
+    # `stable_fit_init` returns nothing. nu_c, the interquartile range, is
+    # only set once `stable_setparams` accepted the estimate, and is 0 when
+    # the estimator gave up and left its outputs uninitialized
+    d = dist.contents
+    previous = (d.alpha, d.beta, d.sigma, d.mu_0)
+    nu_c, nu_z = ct.c_double(np.nan), ct.c_double(np.nan)
+    c_stable_fit_init(lib)(dist, utils.pointer(data), data.size,
+                           ct.byref(nu_c), ct.byref(nu_z))
+    if not nu_c.value > 0:
+        stable_setparams(lib, dist, *previous, 0)
+        return FIT_INIT_FAILED
+    if method == 'mcculloch':
+        return 0
+    if method == 'koutrouvelis':
+        return _call_fit(c_stable_fit_koutrouvelis(lib), dist, data)
+    return _call_fit(c_stable_fit_mle(lib), dist, data)
@@ -0,0 +1,278 @@
+import ctypes as ct
+import math
+import os
+import typing as tp
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from pystable.pystable import (load_libstable, stable_checkparams,
+                               stable_create, stable_free, stable_setparams)
+from pystable.arrays import (ArrayResult, DEFAULT_ENGINE, stable_cdf_array,
+                             stable_pdf_array)
+from pystable.cache import DEFAULT_CACHE
+from pystable.config import aux_regime
+from pystable.stable_dist import STABLE_DIST
+from pystable import utils
+from pystable.utils import ArrayLike
+
+
+def mu_0_of(alpha: float, beta: float, sigma: ArrayLike, mu: ArrayLike,
+            parameterization: int) -> np.ndarray:
+    '''
+    Location in the 0-parameterization, as computed by `stable_setparams`.
+    `alpha` and `beta` must be the values stored by libstable (which snaps
+    them in the Gauss, Cauchy and Levy cases).
+    '''
+    sigma = np.asarray(sigma, dtype=np.float64)
+    mu = np.asarray(mu, dtype=np.float64)
+    if parameterization == 0:
+        return mu
+    if alpha == 1:
+        return mu + beta * 2 / math.pi * sigma * np.log(sigma)
+    return mu + beta * math.tan(0.5 * alpha * math.pi) * sigma
+
+
+def _standardize(dist: STABLE_DIST, sigma: ArrayLike, mu: ArrayLike,
+                 x: ArrayLike, parameterization: int
+                 ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''Standardized points z = (x - mu_0) / sigma, shape (len(sigma), N)'''
+    sigma = np.atleast_1d(np.asarray(sigma, dtype=np.float64))
+    mu = np.atleast_1d(np.asarray(mu, dtype=np.float64))
+    if sigma.ndim != 1 or sigma.shape != mu.shape:
+        raise ValueError('`sigma` and `mu` must be 1-d arrays of equal size')
+    if np.any(sigma <= 0):
+        raise ValueError('`sigma` must be positive')
+
+    mu_0 = mu_0_of(dist.contents.alpha, dist.contents.beta, sigma, mu,
+                   parameterization)
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim == 1:
+        x = x[np.newaxis, :]
+    if x.ndim != 2 or x.shape[0] not in (1, sigma.size):
+        raise ValueError('`x` must be 1-d or have one row per sigma')
+    return (x - mu_0[:, np.newaxis]) / sigma[:, np.newaxis], sigma
+
+
+def _batch(fn: str, alpha: float, beta: float, sigma: ArrayLike,
+           mu: ArrayLike, x: ArrayLike, parameterization: int,
+           tabulated: bool, path) -> np.ndarray:
+    lib = load_libstable(path)
+    dist = stable_create(lib, alpha, beta, 1.0, 0.0, 0)
+    if not dist:
+        raise ValueError('invalid stable parameters: alpha={}, beta={}'
+                         .format(alpha, beta))
+    try:
+        z, sigma = _standardize(dist, sigma, mu, x, parameterization)
+        table = (DEFAULT_CACHE.table(dist.contents.alpha,
+                                     dist.contents.beta, path=path)
+                 if tabulated else None)
+        if table is not None and table.accurate:
+            values = getattr(table, fn)(z).reshape(z.shape)
+        else:
+            # Evaluate each distinct standardized point once
+            unique, inverse = np.unique(z, return_inverse=True)
+            evaluate = stable_pdf_array if fn == 'pdf' else stable_cdf_array
+            values = evaluate(lib, dist, unique)[inverse].reshape(z.shape)
+    finally:
+        stable_free(lib, dist)
+
+    if fn == 'pdf':
+        values /= sigma[:, np.newaxis]
+    return values
+
+
+def pdf_batch(alpha: float, beta: float, sigma: ArrayLike, mu: ArrayLike,
+              x: ArrayLike, parameterization: int = 1,
+              tabulated: bool = False, path=None) -> np.ndarray:
+    '''
+    Pdf of S(alpha, beta, sigma[k], mu[k]) for every k at the points `x`,
+    using f(x; alpha, beta, sigma, mu_0) = f((x - mu_0) / sigma) / sigma so
+    that only standardized densities are evaluated, each distinct point
+    once.
+
+    Inputs:
+      alpha, beta      [float]:      shared shape parameters
+      sigma, mu        [ArrayLike]:  K scale and location parameters
+      x                [ArrayLike]:  N points, or K x N (one row per k)
+      parameterization [int]:        parameterization of `mu`
+      tabulated        [bool]:       use a cached `StableTable` instead of
+                                     exact evaluation (unless the table
+                                     exceeds `MAX_ERRORS`)
+      path             [str]:        optional path to `libstable.so`
+
+    Outputs:
+        [np.ndarray]:                K x N pdf values
+    '''
+    return _batch('pdf', alpha, beta, sigma, mu, x, parameterization,
+                  tabulated, path)
+
+
+def cdf_batch(alpha: float, beta: float, sigma: ArrayLike, mu: ArrayLike,
+              x: ArrayLike, parameterization: int = 1,
+              tabulated: bool = False, path=None) -> np.ndarray:
+    '''Cdf counterpart of `pdf_batch`, returning K x N values'''
+    return _batch('cdf', alpha, beta, sigma, mu, x, parameterization,
+                  tabulated, path)
+
+
+def _grid(fn: str, lib: ct.CDLL, alpha: ArrayLike, beta: ArrayLike,
+          sigma: ArrayLike, mu: ArrayLike, x: ArrayLike,
+          parameterization: int, workers: tp.Optional[int],
+          out: tp.Optional[np.ndarray], err: tp.Optional[np.ndarray],
+          return_err: bool, fast: bool, engine: str) -> ArrayResult:
+    params = [np.atleast_1d(np.asarray(p, dtype=np.float64))
+              for p in (alpha, beta, sigma, mu)]
+    if any(p.ndim != 1 for p in params):
+        raise ValueError('parameters must be scalars or 1-d arrays')
+    try:
+        alpha, beta, sigma, mu = np.broadcast_arrays(*params)
+    except ValueError as e:
+        raise ValueError('parameter arrays must have equal sizes') from e
+    k = alpha.size
+
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim == 1:
+        x = x[np.newaxis, :]
+    if x.ndim != 2 or x.shape[0] not in (1, k):
+        raise ValueError('`x` must be 1-d or have one row per parameter set')
+    x = np.ascontiguousarray(x)
+    n = x.shape[1]
+    out = utils.output_array(out, k * n, 'out').reshape(k, n)
+    if err is not None or return_err:
+        err = utils.output_array(err, k * n, 'err').reshape(k, n)
+    evaluate = stable_pdf_array if fn == 'pdf' else stable_cdf_array
+    workers = min(workers or os.cpu_count() or 1, max(k, 1))
+
+    # Rows on either side of alpha = 1 need different AUX1/AUX2 globals,
+    # which `stable_setparams` writes for the whole process: each regime is
+    # evaluated in turn and only rows of the same regime run concurrently.
+    # Rows that do not use the globals join any group
+    groups: tp.Dict[tp.Optional[bool], tp.List[int]] = {}
+    for i in range(k):
+        zone = stable_checkparams(lib, alpha[i], beta[i], sigma[i], mu[i],
+                                  parameterization)
+        regime = aux_regime(zone, alpha[i], beta[i]) if zone >= 0 else None
+        groups.setdefault(regime, []).append(i)
+    if None in groups and len(groups) > 1:
+        rows = groups.pop(None)
+        groups[next(iter(groups))] += rows
+
+    def work(rows: tp.List[int], worker: int, step: int) -> None:
+        # One workspace per worker, reparameterized for each of its rows
+        dist = stable_create(lib, 2.0, 0.0, 1.0, 0.0, 0)
+        try:
+            for i in rows[worker::step]:
+                if stable_setparams(lib, dist, alpha[i], beta[i], sigma[i],
+                                    mu[i], parameterization) < 0:
+                    out[i] = np.nan
+                    if err is not None:
+                        err[i] = np.nan
+                    continue
+                evaluate(lib, dist, x[i if x.shape[0] > 1 else 0], out[i],
+                         None if err is None else err[i], False, fast,
+                         engine)
+        finally:
+            stable_free(lib, dist)
+
+    for rows in groups.values():
+        step = min(workers, len(rows))
+        if step == 1:
+            work(rows, 0, 1)
+            continue
+        with ThreadPoolExecutor(max_workers=step) as pool:
+            for future in [pool.submit(work, rows, w, step)
+                           for w in range(step)]:
+                future.result()
+
+    if return_err:
+        return out, err
+    return out
+
+
+def pdf_grid(alpha: ArrayLike, beta: ArrayLike, sigma: ArrayLike,
+             mu: ArrayLike, x: ArrayLike, parameterization: int = 1,
+             workers: tp.Optional[int] = None,
+             out: tp.Optional[np.ndarray] = None,
+             err: tp.Optional[np.ndarray] = None, return_err: bool = False,
+             fast: bool = True, engine: str = DEFAULT_ENGINE,
+             path=None) -> ArrayResult:
+    lib = load_libstable(path)
+    return stable_pdf_grid(lib, alpha, beta, sigma, mu, x, parameterization,
+                           workers, out, err, return_err, fast, engine)
+
+
+def stable_pdf_grid(lib: ct.CDLL, alpha: ArrayLike, beta: ArrayLike,
+                    sigma: ArrayLike, mu: ArrayLike, x: ArrayLike,
+                    parameterization: int = 1,
+                    workers: tp.Optional[int] = None,
+                    out: tp.Optional[np.ndarray] = None,
+                    err: tp.Optional[np.ndarray] = None,
+                    return_err: bool = False, fast: bool = True,
+                    engine: str = DEFAULT_ENGINE) -> ArrayResult:
+    '''
+    Pdf of S(alpha[k], beta[k], sigma[k], mu[k]) for every k at the points
+    `x`, e.g. a likelihood surface or a scenario grid. Unlike `pdf_batch`
+    every parameter may vary.
+
+    The parameter sets are evaluated in parallel on `workers` threads.
+    Each thread creates one `StableDist` and reparameterizes it with
+    `stable_setparams` for each of its rows, instead of creating a
+    distribution (and its workspace) per parameter set. Every row is one
+    `stable_pdf_array` call, so Gauss, Cauchy and Levy rows use their
+    closed forms. Rows with invalid parameters are NaN.
+
+    `stable_setparams` writes process-wide integration constants that
+    differ for alpha < 1 and alpha > 1 (for beta < 0 and beta >= 0 at
+    alpha = 1), so the rows of each regime are evaluated in turn and only
+    rows of one regime run concurrently. Other threads evaluating
+    distributions of a different regime at the same time may still
+    interfere.
+
+    libstable may also split each row over its own threads (see
+    `configure(threads=...)`); with many short rows, `threads=1` avoids
+    oversubscribing the CPUs.
+
+    Inputs:
+      lib              [ct.CDLL]:    libstable dynamically linked library
+      alpha, beta      [ArrayLike]:  K shape parameters (or scalars)
+      sigma, mu        [ArrayLike]:  K scale and location parameters (or
+                                     scalars)
+      x                [ArrayLike]:  N points, or K x N (one row per k)
+      parameterization [int]:        parameterization of `mu`
+      workers          [int]:        threads (default: CPU count)
+      out              [np.ndarray]: optional C-contiguous K x N float64
+                                     output buffer
+      err              [np.ndarray]: optional buffer for error estimates
+      return_err       [bool]:       also return the error estimates
+      fast             [bool]:       use closed forms where available
+      engine           [str]:        'point' or 'vector'
+
+    Outputs:
+        [np.ndarray]:                K x N pdf values, or (pdf, err)
+    '''
+    return _grid('pdf', lib, alpha, beta, sigma, mu, x, parameterization,
+                 workers, out, err, return_err, fast, engine)
+
+
+def cdf_grid(alpha: ArrayLike, beta: ArrayLike, sigma: ArrayLike,
+             mu: ArrayLike, x: ArrayLike, parameterization: int = 1,
+             workers: tp.Optional[int] = None,
+             out: tp.Optional[np.ndarray] = None,
+             err: tp.Optional[np.ndarray] = None, return_err: bool = False,
+             fast: bool = True, engine: str = DEFAULT_ENGINE,
+             path=None) -> ArrayResult:
+    lib = load_libstable(path)
+    return stable_cdf_grid(lib, alpha, beta, sigma, mu, x, parameterization,
+                           workers, out, err, return_err, fast, engine)
+
+
+def stable_cdf_grid(lib: ct.CDLL, alpha: ArrayLike, beta: ArrayLike,
+                    sigma: ArrayLike, mu: ArrayLike, x: ArrayLike,
+                    parameterization: int = 1,
+                    workers: tp.Optional[int] = None,
+                    out: tp.Optional[np.ndarray] = None,
+                    err: tp.Optional[np.ndarray] = None,
+                    return_err: bool = False, fast: bool = True,
+                    engine: str = DEFAULT_ENGINE) -> ArrayResult:
+    '''Cdf counterpart of `stable_pdf_grid`, returning K x N values'''
+    return _grid('cdf', lib, alpha, beta, sigma, mu, x, parameterization,
+                 workers, out, err, return_err, fast, engine)
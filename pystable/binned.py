@@ -0,0 +1,309 @@
+import time
+import typing as tp
+import numpy as np
+from dataclasses import dataclass
+from pystable.pystable import load_libstable
+from pystable.arrays import stable_fit_array
+from pystable.distribution import StableDistribution
+from pystable.fitting import FitResult
+from pystable.likelihood import LogLikelihood
+from pystable.rolling import czab, mcculloch, quartiles
+from pystable import utils
+from pystable.utils import ArrayLike
+
+
+DEFAULT_BINS = 2000
+DEFAULT_STRATA = 100
+BINNING_MODES = ('quantile', 'histogram', 'subsample')
+
+# Simplex settings of libstable's `stable_fit_iter`
+SIMPLEX_STEP = 0.01
+SIMPLEX_SIZE = 0.02
+SIMPLEX_MAX_ITER = 200
+
+Compressed = tp.Tuple[np.ndarray, np.ndarray]
+
+
+def quantile_bins(data: ArrayLike, bins: int = DEFAULT_BINS,
+                  presorted: bool = False) -> Compressed:
+    '''
+    Compress `data` into about `bins` groups of consecutive order statistics,
+    each represented by its mean and weighted by its count.
+
+    Bin edges are uniform in the logit of the rank, so bins hold most points
+    near the median and shrink to single (exact) points in both tails, where
+    the likelihood is most sensitive to alpha.
+
+    Inputs:
+      data      [ArrayLike]: float64 sample
+      bins      [int]:       requested number of bins; tail bins that would
+                             hold less than one point are merged
+      presorted [bool]:      `data` is already in ascending order
+
+    Outputs:
+      [np.ndarray]:          bin means
+      [np.ndarray]:          bin counts (float64), summing to len(data)
+    '''
+    x = utils.as_double_array(data)
+    if not presorted:
+        x = np.sort(x)
+    n = x.size
+    if n <= bins:
+        return x.copy(), np.ones(n)
+
+    edge = np.log(n - 0.5) - np.log(0.5)
+    t = np.linspace(-edge, edge, bins + 1)
+    ranks = np.rint(n / (1 + np.exp(-t))).astype(np.int64)
+    ranks[0], ranks[-1] = 0, n
+    starts = np.unique(ranks)[:-1]
+    counts = np.diff(np.append(starts, n)).astype(np.float64)
+    return np.add.reduceat(x, starts) / counts, counts
+
+
+def histogram_bins(data: ArrayLike, bins: int = DEFAULT_BINS) -> Compressed:
+    '''
+    Compress `data` into `bins` equal-width bins between its extremes, each
+    represented by the mean of its points. Empty bins are dropped.
+
+    With heavy tails most bins are empty or nearly so and the bulk of the
+    data falls into a few bins; prefer `quantile_bins`.
+    '''
+    x = utils.as_double_array(data)
+    counts, edges = np.histogram(x, bins)
+    sums, _ = np.histogram(x, edges, weights=x)
+    keep = counts > 0
+    counts = counts[keep].astype(np.float64)
+    return sums[keep] / counts, counts
+
+
+def stratified_subsample(data: ArrayLike, size: int,
+                         strata: int = DEFAULT_STRATA, seed=None,
+                         presorted: bool = False) -> Compressed:
+    '''
+    Draw `size` points without replacement from `strata` equal-count strata
+    of the order statistics, in proportion to their sizes, weighted by the
+    number of points each one stands for.
+
+    Inputs:
+      data      [ArrayLike]: float64 sample
+      size      [int]:       number of points to keep
+      strata    [int]:       number of strata
+      seed      [int]:       seed of the NumPy generator
+      presorted [bool]:      `data` is already in ascending order
+
+    Outputs:
+      [np.ndarray]:          sampled points
+      [np.ndarray]:          weights, summing to len(data)
+    '''
+    x = utils.as_double_array(data)
+    if not presorted:
+        x = np.sort(x)
+    n = x.size
+    if n <= size:
+        return x.copy(), np.ones(n)
+
+    strata = min(strata, size)
+    bounds = np.linspace(0, n, strata + 1).astype(np.int64)
+    # Largest remainders: as size < n, no stratum gets more draws than it
+    # has points
+    share = np.diff(bounds) * (size / n)
+    draws = np.floor(share).astype(np.int64)
+    extra = np.argsort(draws - share, kind='stable')[:size - draws.sum()]
+    draws[extra] += 1
+    rng = np.random.default_rng(seed)
+    points, weights = [], []
+    for lo, hi, k in zip(bounds[:-1], bounds[1:], draws):
+        if k == 0:
+            continue
+        idx = lo + rng.choice(hi - lo, size=k, replace=False)
+        points.append(x[idx])
+        weights.append(np.full(k, (hi - lo) / k))
+    return np.concatenate(points), np.concatenate(weights)
+
+
+def compress(data: ArrayLike, mode: str = 'quantile',
+             bins: int = DEFAULT_BINS, size: tp.Optional[int] = None,
+             strata: int = DEFAULT_STRATA, seed=None,
+             presorted: bool = False) -> Compressed:
+    '''
+    Weighted points standing in for `data` in the likelihood, see
+    `quantile_bins`, `histogram_bins` and `stratified_subsample`. For
+    'subsample', `size` defaults to `bins`.
+    '''
+    if mode == 'quantile':
+        return quantile_bins(data, bins, presorted)
+    if mode == 'histogram':
+        return histogram_bins(data, bins)
+    if mode == 'subsample':
+        return stratified_subsample(data, bins if size is None else size,
+                                    strata, seed, presorted)
+    raise ValueError('unknown binning mode {!r}, expected one of {}'
+                     .format(mode, ', '.join(BINNING_MODES)))
+
+
+@dataclass
+class BinnedFitResult(FitResult):
+    '''
+    `FitResult` of `fit_binned`.
+
+    Parameters:
+      points        [int]:       pdf evaluations per likelihood evaluation
+      loglike       [float]:     approximate log-likelihood at the fit
+      exact_loglike [float]:     log-likelihood of the full data at the fit,
+                                 if requested
+      exact         [FitResult]: exact `stable_fit` of the full data, if
+                                 requested
+    '''
+    points: int = 0
+    loglike: float = np.nan
+    exact_loglike: tp.Optional[float] = None
+    exact: tp.Optional[FitResult] = None
+
+    @property
+    def loglike_error(self) -> tp.Optional[float]:
+        '''Relative error of the approximate log-likelihood at the fit'''
+        if self.exact_loglike is None:
+            return None
+        return abs(self.loglike / self.exact_loglike - 1)
+
+    @property
+    def param_error(self) -> tp.Optional[tp.Dict[str, float]]:
+        '''Absolute differences from the exact fit'''
+        if self.exact is None:
+            return None
+        return {name: abs(getattr(self, name) - getattr(self.exact, name))
+                for name in ('alpha', 'beta', 'sigma', 'mu_0', 'mu_1')}
+
+
+def fit_binned(data: ArrayLike, mode: str = 'quantile',
+               bins: int = DEFAULT_BINS, size: tp.Optional[int] = None,
+               strata: int = DEFAULT_STRATA, seed=None,
+               reference: tp.Optional[str] = None,
+               tol: float = SIMPLEX_SIZE, path=None) -> BinnedFitResult:
+    '''
+    Approximate `stable_fit` (ML over alpha and beta, sigma and mu from
+    McCulloch) for very large samples.
+
+    The data is sorted once; McCulloch's estimate and the quantiles used
+    for sigma and mu come from the full sample, while the likelihood is
+    evaluated only at the weighted points of `compress`, so each iteration
+    costs O(bins) instead of O(len(data)). The simplex search uses the
+    settings of libstable's `stable_fit_iter`, which stops once the simplex
+    is 0.02 across; a smaller `tol` searches further.
+
+    Inputs:
+      data      [ArrayLike]: float64 sample
+      mode      [str]:       one of `BINNING_MODES`
+      bins      [int]:       number of bins (or sample size for 'subsample')
+      size      [int]:       sample size for 'subsample', overrides `bins`
+      strata    [int]:       strata for 'subsample'
+      seed      [int]:       seed for 'subsample'
+      reference [str]:       None, 'loglike' to also compute the exact
+                             log-likelihood at the fit (one pass over the
+                             data) or 'fit' to also run the exact fit
+      tol       [float]:     simplex size at which the search stops
+      path      [str]:       optional path to `libstable.so`
+
+    Outputs:
+      [BinnedFitResult]:     fitted parameters and approximation error
+    '''
+    if reference not in (None, 'loglike', 'fit'):
+        raise ValueError("reference must be None, 'loglike' or 'fit'")
+    lib = load_libstable(path)
+    start = time.perf_counter()
+    x = np.sort(utils.as_double_array(data))
+    status, alpha, beta, _, _ = mcculloch(lib, x)
+    if status < 0:
+        raise ValueError('degenerate data: interquartile range is 0')
+    nu_c, nu_z = quartiles(lib, x)
+    points, weights = compress(x, mode, bins, size, strata, seed,
+                               presorted=True)
+
+    with LogLikelihood(points, 0, path, weights) as ll:
+        def objective(theta: np.ndarray) -> float:
+            sigma, mu = czab(lib, theta[0], theta[1], nu_c, nu_z)
+            value = -ll((theta[0], theta[1], sigma, mu))
+            return np.inf if np.isnan(value) else value
+
+        theta, value, status = _nelder_mead(objective, (alpha, beta),
+                                            size_tol=tol)
+    alpha, beta = theta
+    sigma, mu = czab(lib, alpha, beta, nu_c, nu_z)
+    with StableDistribution(alpha, beta, sigma, mu, 0, path) as dist:
+        result = BinnedFitResult(0, status, alpha, beta, sigma, dist.mu_0,
+                                 dist.mu_1, time.perf_counter() - start,
+                                 points.size, -value)
+
+    if reference is not None:
+        with LogLikelihood(x, 0, path) as ll:
+            result.exact_loglike = ll((alpha, beta, sigma, mu))
+    if reference == 'fit':
+        with StableDistribution(2.0, 0.0, 1.0, 0.0, 1, path) as dist:
+            start = time.perf_counter()
+            status = stable_fit_array(lib, dist.dist, x)
+            result.exact = FitResult(0, status, dist.alpha, dist.beta,
+                                     dist.sigma, dist.mu_0, dist.mu_1,
+                                     time.perf_counter() - start)
+    return result
+
+
+def _nelder_mead(f: tp.Callable[[np.ndarray], float], x0: tp.Sequence[float],
+                 step: float = SIMPLEX_STEP, size_tol: float = SIMPLEX_SIZE,
+                 max_iter: int = SIMPLEX_MAX_ITER
+                 ) -> tp.Tuple[np.ndarray, float, int]:
+    '''
+    Minimize `f` with the Nelder-Mead simplex. As GSL's `nmsimplex2rand`
+    used by libstable, the initial simplex is regular, centred on `x0` with
+    vertices `step` away, and the search stops after an iteration in which
+    the mean distance of the vertices from their centroid is below
+    `size_tol`. Returns the best point, its value and 0 on convergence or
+    -2 (GSL_CONTINUE) when `max_iter` is reached.
+    '''
+    x0 = np.asarray(x0, dtype=np.float64)
+    n = x0.size
+    vertices = np.eye(n + 1) - 1 / (n + 1)
+    basis = np.linalg.qr(vertices.T)[0][:, :n]
+    unit = vertices @ basis
+    unit /= np.linalg.norm(unit, axis=1)[:, None]
+    simplex = x0 + step * unit
+    values = np.array([f(v) for v in simplex])
+    for _ in range(max_iter):
+        order = np.argsort(values)
+        simplex, values = simplex[order], values[order]
+        _simplex_step(f, simplex, values)
+        size = np.linalg.norm(simplex - simplex.mean(axis=0), axis=1).mean()
+        if size < size_tol:
+            best = np.argmin(values)
+            return simplex[best], values[best], 0
+
+    best = np.argmin(values)
+    return simplex[best], values[best], -2
+
+
+def _simplex_step(f: tp.Callable[[np.ndarray], float], simplex: np.ndarray,
+                  values: np.ndarray) -> None:
+    '''One Nelder-Mead update of a simplex sorted by value, in place'''
+    centroid = simplex[:-1].mean(axis=0)
+    reflected = 2 * centroid - simplex[-1]
+    f_r = f(reflected)
+    if f_r < values[0]:
+        expanded = 3 * centroid - 2 * simplex[-1]
+        f_e = f(expanded)
+        if f_e < f_r:
+            simplex[-1], values[-1] = expanded, f_e
+        else:
+            simplex[-1], values[-1] = reflected, f_r
+        return
+    if f_r < values[-2]:
+        simplex[-1], values[-1] = reflected, f_r
+        return
+
+    outside = f_r < values[-1]
+    target = reflected if outside else simplex[-1]
+    contracted = (centroid + target) / 2
+    f_c = f(contracted)
+    if f_c < min(f_r, values[-1]):
+        simplex[-1], values[-1] = contracted, f_c
+        return
+    simplex[1:] = (simplex[0] + simplex[1:]) / 2
+    values[1:] = [f(v) for v in simplex[1:]]
@@ -0,0 +1,272 @@
+import threading
+import typing as tp
+from collections import OrderedDict
+from dataclasses import dataclass
+from pystable.config import get_it_max
+from pystable.arrays import DEFAULT_METHOD
+from pystable.distribution import StableDistribution
+from pystable.stable_dist import STABLE_DIST, Zone
+from pystable.tabulated import (DEFAULT_KNOTS, DEFAULT_QUANTILE_KNOTS,
+                                DEFAULT_TAIL, QuantileTable, StableTable,
+                                TabulatedDistribution)
+from pystable.threadlocal import ThreadLocalDistribution
+from pystable.utils import ArrayLike
+
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_DIGITS = 12
+
+# GSL mt19937 state plus the struct itself
+_DIST_OVERHEAD = 5200
+# One gsl_integration_workspace interval: alist, blist, rlist, elist, order,
+# level
+_WORKSPACE_INTERVAL = 4 * 8 + 2 * 8
+
+
+@dataclass
+class CacheStats:
+    '''
+    Counters of a `DistributionCache`.
+
+    Parameters:
+      hits      [int]: lookups served from the cache
+      misses    [int]: lookups that built a new entry
+      evictions [int]: entries dropped to respect the size limits
+      entries   [int]: entries currently held
+      nbytes    [int]: approximate memory held by the entries, including
+                       the per-thread clones of the distributions
+    '''
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    nbytes: int = 0
+
+
+def _round(value: float, digits: int) -> float:
+    '''Round to `digits` significant digits'''
+    return float('{:.{}g}'.format(value, digits))
+
+
+class CachedDistribution(ThreadLocalDistribution):
+    '''
+    Read-only `ThreadLocalDistribution` handed out by `DistributionCache`.
+
+    One entry serves every caller asking for the same parameters, so it
+    cannot be reparameterized, fitted or closed: that would change or free
+    the distribution stored under the original key. `copy()` returns a
+    private `StableDistribution` to modify instead. Evaluation runs on a
+    clone per thread, so entries can be shared across threads.
+    '''
+
+    def _read_only(self, operation: str) -> None:
+        raise ValueError('cannot {} a cached distribution, use copy()'
+                         .format(operation))
+
+    @property
+    def dist(self) -> STABLE_DIST:
+        '''Raw `StableDist` pointer of this thread's clone, see `local`'''
+        return self.local().dist
+
+    def copy(self) -> StableDistribution:
+        '''Private, mutable `StableDistribution` with the same parameters'''
+        with self._lock:
+            return self._template.copy()
+
+    def tabulate(self, knots: int = DEFAULT_KNOTS,
+                 p_tail: float = DEFAULT_TAIL) -> TabulatedDistribution:
+        return self._template.tabulate(knots, p_tail)
+
+    def setparams(self, alpha: float, beta: float, sigma: float, mu: float,
+                  parameterization: int = 1) -> Zone:
+        self._read_only('reparameterize')
+
+    def fit(self, data: ArrayLike, method: str = DEFAULT_METHOD) -> int:
+        self._read_only('fit')
+
+    def close(self) -> None:
+        self._read_only('close')
+
+
+class DistributionCache:
+    '''
+    Bounded, thread-safe LRU cache of distributions (as read-only
+    `CachedDistribution`s), `StableTable`s and `QuantileTable`s keyed by
+    their parameters rounded to `digits` significant digits.
+
+    Tables only depend on (alpha, beta), so one table serves every
+    (sigma, mu) sharing the shape parameters. Evicted distributions are not
+    closed; they are freed once no caller holds them anymore.
+
+    The memory of a distribution grows with the threads using it, since
+    each one evaluates on its own clone. Clones are counted when entries
+    are inserted, so `max_bytes` is enforced on the next miss.
+
+    Parameters:
+      max_entries [int]: maximum number of cached objects
+      max_bytes   [int]: optional bound on their approximate memory
+      digits      [int]: significant digits of the parameter keys
+    '''
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: tp.Optional[int] = None,
+                 digits: int = DEFAULT_DIGITS):
+        if max_entries < 1:
+            raise ValueError('`max_entries` must be positive')
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.digits = digits
+        self._lock = threading.Lock()
+        self._entries: tp.OrderedDict[tuple, tp.Tuple[object, int]] = \
+            OrderedDict()
+        self._stats = CacheStats()
+
+    @staticmethod
+    def _size(value, nbytes: int) -> int:
+        if isinstance(value, CachedDistribution):
+            # The template plus one clone per thread
+            return nbytes * (1 + value.clones)
+        return nbytes
+
+    def _nbytes(self) -> int:
+        return sum(self._size(*entry) for entry in self._entries.values())
+
+    def _key(self, kind: str, alpha: float, beta: float, *params) -> tuple:
+        return (kind, _round(alpha, self.digits),
+                _round(beta, self.digits)) + tuple(
+                    _round(p, self.digits) if isinstance(p, float) else p
+                    for p in params)
+
+    def _lookup(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[0]
+
+    def _insert(self, key: tuple, value, nbytes: int):
+        with self._lock:
+            # Another thread may have built the same entry meanwhile
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry[0]
+            self._entries[key] = (value, nbytes)
+            total = self._nbytes() if self.max_bytes is not None else 0
+            while len(self._entries) > 1 and (
+                    len(self._entries) > self.max_entries
+                    or (self.max_bytes is not None
+                        and total > self.max_bytes)):
+                _, entry = self._entries.popitem(last=False)
+                total -= self._size(*entry)
+                self._stats.evictions += 1
+            return value
+
+    def get(self, alpha: float, beta: float, sigma: float, mu: float,
+            parameterization: int = 1, path=None) -> CachedDistribution:
+        '''Cached (read-only) distribution with the given parameters'''
+        key = self._key('dist', alpha, beta, sigma, mu, parameterization,
+                        path)
+        dist = self._lookup(key)
+        if dist is None:
+            dist = CachedDistribution(alpha, beta, sigma, mu,
+                                      parameterization, path)
+            nbytes = _DIST_OVERHEAD + get_it_max(path) * _WORKSPACE_INTERVAL
+            dist = self._insert(key, dist, nbytes)
+        return dist
+
+    def table(self, alpha: float, beta: float, knots: int = DEFAULT_KNOTS,
+              p_tail: float = DEFAULT_TAIL, path=None) -> StableTable:
+        '''Cached standardized `StableTable` for (alpha, beta)'''
+        key = self._key('table', alpha, beta, knots, p_tail, path)
+        table = self._lookup(key)
+        if table is None:
+            table = StableTable(alpha, beta, knots, p_tail, path)
+            table = self._insert(key, table, table.nbytes)
+        return table
+
+    def quantile_table(self, alpha: float, beta: float,
+                       knots: int = DEFAULT_QUANTILE_KNOTS,
+                       p_tail: float = DEFAULT_TAIL,
+                       path=None) -> QuantileTable:
+        '''Cached standardized `QuantileTable` for (alpha, beta)'''
+        key = self._key('qtable', alpha, beta, knots, p_tail, path)
+        table = self._lookup(key)
+        if table is None:
+            table = QuantileTable(alpha, beta, knots, p_tail, path)
+            table = self._insert(key, table, table.nbytes)
+        return table
+
+    def tabulate(self, alpha: float, beta: float, sigma: float, mu: float,
+                 parameterization: int = 1, knots: int = DEFAULT_KNOTS,
+                 p_tail: float = DEFAULT_TAIL,
+                 path=None) -> TabulatedDistribution:
+        '''Tabulated distribution built from cached dist and table'''
+        dist = self.get(alpha, beta, sigma, mu, parameterization, path)
+        table = self.table(dist.alpha, dist.beta, knots, p_tail, path)
+        return TabulatedDistribution(table, dist.sigma, dist.mu_0)
+
+    def invalidate(self, alpha: float, beta: float,
+                   sigma: tp.Optional[float] = None,
+                   mu: tp.Optional[float] = None,
+                   parameterization: tp.Optional[int] = None) -> int:
+        '''
+        Drop entries with the given shape parameters. If `sigma`, `mu` or
+        `parameterization` are given, only matching distributions are
+        dropped and tables are kept. Returns the number of entries dropped.
+        '''
+        def rounded(value):
+            return None if value is None else _round(value, self.digits)
+
+        alpha, beta = rounded(alpha), rounded(beta)
+        rest = (rounded(sigma), rounded(mu), parameterization)
+        only_dist = any(v is not None for v in rest)
+
+        def match(key: tuple) -> bool:
+            if key[1] != alpha or key[2] != beta:
+                return False
+            if key[0] in ('table', 'qtable'):
+                return not only_dist
+            return all(v is None or v == k for v, k in zip(rest, key[3:6]))
+
+        with self._lock:
+            keys = [k for k in self._entries if match(k)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        '''Drop all entries; counters are kept'''
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        '''Snapshot of the cache counters'''
+        with self._lock:
+            return CacheStats(self._stats.hits, self._stats.misses,
+                              self._stats.evictions, len(self._entries),
+                              self._nbytes())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+DEFAULT_CACHE = DistributionCache()
+
+
+def create_cached(alpha: float, beta: float, sigma: float, mu: float,
+                  parameterization: int = 1, path=None
+                  ) -> CachedDistribution:
+    '''`CachedDistribution` memoized in `DEFAULT_CACHE`'''
+    return DEFAULT_CACHE.get(alpha, beta, sigma, mu, parameterization, path)
+
+
+def tabulate_cached(alpha: float, beta: float, sigma: float, mu: float,
+                    parameterization: int = 1, knots: int = DEFAULT_KNOTS,
+                    p_tail: float = DEFAULT_TAIL,
+                    path=None) -> TabulatedDistribution:
+    '''`TabulatedDistribution` whose table is memoized in `DEFAULT_CACHE`'''
+    return DEFAULT_CACHE.tabulate(alpha, beta, sigma, mu, parameterization,
+                                  knots, p_tail, path)
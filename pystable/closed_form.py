@@ -0,0 +1,125 @@
+import math
+import typing as tp
+import numpy as np
+from statistics import NormalDist
+from pystable.stable_dist import STABLE_DIST, Zone
+
+
+# Zones with closed forms in libstable (`stable_pdf_point_GAUSS`, ...)
+CLOSED_FORM_ZONES = (Zone.GAUSS, Zone.CAUCHY, Zone.LEVY)
+
+# NumPy has no erf or inverse normal cdf, so the Gauss and Levy cdf and
+# quantiles call `math.erf`/`NormalDist.inv_cdf` per point. libstable has
+# closed forms for them too (`gsl_sf_erf`, `gsl_cdf_ugaussian_Pinv`), so
+# this only saves the ctypes call and thread start-up, which dominate up
+# to these sizes; larger arrays are left to the C path. Rational
+# approximations evaluated over whole arrays take tens of NumPy passes and
+# were no faster than libstable at any size.
+CDF_MAX_POINTS = 128
+Q_MAX_POINTS = 32
+
+_erf = np.frompyfunc(math.erf, 1, 1)
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+_NORMAL = NormalDist()
+
+
+def _ugaussian_pinv(p: float) -> float:
+    '''Standard normal quantile with the limits of `gsl_cdf_ugaussian_Pinv`'''
+    if 0.0 < p < 1.0:
+        return _NORMAL.inv_cdf(p)
+    if p == 0.0:
+        return -math.inf
+    if p == 1.0:
+        return math.inf
+    return math.nan
+
+
+_pinv = np.frompyfunc(_ugaussian_pinv, 1, 1)
+
+
+def zone(dist: STABLE_DIST) -> Zone:
+    '''Particular case of `dist` as set by `stable_setparams`'''
+    return Zone(dist.contents.ZONE)
+
+
+def _pdf(d: STABLE_DIST, x: np.ndarray, out: np.ndarray) -> bool:
+    z = (x - d.mu_0) / d.sigma
+    if d.ZONE == Zone.GAUSS:
+        np.exp(-z * z * 0.25, out=out)
+        out *= 0.5 / math.sqrt(math.pi) / d.sigma
+    elif d.ZONE == Zone.CAUCHY:
+        np.divide(1 / math.pi / d.sigma, 1 + z * z, out=out)
+    else:
+        # Support on one side of xi, mirrored for beta = -1
+        xxi = (z - d.xi) * (1.0 if d.beta > 0 else -1.0)
+        inside = xxi > 0
+        y = np.where(inside, xxi, 1.0) * d.sigma
+        np.multiply(math.sqrt(d.sigma * 0.5 / math.pi),
+                    np.exp(-d.sigma * 0.5 / y) / y ** 1.5, out=out)
+        out[~inside] = 0.0
+    return True
+
+
+def _cdf(d: STABLE_DIST, x: np.ndarray, out: np.ndarray) -> bool:
+    z = (x - d.mu_0) / d.sigma
+    if d.ZONE == Zone.CAUCHY:
+        np.arctan(z, out=out)
+        out *= 1 / math.pi
+        out += 0.5
+        return True
+    if x.size > CDF_MAX_POINTS:
+        return False
+    if d.ZONE == Zone.GAUSS:
+        out[:] = 0.5 + 0.5 * _erf(z * 0.5)
+        return True
+    if d.beta < 0:
+        # libstable's `stable_cdf_point_LEVY` returns the upper tail for
+        # beta = -1; leave that case to the C path rather than diverge
+        return False
+    xxi = z - d.xi
+    inside = xxi > 0
+    out[:] = _erfc(np.sqrt(0.5 / np.where(inside, xxi, 1.0)))
+    out[~inside] = 0.0
+    return True
+
+
+def _q(d: STABLE_DIST, p: np.ndarray, out: np.ndarray) -> bool:
+    if d.ZONE == Zone.CAUCHY:
+        np.tan(math.pi * (p - 0.5), out=out)
+        out *= d.sigma
+        out += d.mu_0
+        return True
+    if p.size > Q_MAX_POINTS or (d.ZONE == Zone.LEVY and d.beta < 0):
+        return False
+    if d.ZONE == Zone.GAUSS:
+        out[:] = _pinv(p) * (math.sqrt(2.0) * d.sigma) + d.mu_0
+    else:
+        with np.errstate(divide='ignore'):
+            out[:] = ((d.beta * _pinv(p / 2.0).astype(np.float64) ** -2.0
+                       + d.xi) * d.sigma + d.mu_0)
+    return True
+
+
+_KINDS: tp.Dict[str, tp.Callable[[STABLE_DIST, np.ndarray, np.ndarray],
+                                 bool]] = {'pdf': _pdf, 'cdf': _cdf, 'q': _q}
+
+
+def closed_form(kind: str, dist: STABLE_DIST, x: np.ndarray,
+                out: np.ndarray) -> bool:
+    '''
+    Evaluate the pdf, cdf or quantiles ('pdf', 'cdf' or 'q') of `dist` at
+    `x` into `out` with NumPy, without calling libstable, if its zone has a
+    closed form (Gauss, Cauchy or Levy). Returns False, leaving `out`
+    untouched, when the C path should be used instead: for the Gauss and
+    Levy cdf and quantiles of more than `CDF_MAX_POINTS` and `Q_MAX_POINTS`
+    points, and always for the Levy cdf and quantiles with beta = -1,
+    whose results in libstable differ from the mirrored formulas.
+
+    The formulas are those of libstable's `stable_*_point_GAUSS`,
+    `_CAUCHY` and `_LEVY` functions and of `stable_q_point`, in the
+    0-parameterization used internally.
+    '''
+    d = dist.contents
+    if d.ZONE not in CLOSED_FORM_ZONES:
+        return False
+    return _KINDS[kind](d, x, out)
@@ -0,0 +1,266 @@
+import contextlib
+import ctypes as ct
+import enum
+import math
+import threading
+import typing as tp
+from dataclasses import asdict, dataclass
+from pystable.pystable import load_libstable, wrap_function
+from pystable.stable_dist import Zone
+
+
+class Method(enum.IntEnum):
+    '''Quadrature methods, see the anonymous enum in `stable.h`'''
+    QAG2 = 0
+    QUADSTEP = 1
+    QROMBPOL = 2
+    QROMBRAT = 3
+    QNG = 4
+    QAG1 = 5
+    QAG5 = 6
+    VECT = 7
+
+
+@dataclass
+class StableConfig:
+    '''
+    Snapshot of libstable's global evaluation settings.
+
+    Parameters:
+      threads     [int]:    pthreads used by `stable_pdf`/`stable_cdf`/
+                            `stable_q` (0 => all available CPUs)
+      reltol      [float]:  relative error tolerance of the quadrature
+      abstol      [float]:  absolute error tolerance of the quadrature
+      it_max      [int]:    maximum subintervals in adaptive quadrature
+      inv_maxiter [int]:    maximum iterations of the quantile root search
+      method1     [Method]: quadrature on the main subinterval
+      method2     [Method]: quadrature on the second subinterval
+      method3     [Method]: quadrature on the third subinterval
+    '''
+    threads: int
+    reltol: float
+    abstol: float
+    it_max: int
+    inv_maxiter: int
+    method1: Method
+    method2: Method
+    method3: Method
+
+
+# field -> (libstable global, ctypes type). Order matters when setting:
+# `stable_set_relTOL` also resets METHOD1-3, so methods are set after it.
+_KNOBS = {
+    'threads': ('THREADS', ct.c_uint),
+    'reltol': ('relTOL', ct.c_double),
+    'abstol': ('absTOL', ct.c_double),
+    'it_max': ('IT_MAX', ct.c_uint),
+    'inv_maxiter': ('INV_MAXITER', ct.c_uint),
+    'method1': ('METHOD1', ct.c_int),
+    'method2': ('METHOD2', ct.c_int),
+    'method3': ('METHOD3', ct.c_int),
+}
+# THREADS, IT_MAX and INV_MAXITER are `unsigned short` in libstable: the
+# setters truncate larger values (65536 threads would become 0)
+USHRT_MAX = 65535
+
+# Serializes updates to libstable's process-wide globals
+_CONFIG_LOCK = threading.RLock()
+
+
+def c_stable_get(lib: ct.CDLL, name: str) -> ct.CDLL._FuncPtr:
+    '''Getter `stable_get_<global>` for the knob `name`'''
+    glob, ctype = _KNOBS[name]
+    return wrap_function(lib, 'stable_get_{}'.format(glob), ctype, ())
+
+
+def c_stable_set(lib: ct.CDLL, name: str) -> ct.CDLL._FuncPtr:
+    '''Setter `stable_set_<global>` for the knob `name`'''
+    glob, ctype = _KNOBS[name]
+    return wrap_function(lib, 'stable_set_{}'.format(glob), None, (ctype,))
+
+
+def get_config(path=None) -> StableConfig:
+    '''Read all libstable settings'''
+    lib = load_libstable(path)
+    values = {name: c_stable_get(lib, name)() for name in _KNOBS}
+    for name in ('method1', 'method2', 'method3'):
+        values[name] = Method(values[name])
+    return StableConfig(**values)
+
+
+def set_config(path=None, **values) -> StableConfig:
+    '''
+    Update libstable settings by field name of `StableConfig`, e.g.
+    `set_config(threads=4, reltol=1e-6)`. Returns the previous settings.
+
+    Note that `reltol` also selects default quadrature methods, so explicit
+    `method1`-`method3` values are applied after it. Distributions allocate
+    their integration workspace with the `it_max` in effect at creation;
+    raising `it_max` only benefits distributions created afterwards.
+    '''
+    unknown = set(values) - set(_KNOBS)
+    if unknown:
+        raise TypeError('unknown libstable settings: {}'
+                        .format(', '.join(sorted(unknown))))
+    for name in ('threads', 'it_max', 'inv_maxiter'):
+        if name in values and not 0 <= values[name] <= USHRT_MAX:
+            raise ValueError('`{}` must be in [0, {}]'
+                             .format(name, USHRT_MAX))
+    for name in ('reltol', 'abstol'):
+        if name in values and values[name] <= 0:
+            raise ValueError('`{}` must be positive'.format(name))
+
+    lib = load_libstable(path)
+    with _CONFIG_LOCK:
+        previous = get_config(path)
+        for name, (_, ctype) in _KNOBS.items():
+            if name in values:
+                c_stable_set(lib, name)(ctype(values[name]))
+    return previous
+
+
+@contextlib.contextmanager
+def configure(path=None, **values) -> tp.Iterator[StableConfig]:
+    '''
+    Apply libstable settings for the duration of a `with` block and restore
+    the previous ones on exit. The settings are process-wide, so they also
+    apply to other threads while the block is active.
+    '''
+    previous = set_config(path, **values)
+    try:
+        yield get_config(path)
+    finally:
+        set_config(path, **asdict(previous))
+
+
+def get_threads(path=None) -> int:
+    return c_stable_get(load_libstable(path), 'threads')()
+
+
+def set_threads(threads: int, path=None) -> None:
+    '''Set the pthreads used per evaluation call (0 => all CPUs)'''
+    set_config(path, threads=threads)
+
+
+def get_reltol(path=None) -> float:
+    return c_stable_get(load_libstable(path), 'reltol')()
+
+
+def set_reltol(reltol: float, path=None) -> None:
+    set_config(path, reltol=reltol)
+
+
+def get_abstol(path=None) -> float:
+    return c_stable_get(load_libstable(path), 'abstol')()
+
+
+def set_abstol(abstol: float, path=None) -> None:
+    set_config(path, abstol=abstol)
+
+
+def get_it_max(path=None) -> int:
+    return c_stable_get(load_libstable(path), 'it_max')()
+
+
+def set_it_max(it_max: int, path=None) -> None:
+    set_config(path, it_max=it_max)
+
+
+def get_inv_maxiter(path=None) -> int:
+    return c_stable_get(load_libstable(path), 'inv_maxiter')()
+
+
+def set_inv_maxiter(inv_maxiter: int, path=None) -> None:
+    set_config(path, inv_maxiter=inv_maxiter)
+
+
+def get_methods(path=None) -> tp.Tuple[Method, Method, Method]:
+    config = get_config(path)
+    return config.method1, config.method2, config.method3
+
+
+def set_methods(method1: Method, method2: Method, method3: Method,
+                path=None) -> None:
+    set_config(path, method1=method1, method2=method2, method3=method3)
+
+
+# libstable's integration constants AUX1 and AUX2 are process-wide globals
+# written by `stable_setparams` (and `stable_create`) and read by every pdf
+# quadrature. Their values depend on the side of alpha = 1 (on the sign of
+# beta at alpha = 1), so a distribution evaluated while another one of the
+# other side is being (re)parameterized uses the wrong constants. Zones with
+# closed forms do not use them.
+def aux_regime(zone: int, alpha: float, beta: float) -> tp.Optional[bool]:
+    '''
+    Set of AUX1/AUX2 constants a distribution in `zone` needs: True for
+    alpha > 1 (beta < 0 at alpha = 1), False for the other side and None if
+    its zone does not use them.
+    '''
+    if zone in (Zone.STABLE, Zone.STABLE_B1):
+        return alpha > 1
+    if zone in (Zone.ALPHA_1, Zone.ALPHA_1_B1):
+        return beta < 0
+    return None
+
+
+def stable_set_aux(lib: ct.CDLL, regime: bool) -> None:
+    '''Set AUX1/AUX2 as `stable_setparams` does for `regime`'''
+    reltol = c_stable_get(lib, 'reltol')()
+    low = math.log(reltol)
+    high = math.log(math.log(8.5358 / reltol) / 0.9599)
+    with _CONFIG_LOCK:
+        ct.c_double.in_dll(lib, 'AUX1').value = high if regime else low
+        ct.c_double.in_dll(lib, 'AUX2').value = low if regime else high
+
+
+class _RegimeGate:
+    '''
+    Admits concurrent calls of one AUX1/AUX2 regime (see `aux_regime`) at a
+    time: calls of the other regime wait until the running ones drain, and
+    then reset the constants for theirs. Exclusive calls (likelihood fits,
+    which reparameterize across regimes) run alone. `SETPARAMS` calls only
+    write the constants without integrating (e.g. McCulloch fits), so they
+    overlap each other but no regime. Waiting calls of another regime hold
+    back new arrivals so no side starves.
+    '''
+
+    EXCLUSIVE = 'exclusive'
+    SETPARAMS = 'setparams'
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._regime: tp.Any = None
+        self._active = 0
+        self._waiting: tp.Dict[tp.Any, int] = {}
+
+    def _admits(self, regime) -> bool:
+        if self._active == 0:
+            return True
+        others = sum(n for r, n in self._waiting.items() if r != regime)
+        return (regime == self._regime and regime != self.EXCLUSIVE
+                and others == 0)
+
+    @contextlib.contextmanager
+    def hold(self, lib: ct.CDLL, regime) -> tp.Iterator[None]:
+        if regime is None:
+            yield
+            return
+        with self._cond:
+            self._waiting[regime] = self._waiting.get(regime, 0) + 1
+            try:
+                self._cond.wait_for(lambda: self._admits(regime))
+            finally:
+                self._waiting[regime] -= 1
+            if self._active == 0 and isinstance(regime, bool):
+                stable_set_aux(lib, regime)
+            self._regime = regime
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+
+_GATE = _RegimeGate()
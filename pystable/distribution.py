@@ -0,0 +1,166 @@
+import ctypes as ct
+import typing as tp
+import numpy as np
+from pystable.pystable import (load_libstable, rnd, stable_copy, stable_create,
+                               stable_free, stable_setparams)
+from pystable.arrays import (ArrayResult, DEFAULT_ENGINE, DEFAULT_METHOD,
+                             stable_cdf_array, stable_fit_array,
+                             stable_pdf_array, stable_q_array)
+from pystable.stable_dist import STABLE_DIST, Zone
+from pystable.tabulated import (DEFAULT_KNOTS, DEFAULT_TAIL,
+                                TabulatedDistribution, tabulate)
+from pystable.utils import ArrayLike
+
+
+class StableDistribution:
+    '''
+    Stable distribution owning a libstable `StableDist` struct.
+
+    The struct (with its GSL integration workspace and random number
+    generator) is released by `close()`, on exiting a `with` block, or when
+    the object is garbage collected.
+
+    Parameters:
+      alpha            [float]: Stability index
+      beta             [float]: Skewness parameter
+      sigma            [float]: Scale parameter
+      mu               [float]: Location parameter
+      parameterization [int]:   0 or 1 (Nolan, 1997)
+      path             [str]:   Optional path to `libstable.so`
+    '''
+
+    def __init__(self, alpha: float, beta: float, sigma: float, mu: float,
+                 parameterization: int = 1, path=None):
+        self._lib = load_libstable(path)
+        self._path = path
+        self._dist = None
+        dist = stable_create(self._lib, alpha, beta, sigma, mu,
+                             parameterization)
+        if not dist:
+            raise ValueError('invalid stable parameters: alpha={}, beta={}, '
+                             'sigma={}, mu={}, parameterization={}'
+                             .format(alpha, beta, sigma, mu,
+                                     parameterization))
+        self._dist = dist
+
+    @classmethod
+    def _from_pointer(cls, lib: ct.CDLL, dist: STABLE_DIST,
+                      path=None) -> 'StableDistribution':
+        '''Take ownership of an existing `StableDist` pointer'''
+        obj = cls.__new__(cls)
+        obj._lib = lib
+        obj._path = path
+        obj._dist = dist
+        return obj
+
+    def __enter__(self) -> 'StableDistribution':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def __repr__(self) -> str:
+        if self.closed:
+            return '{}(<closed>)'.format(type(self).__name__)
+        return ('{}(alpha={!r}, beta={!r}, sigma={!r}, mu_0={!r}, mu_1={!r})'
+                .format(type(self).__name__, self.alpha, self.beta,
+                        self.sigma, self.mu_0, self.mu_1))
+
+    def close(self) -> None:
+        '''Free the underlying C struct. Safe to call more than once'''
+        dist, self._dist = getattr(self, '_dist', None), None
+        if dist:
+            stable_free(self._lib, dist)
+
+    @property
+    def closed(self) -> bool:
+        return not self._dist
+
+    @property
+    def dist(self) -> STABLE_DIST:
+        '''Raw `StableDist` pointer, for use with the functional API'''
+        if self.closed:
+            raise ValueError('operation on closed StableDistribution')
+        return self._dist
+
+    @property
+    def alpha(self) -> float:
+        return self.dist.contents.alpha
+
+    @property
+    def beta(self) -> float:
+        return self.dist.contents.beta
+
+    @property
+    def sigma(self) -> float:
+        return self.dist.contents.sigma
+
+    @property
+    def mu_0(self) -> float:
+        return self.dist.contents.mu_0
+
+    @property
+    def mu_1(self) -> float:
+        return self.dist.contents.mu_1
+
+    @property
+    def params(self) -> tp.Dict[str, float]:
+        return {'alpha': self.alpha, 'beta': self.beta, 'sigma': self.sigma,
+                'mu_0': self.mu_0, 'mu_1': self.mu_1}
+
+    def copy(self) -> 'StableDistribution':
+        '''New distribution with the same parameters, via `stable_copy`'''
+        return self._from_pointer(self._lib, stable_copy(self._lib, self.dist),
+                                  self._path)
+
+    def setparams(self, alpha: float, beta: float, sigma: float, mu: float,
+                  parameterization: int = 1) -> Zone:
+        '''
+        Reparameterize in place, recycling the workspace and generator.
+        Returns the distribution zone.
+        '''
+        zone = stable_setparams(self._lib, self.dist, alpha, beta, sigma, mu,
+                                parameterization)
+        if zone == Zone.NOVALID:
+            raise ValueError('invalid stable parameters: alpha={}, beta={}, '
+                             'sigma={}, mu={}, parameterization={}'
+                             .format(alpha, beta, sigma, mu,
+                                     parameterization))
+        return Zone(zone)
+
+    def pdf(self, x: ArrayLike, out: tp.Optional[np.ndarray] = None,
+            return_err: bool = False,
+            engine: str = DEFAULT_ENGINE) -> ArrayResult:
+        return stable_pdf_array(self._lib, self.dist, x, out,
+                                return_err=return_err, engine=engine)
+
+    def cdf(self, x: ArrayLike, out: tp.Optional[np.ndarray] = None,
+            return_err: bool = False,
+            engine: str = DEFAULT_ENGINE) -> ArrayResult:
+        return stable_cdf_array(self._lib, self.dist, x, out,
+                                return_err=return_err, engine=engine)
+
+    def ppf(self, q: ArrayLike, out: tp.Optional[np.ndarray] = None,
+            return_err: bool = False) -> ArrayResult:
+        return stable_q_array(self._lib, self.dist, q, out,
+                              return_err=return_err)
+
+    def rvs(self, size: tp.Union[int, tp.Tuple[int, ...]] = 1,
+            seed: int = None, out: tp.Optional[np.ndarray] = None
+            ) -> np.ndarray:
+        return rnd(self.dist, seed=seed, path=self._path, out=out, size=size)
+
+    def fit(self, data: ArrayLike, method: str = DEFAULT_METHOD) -> int:
+        '''
+        Fit the distribution to `data` in place with one of `FIT_METHODS`.
+        Returns the libstable status code (0 on success).
+        '''
+        return stable_fit_array(self._lib, self.dist, data, method)
+
+    def tabulate(self, knots: int = DEFAULT_KNOTS,
+                 p_tail: float = DEFAULT_TAIL) -> TabulatedDistribution:
+        '''Interpolation table for fast approximate pdf, cdf and ppf'''
+        return tabulate(self.dist, knots, p_tail, self._path)
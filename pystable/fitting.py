@@ -0,0 +1,167 @@
+import contextlib
+import os
+import time
+import typing as tp
+import numpy as np
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed)
+from dataclasses import dataclass, field
+from pystable.pystable import load_libstable, stable_create, stable_free
+from pystable.arrays import DEFAULT_METHOD, FIT_METHODS, stable_fit_array
+from pystable.config import _GATE, _RegimeGate, configure, set_config
+from pystable.utils import ArrayLike
+
+
+@dataclass(frozen=True)
+class FitPreset:
+    '''
+    Named speed/accuracy trade-off for fitting.
+
+    Parameters:
+      method [str]:  estimation method, one of `FIT_METHODS`
+      config [dict]: libstable settings applied while fitting, see
+                     `set_config`
+    '''
+    method: str
+    config: tp.Mapping[str, tp.Any] = field(default_factory=dict)
+
+
+# Roughly ordered from milliseconds to minutes per 10^4 points
+PRESETS = {
+    'fastest': FitPreset('mcculloch'),
+    'fast': FitPreset('koutrouvelis'),
+    'balanced': FitPreset('mle2d', {'reltol': 1e-6}),
+    'accurate': FitPreset('mle'),
+}
+
+
+@dataclass
+class FitResult:
+    '''
+    Outcome of fitting one series.
+
+    Parameters:
+      index   [int]:   position of the series in the input
+      status  [int]:   status code returned by libstable (0 on success)
+      alpha   [float]: fitted stability index
+      beta    [float]: fitted skewness parameter
+      sigma   [float]: fitted scale parameter
+      mu_0    [float]: fitted 0-parameterization location
+      mu_1    [float]: fitted 1-parameterization location
+      elapsed [float]: wall time of the fit in seconds
+    '''
+    index: int
+    status: int
+    alpha: float
+    beta: float
+    sigma: float
+    mu_0: float
+    mu_1: float
+    elapsed: float
+
+
+# Methods integrating the pdf while reparameterizing across alpha = 1; the
+# others only write libstable's integration constants, see `aux_regime`
+_LIKELIHOOD_METHODS = ('mle2d', 'mle', 'whole')
+
+
+def _fit_one(index: int, data: ArrayLike, method: str, path=None,
+             gated: bool = False) -> FitResult:
+    '''
+    Fit one series on a private `StableDist` workspace, within the regime
+    gate shared with `pystable.aio` if `gated` (fits on threads)
+    '''
+    lib = load_libstable(path)
+    dist = stable_create(lib, 2.0, 0.0, 1.0, 0.0, 1)
+    regime = (_RegimeGate.EXCLUSIVE if method in _LIKELIHOOD_METHODS
+              else _RegimeGate.SETPARAMS)
+    scope = _GATE.hold(lib, regime) if gated else contextlib.nullcontext()
+    try:
+        with scope:
+            start = time.perf_counter()
+            status = stable_fit_array(lib, dist, data, method)
+            elapsed = time.perf_counter() - start
+        d = dist.contents
+        return FitResult(index, status, d.alpha, d.beta, d.sigma, d.mu_0,
+                         d.mu_1, elapsed)
+    finally:
+        stable_free(lib, dist)
+
+
+def resolve_method(method: str = DEFAULT_METHOD
+                   ) -> tp.Tuple[str, tp.Mapping[str, tp.Any]]:
+    '''(method, config) for a method or preset name'''
+    if method in PRESETS:
+        return PRESETS[method].method, PRESETS[method].config
+    if method in FIT_METHODS:
+        return method, {}
+    raise ValueError('unknown fit method {!r}, expected one of {}'
+                     .format(method, ', '.join(FIT_METHODS + tuple(PRESETS))))
+
+
+def _init_worker(threads: tp.Optional[int], config: tp.Mapping[str, tp.Any],
+                 path) -> None:
+    '''Apply libstable settings in a worker process'''
+    if threads is not None:
+        config = dict(config, threads=threads)
+    set_config(path, **config)
+
+
+def _executor(executor: str, workers: int, threads: tp.Optional[int],
+              config: tp.Mapping[str, tp.Any], path) -> Executor:
+    if executor == 'process':
+        return ProcessPoolExecutor(max_workers=workers,
+                                   initializer=_init_worker,
+                                   initargs=(threads, config, path))
+    if executor == 'thread':
+        return ThreadPoolExecutor(max_workers=workers)
+    raise ValueError("`executor` must be 'process' or 'thread'")
+
+
+def fit_iter(datasets: tp.Iterable[ArrayLike], method: str = DEFAULT_METHOD,
+             workers: int = None, executor: str = 'process',
+             threads_per_worker: tp.Optional[int] = 1,
+             path=None) -> tp.Iterator[FitResult]:
+    '''
+    Fit many series concurrently, yielding each `FitResult` as soon as it
+    completes (not necessarily in input order; see `FitResult.index`).
+
+    Inputs:
+      datasets           [Iterable]: float64 series to fit
+      method             [str]:      estimation method (`FIT_METHODS`) or
+                                     preset name (`PRESETS`)
+      workers            [int]:      pool size (default: CPU count)
+      executor           [str]:      'process' or 'thread'
+      threads_per_worker [int]:      libstable threads in each worker
+                                     process (None keeps the default)
+      path               [str]:      optional path to `libstable.so`
+
+    Processes are the default: `stable_setparams` writes process-wide
+    integration constants that differ on either side of alpha = 1, so
+    concurrent fits in one process would interfere. Threads avoid pickling
+    the data, but likelihood fits ('mle2d', 'mle', 'whole') then run one at
+    a time; McCulloch and Koutrouvelis fits, which do not integrate, still
+    overlap. `elapsed` excludes the wait.
+    '''
+    method, config = resolve_method(method)
+    workers = workers or os.cpu_count() or 1
+    pool = _executor(executor, workers, threads_per_worker, config, path)
+    # Threads share the process-wide settings with the caller
+    scope = (configure(path, **config) if executor == 'thread'
+             else contextlib.nullcontext())
+    with scope, pool:
+        futures = [pool.submit(_fit_one, i, np.asarray(data, dtype=float),
+                               method, path, executor == 'thread')
+                   for i, data in enumerate(datasets)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def fit_many(datasets: tp.Iterable[ArrayLike], method: str = DEFAULT_METHOD,
+             workers: int = None, executor: str = 'process',
+             threads_per_worker: tp.Optional[int] = 1,
+             path=None) -> tp.List[FitResult]:
+    '''Fit many series concurrently; results in input order. See `fit_iter`'''
+    results = list(fit_iter(datasets, method, workers, executor,
+                            threads_per_worker, path))
+    return sorted(results, key=lambda r: r.index)
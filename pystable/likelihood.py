@@ -0,0 +1,224 @@
+import threading
+import typing as tp
+import numpy as np
+from pystable.pystable import c_stable_pdf, stable_setparams
+from pystable.distribution import StableDistribution
+from pystable.stable_dist import Zone
+from pystable import utils
+from pystable.utils import ArrayLike
+
+
+# Finite difference step relative to the natural scale of each parameter,
+# (1, 1, sigma, sigma) for (alpha, beta, sigma, mu). eps ** (1 / 3) balances
+# truncation and rounding errors of central differences.
+DEFAULT_STEP = np.finfo(np.float64).eps ** (1 / 3)
+
+
+class LogLikelihood:
+    '''
+    Stable log-likelihood of a fixed dataset, for use as an objective in
+    external optimizers.
+
+    The workspace owns a `StableDistribution` that is reparameterized in
+    place and pdf buffers sized to the data, so evaluating the likelihood
+    allocates nothing per data point. Like libstable's
+    `stable_loglikelihood`, points where the pdf underflows to 0 are
+    skipped; parameter vectors outside the valid region give -inf.
+
+    Parameter vectors are (alpha, beta, sigma, mu) rows. A single row gives
+    a scalar, a (K, 4) array gives K values evaluated in one call, e.g. the
+    vertices of a Nelder-Mead simplex.
+
+    With `weights`, each point's log pdf is multiplied by its weight, e.g.
+    the counts of binned data (see `pystable.binned`).
+
+    A workspace is not thread-safe; use one per thread.
+
+    Parameters:
+      data             [ArrayLike]: float64 sample, referenced not copied
+      parameterization [int]:       parameterization of mu, 0 or 1
+      path             [str]:       optional path to `libstable.so`
+      weights          [ArrayLike]: optional per-point weights
+    '''
+
+    def __init__(self, data: ArrayLike, parameterization: int = 0,
+                 path=None, weights: tp.Optional[ArrayLike] = None):
+        self.parameterization = parameterization
+        self.dist = StableDistribution(2.0, 0.0, 1.0, 0.0, parameterization,
+                                       path)
+        self._lib = self.dist._lib
+        self._pdf_fn = c_stable_pdf(self._lib)
+        self._stencil = np.empty((0, 4), dtype=np.float64)
+        self._pdf = np.empty(0, dtype=np.float64)
+        self.bind(data, weights)
+
+    def __enter__(self) -> 'LogLikelihood':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.dist.close()
+
+    def bind(self, data: ArrayLike,
+             weights: tp.Optional[ArrayLike] = None) -> None:
+        '''
+        Switch to a new dataset, reusing the buffers when it has the same
+        length
+        '''
+        data = utils.as_double_array(data)
+        if weights is not None:
+            weights = utils.as_double_array(weights)
+            if weights.size != data.size:
+                raise ValueError('weights has size {}, expected {}'
+                                 .format(weights.size, data.size))
+        if data.size != self._pdf.size:
+            self._pdf = np.empty(data.size, dtype=np.float64)
+            self._log = np.empty(data.size, dtype=np.float64)
+            self._mask = np.empty(data.size, dtype=np.bool_)
+            self._pdf_ptr = utils.pointer(self._pdf)
+        self.data = data
+        self.weights = weights
+        self._data_ptr = utils.pointer(data)
+
+    def _loglike(self, alpha: float, beta: float, sigma: float,
+                 mu: float) -> float:
+        zone = stable_setparams(self._lib, self.dist.dist, alpha, beta, sigma,
+                                mu, self.parameterization)
+        if zone == Zone.NOVALID:
+            return -np.inf
+        n = self._pdf.size
+        if n == 0:
+            return 0.0
+        self._pdf_fn(self.dist.dist, self._data_ptr, n, self._pdf_ptr, None)
+        np.greater(self._pdf, 0.0, out=self._mask)
+        self._log.fill(0.0)
+        np.log(self._pdf, out=self._log, where=self._mask)
+        if self.weights is not None:
+            return float(np.dot(self._log, self.weights))
+        return float(self._log.sum())
+
+    def __call__(self, params: ArrayLike,
+                 out: tp.Optional[np.ndarray] = None
+                 ) -> tp.Union[float, np.ndarray]:
+        '''
+        Log-likelihood of one parameter vector, or of every row of a (K, 4)
+        array (written into `out` if given)
+        '''
+        params = np.asarray(params, dtype=np.float64)
+        if params.ndim == 1:
+            return self._loglike(*_check_rows(params[None])[0])
+        rows = _check_rows(params)
+        out = utils.output_array(out, len(rows), 'out')
+        for k, row in enumerate(rows):
+            out[k] = self._loglike(*row)
+        return out
+
+    def gradient(self, params: ArrayLike, step: float = DEFAULT_STEP,
+                 return_value: bool = False
+                 ) -> tp.Union[np.ndarray, tp.Tuple[tp.Any, np.ndarray]]:
+        '''
+        Finite difference gradient of the log-likelihood with respect to
+        (alpha, beta, sigma, mu), for one parameter vector or each row of
+        a (K, 4) array.
+
+        Central differences are used where both neighbours are valid and
+        one-sided differences at the boundary of the parameter space (e.g.
+        alpha = 2 or |beta| = 1); components without a valid neighbour are
+        NaN. All 9 evaluations per row are done in one batch.
+
+        Inputs:
+          params       [ArrayLike]: (4,) or (K, 4) parameter vectors
+          step         [float]:     step relative to (1, 1, sigma, sigma)
+          return_value [bool]:      also return the log-likelihood itself
+
+        Outputs:
+          [np.ndarray]:             gradient, shaped like `params`, or
+                                    (value, gradient) if requested
+        '''
+        params = np.asarray(params, dtype=np.float64)
+        single = params.ndim == 1
+        rows = _check_rows(params[None] if single else params)
+        k = len(rows)
+
+        # Stencil layout per row: centre, then (+h_i, -h_i) for each i
+        if self._stencil.shape[0] < 9 * k:
+            self._stencil = np.empty((9 * k, 4), dtype=np.float64)
+        stencil = self._stencil[:9 * k].reshape(k, 9, 4)
+        h = step * np.column_stack((np.ones(k), np.ones(k), rows[:, 2],
+                                    rows[:, 2]))
+        stencil[:] = rows[:, None, :]
+        for i in range(4):
+            stencil[:, 1 + 2 * i, i] += h[:, i]
+            stencil[:, 2 + 2 * i, i] -= h[:, i]
+        values = self(stencil.reshape(-1, 4)).reshape(k, 9)
+
+        f0 = values[:, 0]
+        fp = values[:, 1::2]
+        fm = values[:, 2::2]
+        ok_p = np.isfinite(fp)
+        ok_m = np.isfinite(fm)
+        with np.errstate(invalid='ignore'):
+            grad = np.where(ok_p & ok_m, (fp - fm) / (2 * h),
+                            np.where(ok_p, (fp - f0[:, None]) / h,
+                                     np.where(ok_m, (f0[:, None] - fm) / h,
+                                              np.nan)))
+        if single:
+            grad, f0 = grad[0], float(f0[0])
+        if return_value:
+            return f0, grad
+        return grad
+
+
+def _check_rows(params: np.ndarray) -> np.ndarray:
+    if params.ndim != 2 or params.shape[1] != 4:
+        raise ValueError('parameters must be (alpha, beta, sigma, mu) '
+                         'vectors, got shape {}'.format(params.shape))
+    return params
+
+
+# Per-thread workspaces of `loglikelihood`, keyed by (parameterization, path)
+_WORKSPACES = threading.local()
+
+
+def loglikelihood(params: ArrayLike, data: ArrayLike,
+                  parameterization: int = 0, gradient: bool = False,
+                  step: float = DEFAULT_STEP, path=None
+                  ) -> tp.Union[float, np.ndarray,
+                                tp.Tuple[tp.Any, np.ndarray]]:
+    '''
+    Log-likelihood of `data` under one or more (alpha, beta, sigma, mu)
+    parameter vectors, optionally with its finite difference gradient.
+
+    Reuses a per-thread `LogLikelihood` workspace, so repeated calls with
+    data of the same length do not allocate buffers. For tight loops over a
+    fixed dataset, hold a `LogLikelihood` directly.
+
+    Inputs:
+      params           [ArrayLike]: (4,) or (K, 4) parameter vectors
+      data             [ArrayLike]: float64 sample
+      parameterization [int]:       parameterization of mu, 0 or 1
+      gradient         [bool]:      also return the gradient
+      step             [float]:     relative finite difference step
+      path             [str]:       optional path to `libstable.so`
+
+    Outputs:
+      [float | np.ndarray]:         log-likelihood(s), or (value, gradient)
+    '''
+    cache = getattr(_WORKSPACES, 'cache', None)
+    if cache is None:
+        cache = _WORKSPACES.cache = {}
+    key = (parameterization, path)
+    workspace = cache.get(key)
+    if workspace is None:
+        workspace = cache[key] = LogLikelihood(data, parameterization, path)
+    else:
+        workspace.bind(data)
+    try:
+        if gradient:
+            return workspace.gradient(params, step, return_value=True)
+        return workspace(params)
+    finally:
+        # Keep the buffers but not the caller's data
+        workspace.data = workspace.weights = workspace._data_ptr = None
@@ -0,0 +1,246 @@
+import contextlib
+import threading
+import time
+import typing as tp
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+import numpy as np
+from pystable.stable_dist import STABLE_DIST, Zone
+
+
+# Upper bounds of the latency histogram buckets [s]; a last bucket counts
+# the slower calls
+LATENCY_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+# Upper bounds of the batch size histogram buckets [points]
+BATCH_BUCKETS = (1, 10, 100, 1000, 10_000, 100_000, 1_000_000)
+# Distinct distributions tracked before the others are pooled under
+# `OTHER`, so that refitted parameters cannot grow the metrics unbounded
+MAX_DISTRIBUTIONS = 1024
+OTHER = 'other'
+# Significant digits of the parameters in distribution labels
+DEFAULT_DIGITS = 6
+
+# Read by the instrumented wrappers on every call; set with `enable`
+ENABLED = False
+
+_LOCK = threading.Lock()
+
+
+@dataclass
+class CallEvent:
+    '''
+    One instrumented call, as passed to the callbacks.
+
+    Parameters:
+      function     [str]:   wrapper name, e.g. 'pdf_array', with the engine
+                            or fit method in brackets, e.g.
+                            'pdf_array[vector]'
+      distribution [str]:   distribution label, see `distribution_label`
+      zone         [str]:   `Zone` name of the distribution
+      points       [int]:   points evaluated (or samples drawn or fitted)
+      seconds      [float]: wall time of the call
+      err_max      [float]: largest finite error estimate (nan if none)
+      err_sum      [float]: sum of the finite error estimates
+      err_rel_max  [float]: largest error estimate relative to its value
+      err_points   [int]:   points with a finite error estimate
+    '''
+    function: str
+    distribution: str
+    zone: str
+    points: int
+    seconds: float
+    err_max: float = float('nan')
+    err_sum: float = 0.0
+    err_rel_max: float = float('nan')
+    err_points: int = 0
+
+
+def _buckets(bounds: tp.Sequence[float]) -> tp.List[int]:
+    return [0] * (len(bounds) + 1)
+
+
+@dataclass
+class Metrics:
+    '''
+    Aggregated metrics of one function or distribution.
+
+    Parameters:
+      calls       [int]:       instrumented calls
+      points      [int]:       points over all calls
+      seconds     [float]:     total wall time
+      latency     [list]:      calls per `LATENCY_BUCKETS` bucket
+      batch       [list]:      calls per `BATCH_BUCKETS` bucket
+      zones       [dict]:      calls per `Zone` name
+      err_points  [int]:       points with a finite error estimate
+      err_sum     [float]:     sum of their error estimates
+      err_max     [float]:     largest error estimate
+      err_rel_max [float]:     largest error estimate relative to its value
+    '''
+    calls: int = 0
+    points: int = 0
+    seconds: float = 0.0
+    latency: tp.List[int] = field(
+        default_factory=lambda: _buckets(LATENCY_BUCKETS))
+    batch: tp.List[int] = field(
+        default_factory=lambda: _buckets(BATCH_BUCKETS))
+    zones: tp.Dict[str, int] = field(default_factory=dict)
+    err_points: int = 0
+    err_sum: float = 0.0
+    err_max: float = 0.0
+    err_rel_max: float = 0.0
+
+    def add(self, event: CallEvent) -> None:
+        self.calls += 1
+        self.points += event.points
+        self.seconds += event.seconds
+        self.latency[bisect_left(LATENCY_BUCKETS, event.seconds)] += 1
+        self.batch[bisect_left(BATCH_BUCKETS, event.points)] += 1
+        self.zones[event.zone] = self.zones.get(event.zone, 0) + 1
+        if event.err_points:
+            self.err_points += event.err_points
+            self.err_sum += event.err_sum
+            self.err_max = max(self.err_max, event.err_max)
+            if event.err_rel_max == event.err_rel_max:
+                self.err_rel_max = max(self.err_rel_max, event.err_rel_max)
+
+
+_FUNCTIONS: tp.Dict[str, Metrics] = {}
+_DISTRIBUTIONS: tp.Dict[str, Metrics] = {}
+_CALLBACKS: tp.List[tp.Callable[[CallEvent], None]] = []
+
+
+def enable(callback: tp.Optional[tp.Callable[[CallEvent], None]] = None
+           ) -> None:
+    '''
+    Start recording metrics, optionally passing every `CallEvent` to
+    `callback` as well (see `add_callback`).
+
+    While enabled, wrappers called without an `err` buffer allocate one so
+    that libstable's error estimates can be summarized.
+    '''
+    global ENABLED
+    if callback is not None:
+        add_callback(callback)
+    ENABLED = True
+
+
+def disable() -> None:
+    '''Stop recording metrics. Recorded metrics are kept until `reset`'''
+    global ENABLED
+    ENABLED = False
+
+
+def is_enabled() -> bool:
+    return ENABLED
+
+
+def reset() -> None:
+    '''Drop all recorded metrics. Callbacks are kept'''
+    with _LOCK:
+        _FUNCTIONS.clear()
+        _DISTRIBUTIONS.clear()
+
+
+def add_callback(callback: tp.Callable[[CallEvent], None]) -> None:
+    '''
+    Call `callback(event)` after every instrumented call, e.g. to observe a
+    Prometheus histogram. Callbacks run on the calling thread, outside the
+    metrics lock.
+    '''
+    with _LOCK:
+        _CALLBACKS.append(callback)
+
+
+def remove_callback(callback: tp.Callable[[CallEvent], None]) -> None:
+    with _LOCK:
+        _CALLBACKS.remove(callback)
+
+
+@contextlib.contextmanager
+def recording(callback: tp.Optional[tp.Callable[[CallEvent], None]] = None
+              ) -> tp.Iterator[None]:
+    '''
+    Record metrics for the duration of a `with` block, restoring the
+    previous state (and removing `callback`) on exit. Metrics are
+    process-wide, so calls from other threads are recorded too.
+    '''
+    previous = ENABLED
+    enable(callback)
+    try:
+        yield
+    finally:
+        if callback is not None:
+            remove_callback(callback)
+        if not previous:
+            disable()
+
+
+def snapshot() -> tp.Dict[str, tp.Any]:
+    '''
+    Recorded metrics as plain dicts, per function and per distribution,
+    along with the histogram bucket bounds.
+    '''
+    with _LOCK:
+        return {
+            'enabled': ENABLED,
+            'latency_buckets': list(LATENCY_BUCKETS),
+            'batch_buckets': list(BATCH_BUCKETS),
+            'functions': {k: asdict(v) for k, v in _FUNCTIONS.items()},
+            'distributions': {k: asdict(v)
+                              for k, v in _DISTRIBUTIONS.items()},
+        }
+
+
+def distribution_label(dist: STABLE_DIST,
+                       digits: int = DEFAULT_DIGITS) -> str:
+    '''Label of `dist` in the metrics: its parameters to `digits` digits'''
+    d = dist.contents
+    return 'alpha={:.{n}g} beta={:.{n}g} sigma={:.{n}g} mu={:.{n}g}'.format(
+        d.alpha, d.beta, d.sigma, d.mu_0, n=digits)
+
+
+def _zone(dist: STABLE_DIST) -> str:
+    try:
+        return Zone(dist.contents.ZONE).name
+    except ValueError:
+        return str(dist.contents.ZONE)
+
+
+def start() -> tp.Optional[float]:
+    '''Start time of an instrumented call, or None if metrics are off'''
+    return time.perf_counter() if ENABLED else None
+
+
+def record(function: str, dist: STABLE_DIST, points: int, started: float,
+           out: tp.Optional[np.ndarray] = None,
+           err: tp.Optional[np.ndarray] = None) -> None:
+    '''
+    Record a call of `function` on `dist` that started at `started` (see
+    `start`), summarizing the error estimates `err` of the values `out`.
+    '''
+    event = CallEvent(function, distribution_label(dist), _zone(dist),
+                      points, time.perf_counter() - started)
+    if err is not None and err.size:
+        finite = np.isfinite(err)
+        event.err_points = int(np.count_nonzero(finite))
+        if event.err_points:
+            e = np.abs(err[finite])
+            event.err_max = float(e.max())
+            event.err_sum = float(e.sum())
+            if out is not None:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    rel = e / np.abs(out[finite])
+                rel = rel[np.isfinite(rel)]
+                if rel.size:
+                    event.err_rel_max = float(rel.max())
+
+    with _LOCK:
+        _FUNCTIONS.setdefault(function, Metrics()).add(event)
+        label = event.distribution
+        if (label not in _DISTRIBUTIONS
+                and len(_DISTRIBUTIONS) >= MAX_DISTRIBUTIONS):
+            label = OTHER
+        _DISTRIBUTIONS.setdefault(label, Metrics()).add(event)
+        callbacks = tuple(_CALLBACKS)
+    for callback in callbacks:
+        callback(event)
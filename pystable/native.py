@@ -0,0 +1,41 @@
+import ctypes as ct
+import os
+import typing as tp
+
+try:
+    from pystable import _native
+except ImportError:  # not built, see `build.py`
+    _native = None
+
+
+# Whether the compiled binding `pystable._native` is available. It is
+# built from the libstable sources by `build.py` and exports libstable's C
+# API as well, so it is loaded by `load_libstable` in place of the
+# prebuilt `libstable.so` and its functions replace the ctypes calls of
+# the array, `rnd` and fit wrappers on that library.
+AVAILABLE = _native is not None
+
+# libstable functions with a native counterpart, which takes the address
+# of the `StableDist` and float64 buffers instead of ctypes arguments
+FUNCTIONS = ('stable_pdf', 'stable_cdf', 'stable_q', 'stable_pdf_v',
+             'stable_cdf_v', 'stable_rnd', 'stable_fit',
+             'stable_fit_koutrouvelis', 'stable_fit_mle')
+
+_PATH = os.path.realpath(_native.__file__) if AVAILABLE else None
+
+
+def library_path() -> tp.Optional[str]:
+    '''Path of the compiled binding, or None if it is not built'''
+    return _PATH
+
+
+def is_native(lib: ct.CDLL) -> bool:
+    '''Whether `lib` is the compiled binding loaded as a library'''
+    return _PATH is not None and os.path.realpath(lib._name) == _PATH
+
+
+def function(lib: ct.CDLL, funcname: str) -> tp.Optional[tp.Callable]:
+    '''Native counterpart of `funcname` in `lib`, if any'''
+    if funcname in FUNCTIONS and is_native(lib):
+        return getattr(_native, funcname)
+    return None
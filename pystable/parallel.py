@@ -0,0 +1,97 @@
+import os
+import ctypes as ct
+import typing as tp
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from pystable.pystable import (load_libstable, stable_copy, stable_free,
+                               stable_rnd, stable_rnd_seed)
+from pystable.stable_dist import STABLE_DIST
+from pystable import utils
+
+
+# Samples per substream. The output is split into blocks of this size
+# independently of the number of workers, which is what keeps results
+# bit-identical for any worker count.
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+
+def substream_seeds(seed: int, n: int) -> np.ndarray:
+    '''
+    Split `seed` into `n` independent 32-bit seeds, one per substream.
+
+    Seeds are derived with `numpy.random.SeedSequence`, so substream `i` of
+    a given `seed` is always the same and can be handed to any thread or
+    process (e.g. `stable_rnd_seed(lib, dist, seeds[i])`).
+    '''
+    children = np.random.SeedSequence(seed).spawn(n)
+    return np.array([c.generate_state(1, dtype=np.uint32)[0]
+                     for c in children], dtype=np.uint32)
+
+
+def rnd_parallel(dist: STABLE_DIST, n: int = None, seed: int = 0,
+                 workers: int = None, path=None, out: np.ndarray = None,
+                 size: tp.Union[int, tp.Tuple[int, ...]] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE) -> np.ndarray:
+    lib = load_libstable(path)
+    return stable_rnd_parallel(lib, dist, n, seed, workers, out, size,
+                               block_size)
+
+
+def stable_rnd_parallel(lib: ct.CDLL, dist: STABLE_DIST, n: int = None,
+                        seed: int = 0, workers: int = None,
+                        out: np.ndarray = None,
+                        size: tp.Union[int, tp.Tuple[int, ...]] = None,
+                        block_size: int = DEFAULT_BLOCK_SIZE
+                        ) -> np.ndarray:
+    '''
+    Draw samples from `dist` on several threads. ctypes releases the GIL
+    during `stable_rnd`, so the threads run concurrently.
+
+    The output is cut into blocks of `block_size` samples, each generated
+    from its own substream of `seed` (see `substream_seeds`). Every worker
+    samples from a private copy of `dist`, so the shared generator inside
+    `dist` is neither used nor advanced. For a given `seed` and
+    `block_size` the result does not depend on `workers`.
+
+    Inputs:
+      lib        [ct.CDLL]:     libstable dynamically linked library
+      dist       [STABLE_DIST]: pointer to `StableDist` struct
+      n          [int]:         number of samples (ignored if `size` given)
+      seed       [int]:         root seed split into per-block substreams
+      workers    [int]:         worker threads (default: CPU count)
+      out        [np.ndarray]:  optional C-contiguous float64 buffer to fill
+      size       [int | tuple]: output shape, e.g. `(sims, steps)`
+      block_size [int]:         samples per substream
+
+    Outputs:
+        [np.ndarray]:           samples with shape `size` (or `out.shape`)
+    '''
+    if block_size < 1:
+        raise ValueError('`block_size` must be positive')
+    shape = utils.sample_shape(n, size, out)
+    count = int(np.prod(shape))
+
+    out = utils.output_array(out, count, 'out')
+    flat = out.reshape(-1)
+    blocks = -(-count // block_size)
+    seeds = substream_seeds(seed, blocks)
+    workers = min(workers or os.cpu_count() or 1, max(blocks, 1))
+
+    def work(worker: int) -> None:
+        local = stable_copy(lib, dist)
+        try:
+            for b in range(worker, blocks, workers):
+                start = b * block_size
+                stop = min(start + block_size, count)
+                stable_rnd_seed(lib, local, int(seeds[b]))
+                stable_rnd(lib, local, stop - start, flat[start:stop])
+        finally:
+            stable_free(lib, local)
+
+    if workers == 1:
+        work(0)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(work, w) for w in range(workers)]:
+                future.result()
+    return out.reshape(shape)
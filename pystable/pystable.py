@@ -1,33 +1,76 @@
 import ctypes as ct
+import threading
 import typing as tp
+import numpy as np
 from pystable.stable_dist import STABLE_DIST
-from pystable import utils
+from pystable.closed_form import CLOSED_FORM_ZONES, closed_form
+from pystable import metrics, native, utils
+
+
+# Process-wide registry of loaded libraries and bound C functions. Loading a
+# shared library and setting `restype`/`argtypes` is costly compared to the
+# C calls themselves, so both are done once and reused by every wrapper.
+_REGISTRY_LOCK = threading.Lock()
+_LIBRARIES: tp.Dict[tp.Optional[str], ct.CDLL] = {}
+_FUNCTIONS: tp.Dict[tp.Tuple[int, str, tp.Any, tp.Tuple[tp.Any, ...]],
+                    ct.CDLL._FuncPtr] = {}
 
 
 def load_libstable(libstable_path=None) -> ct.CDLL:
     '''
-    Load the C libstable DLL
+    Load the C libstable DLL. The library is loaded once per path and cached
+    for the lifetime of the process.
     Inputs:
         libstable_path [str]: Optional path to `libstable.so`. Default path is
                               `pystable/_extensions/libstable.so`
     Outputs:
         [ct.CDLL]:            Dynamically linked libstable library
     '''
-    if libstable_path:
-        return ct.cdll.LoadLibrary(libstable_path)
-    else:
-        return ct.cdll.LoadLibrary(utils.libstable_path())
+    lib = _LIBRARIES.get(libstable_path)
+    if lib is not None:
+        return lib
+
+    with _REGISTRY_LOCK:
+        lib = _LIBRARIES.get(libstable_path)
+        if lib is None:
+            path = libstable_path or utils.libstable_path()
+            lib = ct.cdll.LoadLibrary(path)
+            _LIBRARIES[libstable_path] = lib
+    return lib
 
 
 def wrap_function(lib: ct.CDLL, funcname: str, restype, argtypes
                   ) -> ct.CDLL._FuncPtr:
-    '''Wrap ctypes functions'''
-    func = lib.__getattr__(funcname)
-    func.restype = restype
-    func.argtypes = argtypes
+    '''
+    Wrap ctypes functions. Each function is bound once per library handle
+    and signature; subsequent calls with the same `restype` and `argtypes`
+    return the cached function pointer.
+    '''
+    key = (lib._handle, funcname, restype, tuple(argtypes))
+    func = _FUNCTIONS.get(key)
+    if func is not None:
+        return func
+
+    with _REGISTRY_LOCK:
+        func = _FUNCTIONS.get(key)
+        if func is None:
+            # A new pointer per signature: `lib.<funcname>` is shared
+            func = lib[funcname]
+            func.restype = restype
+            func.argtypes = argtypes
+            # Called instead of `func` by the wrappers, see `native`
+            func.native = native.function(lib, funcname)
+            _FUNCTIONS[key] = func
     return func
 
 
+def clear_registry() -> None:
+    '''Drop all cached libraries and bound functions'''
+    with _REGISTRY_LOCK:
+        _LIBRARIES.clear()
+        _FUNCTIONS.clear()
+
+
 def create(alpha: float, beta: float, sigma: float, mu: float,
            parameterization: int, path=None) -> STABLE_DIST:
     lib = load_libstable(path)
@@ -77,6 +120,102 @@ def c_stable_checkparams(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
     return wrap_function(lib, 'stable_checkparams', ret, args)
 
 
+def setparams(dist: STABLE_DIST, alpha: float, beta: float, sigma: float,
+              mu: float, parameterization: int, path=None) -> int:
+    lib = load_libstable(path)
+    return stable_setparams(lib, dist, alpha, beta, sigma, mu,
+                            parameterization)
+
+
+def stable_setparams(lib: ct.CDLL, dist: STABLE_DIST, alpha: float,
+                     beta: float, sigma: float, mu: float,
+                     parameterization: int) -> int:
+    '''
+    Reparameterize `dist` in place, keeping its workspace and generator.
+    Returns the distribution zone, or -1 (and leaves `dist` untouched) if
+    the parameters are not valid.
+    '''
+    c_fn = c_stable_setparams(lib)
+    return c_fn(dist, alpha, beta, sigma, mu, parameterization)
+
+
+def c_stable_setparams(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    args = (ct.POINTER(STABLE_DIST), ct.c_double, ct.c_double, ct.c_double,
+            ct.c_double, ct.c_int)
+    ret = ct.c_int
+    return wrap_function(lib, 'stable_setparams', ret, args)
+
+
+def copy(dist: STABLE_DIST, path=None) -> STABLE_DIST:
+    lib = load_libstable(path)
+    return stable_copy(lib, dist)
+
+
+def stable_copy(lib: ct.CDLL, dist: STABLE_DIST) -> STABLE_DIST:
+    '''
+    Create a new `StableDist` with the parameters of `dist` and its own
+    integration workspace and random number generator.
+    '''
+    c_fn = c_stable_copy(lib)
+    return c_fn(dist)
+
+
+def c_stable_copy(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    args = (ct.POINTER(STABLE_DIST),)
+    ret = ct.POINTER(STABLE_DIST)
+    return wrap_function(lib, 'stable_copy', ret, args)
+
+
+def free(dist: STABLE_DIST, path=None) -> None:
+    lib = load_libstable(path)
+    return stable_free(lib, dist)
+
+
+def stable_free(lib: ct.CDLL, dist: STABLE_DIST) -> None:
+    '''Release `dist`, its integration workspace and its generator'''
+    c_fn = c_stable_free(lib)
+    return c_fn(dist)
+
+
+def c_stable_free(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    args = (ct.POINTER(STABLE_DIST),)
+    ret = None
+    return wrap_function(lib, 'stable_free', ret, args)
+
+
+def _closed_form_list(kind: str, dist: STABLE_DIST, x: tp.List[float],
+                      n: int) -> tp.Optional[tp.List[float]]:
+    '''Closed-form values for Gauss, Cauchy and Levy, see `closed_form`'''
+    if dist.contents.ZONE not in CLOSED_FORM_ZONES:
+        return None
+    x = np.array(x[:n], dtype=np.float64)
+    out = np.empty(n, dtype=np.float64)
+    if n > 0 and closed_form(kind, dist, x, out):
+        return out.tolist()
+    return None
+
+
+def _evaluate_list(kind: str, c_fn: ct.CDLL._FuncPtr, dist: STABLE_DIST,
+                   x: tp.List[float], n: int) -> tp.List[float]:
+    '''
+    Run one of the `stable_pdf`/`stable_cdf`/`stable_q` array functions on
+    a list, or its closed form, recording `metrics` if enabled
+    '''
+    started = metrics.start()
+    values = _closed_form_list(kind, dist, x, n)
+    err = None
+    if values is None:
+        array_type = ct.c_double * n
+        out = array_type()
+        err = array_type() if started is not None else utils.LP_c_double()
+        c_fn(dist, array_type(*x), n, out, err)
+        values = list(out)
+    if started is not None:
+        metrics.record(kind, dist, n, started, np.array(values),
+                       None if err is None else np.array(err))
+    return values
+
+
 def cdf(dist: STABLE_DIST, x: tp.List[float], Nx: int,
         path=None) -> tp.List[float]:
     lib = load_libstable(path)
@@ -85,12 +224,7 @@ def cdf(dist: STABLE_DIST, x: tp.List[float], Nx: int,
 
 def stable_cdf(lib: ct.CDLL, dist: STABLE_DIST, x: tp.List[float],
                Nx: int) -> tp.List[float]:
-    c_fn = c_stable_cdf(lib)
-    array_type = ct.c_double * Nx
-    LP_c_double = ct.POINTER(ct.c_double)
-    cdf = (ct.c_double * Nx)()
-    c_fn(dist, array_type(*x), Nx, cdf, LP_c_double())
-    return list(cdf)
+    return _evaluate_list('cdf', c_stable_cdf(lib), dist, x, Nx)
 
 
 def c_stable_cdf(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
@@ -100,6 +234,13 @@ def c_stable_cdf(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
     return wrap_function(lib, 'stable_cdf', ret, args)
 
 
+def c_stable_cdf_v(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    args = (ct.POINTER(STABLE_DIST), ct.POINTER(ct.c_double), ct.c_uint,
+            ct.POINTER(ct.c_double), ct.POINTER(ct.c_double))
+    ret = ct.c_void_p
+    return wrap_function(lib, 'stable_cdf_v', ret, args)
+
+
 def cdf_point(dist: STABLE_DIST, x: float, path=None) -> float:
     lib = load_libstable(path)
     return stable_cdf_point(lib, dist, x)
@@ -136,6 +277,82 @@ def c_stable_fit(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
     return wrap_function(lib, 'stable_fit', ret, args)
 
 
+def c_stable_fit_init(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    '''McCulloch quantile estimator, also used to start the other methods'''
+    args = (ct.POINTER(STABLE_DIST), ct.POINTER(ct.c_double), ct.c_uint,
+            ct.POINTER(ct.c_double), ct.POINTER(ct.c_double))
+    ret = None
+    return wrap_function(lib, 'stable_fit_init', ret, args)
+
+
+def c_stable_fit_koutrouvelis(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    args = (ct.POINTER(STABLE_DIST), ct.POINTER(ct.c_double), ct.c_uint)
+    ret = ct.c_int
+    return wrap_function(lib, 'stable_fit_koutrouvelis', ret, args)
+
+
+def c_stable_fit_mle(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    args = (ct.POINTER(STABLE_DIST), ct.POINTER(ct.c_double), ct.c_uint)
+    ret = ct.c_int
+    return wrap_function(lib, 'stable_fit_mle', ret, args)
+
+
+def c_stable_fit_mle2d(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    args = (ct.POINTER(STABLE_DIST), ct.POINTER(ct.c_double), ct.c_uint)
+    ret = ct.c_int
+    return wrap_function(lib, 'stable_fit_mle2d', ret, args)
+
+
+def c_stable_fit_iter(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    '''
+    ML estimation of alpha and beta starting from the parameters currently
+    in the dist, with sigma and mu from McCulloch's `nu_c` and `nu_z`.
+    '''
+    args = (ct.POINTER(STABLE_DIST), ct.POINTER(ct.c_double), ct.c_uint,
+            ct.c_double, ct.c_double)
+    ret = ct.c_int
+    return wrap_function(lib, 'stable_fit_iter', ret, args)
+
+
+def c_stab(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    '''
+    McCulloch estimator on sorted data: (x, n, symm, *alpha, *beta, *c,
+    *zeta). Only reads the 5%, 25%, 50%, 75% and 95% order statistics.
+    '''
+    LP_c_double = ct.POINTER(ct.c_double)
+    args = (LP_c_double, ct.c_uint, ct.c_uint, LP_c_double, LP_c_double,
+            LP_c_double, LP_c_double)
+    ret = ct.c_int
+    return wrap_function(lib, 'stab', ret, args)
+
+
+def c_cztab(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    '''Interquartile range and median of sorted data: (x, n, *cn, *zn)'''
+    LP_c_double = ct.POINTER(ct.c_double)
+    args = (LP_c_double, ct.c_uint, LP_c_double, LP_c_double)
+    ret = None
+    return wrap_function(lib, 'cztab', ret, args)
+
+
+def c_czab(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    '''
+    McCulloch sigma and mu for given alpha and beta:
+    (alpha, beta, cn, q50, *c, *zeta)
+    '''
+    LP_c_double = ct.POINTER(ct.c_double)
+    args = (ct.c_double, ct.c_double, ct.c_double, ct.c_double, LP_c_double,
+            LP_c_double)
+    ret = None
+    return wrap_function(lib, 'czab', ret, args)
+
+
+def c_stable_loglikelihood(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    '''Sum of log pdf over the data, skipping points where the pdf is 0'''
+    args = (ct.POINTER(STABLE_DIST), ct.POINTER(ct.c_double), ct.c_uint)
+    ret = ct.c_double
+    return wrap_function(lib, 'stable_loglikelihood', ret, args)
+
+
 def pdf(dist: STABLE_DIST, x: tp.List[float], Nx: int,
         path=None) -> tp.List[float]:
     lib = load_libstable(path)
@@ -144,12 +361,7 @@ def pdf(dist: STABLE_DIST, x: tp.List[float], Nx: int,
 
 def stable_pdf(lib: ct.CDLL, dist: STABLE_DIST, x: tp.List[float],
                Nx: int) -> tp.List[float]:
-    c_fn = c_stable_pdf(lib)
-    array_type = ct.c_double * Nx
-    LP_c_double = ct.POINTER(ct.c_double)
-    pdf = (ct.c_double * Nx)()
-    c_fn(dist, array_type(*x), Nx, pdf, LP_c_double())
-    return list(pdf)
+    return _evaluate_list('pdf', c_stable_pdf(lib), dist, x, Nx)
 
 
 def c_stable_pdf(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
@@ -159,6 +371,13 @@ def c_stable_pdf(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
     return wrap_function(lib, 'stable_pdf', ret, args)
 
 
+def c_stable_pdf_v(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
+    args = (ct.POINTER(STABLE_DIST), ct.POINTER(ct.c_double), ct.c_uint,
+            ct.POINTER(ct.c_double), ct.POINTER(ct.c_double))
+    ret = ct.c_void_p
+    return wrap_function(lib, 'stable_pdf_v', ret, args)
+
+
 def q(dist: STABLE_DIST, q: tp.List[float], Nq: int,
       path=None) -> tp.List[float]:
     lib = load_libstable(path)
@@ -167,12 +386,7 @@ def q(dist: STABLE_DIST, q: tp.List[float], Nq: int,
 
 def stable_q(lib: ct.CDLL, dist: STABLE_DIST, q: tp.List[float],
              Nq: int) -> tp.List[float]:
-    c_fn = c_stable_q(lib)
-    array_type = ct.c_double * Nq
-    LP_c_double = ct.POINTER(ct.c_double)
-    inv = (ct.c_double * Nq)()
-    c_fn(dist, array_type(*q), Nq, inv, LP_c_double())
-    return list(inv)
+    return _evaluate_list('q', c_stable_q(lib), dist, q, Nq)
 
 
 def c_stable_q(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
@@ -182,12 +396,36 @@ def c_stable_q(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
     return wrap_function(lib, 'stable_q', ret, args)
 
 
-def rnd(dist: STABLE_DIST, n: int, seed: int = None,
-        path=None) -> tp.List[float]:
+def rnd(dist: STABLE_DIST, n: int = None, seed: int = None, path=None,
+        out: np.ndarray = None,
+        size: tp.Union[int, tp.Tuple[int, ...]] = None) -> np.ndarray:
+    '''
+    Draw random samples from `dist` with a single `stable_rnd` call.
+
+    Inputs:
+      dist  [STABLE_DIST]:  pointer to `StableDist` struct
+      n     [int]:          number of samples (ignored if `size` is given)
+      seed  [int]:          optional seed for the distribution's generator
+      path  [str]:          optional path to `libstable.so`
+      out   [np.ndarray]:   optional C-contiguous float64 buffer to fill
+      size  [int | tuple]:  output shape, e.g. `(sims, steps)`
+
+    Outputs:
+        [np.ndarray]:       samples with shape `size` (or `out.shape`)
+    '''
     lib = load_libstable(path)
     if seed:
         stable_rnd_seed(lib, dist, seed)
-    return [stable_rnd_point(lib, dist) for _ in range(n)]
+
+    shape = utils.sample_shape(n, size, out)
+    count = int(np.prod(shape))
+
+    started = metrics.start()
+    out = utils.output_array(out, count, 'out')
+    stable_rnd(lib, dist, count, out)
+    if started is not None:
+        metrics.record('rnd', dist, count, started)
+    return out.reshape(shape)
 
 
 def stable_rnd_seed(lib: ct.CDLL, dist: STABLE_DIST, seed: int) -> None:
@@ -201,12 +439,17 @@ def c_stable_rnd_seed(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
     return wrap_function(lib, 'stable_rnd_seed', ret, args)
 
 
-def stable_rnd(lib: ct.CDLL, dist: STABLE_DIST, n: int) -> tp.List[float]:
+def stable_rnd(lib: ct.CDLL, dist: STABLE_DIST, n: int,
+               out: np.ndarray = None) -> np.ndarray:
+    '''Fill `out` (or a new float64 array) with `n` samples from `dist`'''
     c_fn = c_stable_rnd(lib)
-    array_type = ct.c_double * n
-    rnd = (ct.c_double * n)()
-    c_fn(dist, array_type(*rnd), n)
-    return list(rnd)
+    out = utils.output_array(out, n, 'out')
+    if n > 0:
+        if c_fn.native is not None:
+            c_fn.native(ct.addressof(dist.contents), out)
+        else:
+            c_fn(dist, utils.pointer(out), n)
+    return out
 
 
 def c_stable_rnd(lib: ct.CDLL) -> ct.CDLL._FuncPtr:
@@ -0,0 +1,219 @@
+import ctypes as ct
+import typing as tp
+import numpy as np
+from pystable.pystable import load_libstable
+from pystable.arrays import (ArrayResult, stable_cdf_array, stable_pdf_array,
+                             stable_q_array)
+from pystable.closed_form import CLOSED_FORM_ZONES
+from pystable.config import c_stable_get
+from pystable.stable_dist import STABLE_DIST
+from pystable import utils
+from pystable.utils import ArrayLike
+
+
+# Relative step at which a root is accepted, as `INVrelTOL` in
+# `stable_q_point`
+DEFAULT_TOL = 1e-6
+# Probabilities solved independently by `stable_q` to seed the others
+DEFAULT_ANCHORS = 16
+# Each level of the solve is this many times denser than the previous one
+REFINE = 8
+
+
+def _hermite(p: np.ndarray, p0: np.ndarray, p1: np.ndarray, x0: np.ndarray,
+             x1: np.ndarray, d0: np.ndarray, d1: np.ndarray
+             ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Cubic Hermite interpolation of the quantile function between solved
+    neighbours (p0, x0) and (p1, x1) with slopes dx/dp = 1/pdf. Returns the
+    interpolated quantiles and slopes.
+    '''
+    h = p1 - p0
+    t = (p - p0) / h
+    t2, t3 = t * t, t * t * t
+    x = ((2 * t3 - 3 * t2 + 1) * x0 + (t3 - 2 * t2 + t) * h * d0
+         + (3 * t2 - 2 * t3) * x1 + (t3 - t2) * h * d1)
+    slope = ((6 * t2 - 6 * t) * (x0 - x1) / h + (3 * t2 - 4 * t + 1) * d0
+             + (3 * t2 - 2 * t) * d1)
+    secant = (x1 - x0) / h
+    slope = np.where(np.isfinite(slope) & (slope > 0), slope, secant)
+    return np.clip(x, x0, x1), slope
+
+
+def _tighten(p: np.ndarray, lo: np.ndarray, hi: np.ndarray, x: np.ndarray,
+             cdf: np.ndarray) -> None:
+    '''
+    Narrow the brackets [lo, hi] of the roots of cdf(x) = p with every
+    evaluated (x, cdf) pair, not just each root's own: the cdf is monotone,
+    so a point with cdf < p bounds the root of p from below.
+    '''
+    order = np.argsort(x)
+    xs = x[order]
+    below = np.maximum.accumulate(cdf[order])
+    above = np.minimum.accumulate(cdf[order][::-1])[::-1]
+    i = np.searchsorted(below, p, side='left') - 1
+    np.maximum(lo, np.where(i >= 0, xs[np.maximum(i, 0)], -np.inf), out=lo)
+    j = np.searchsorted(above, p, side='right')
+    np.minimum(hi, np.where(j < xs.size, xs[np.minimum(j, xs.size - 1)],
+                            np.inf), out=hi)
+
+
+def _solve(lib: ct.CDLL, dist: STABLE_DIST, p: np.ndarray, x: np.ndarray,
+           err: np.ndarray, tol: float, max_iter: int, anchors: int) -> None:
+    '''Quantiles of the sorted, distinct probabilities `p` in (0, 1)'''
+    n = p.size
+    scale = dist.contents.sigma
+    slope = np.full(n, np.nan)  # dx/dp = 1/pdf at the solved points
+    solved = np.zeros(n, dtype=bool)
+
+    # Anchors are solved by `stable_q` and kept if a Newton step confirms
+    # them; its root search can fail far in the tails
+    idx = np.unique(np.linspace(0, n - 1, anchors).round().astype(np.intp))
+    xa = stable_q_array(lib, dist, p[idx], fast=False)
+    cdf = stable_cdf_array(lib, dist, xa, fast=False)
+    with np.errstate(divide='ignore'):
+        da = 1.0 / stable_pdf_array(lib, dist, xa, fast=False)
+    step = xa - (cdf - p[idx]) * da
+    dx = np.abs(step - xa)
+    valid = (np.isfinite(step) & np.isfinite(da)
+             & (dx <= tol * np.maximum(np.abs(step), scale)))
+    idx, valid = idx[valid], np.flatnonzero(valid)
+    x[idx], err[idx], slope[idx] = step[valid], dx[valid], da[valid]
+    solved[idx] = True
+
+    # Roots outside the confirmed anchors have no bracket: solve them one
+    # by one as `stable_q` does
+    outside = np.ones(n, dtype=bool)
+    if idx.size >= 2:
+        outside[idx[0]:idx[-1] + 1] = False
+    outside &= ~solved
+    if outside.any():
+        x[outside] = stable_q_array(lib, dist, p[outside], fast=False)
+        solved |= outside
+
+    stride = (n - 1) / max(idx.size - 1, 1)
+    while not solved.all():
+        stride /= REFINE
+        if stride < 2.0:
+            stride = 1.0
+        last = stride == 1.0
+        level = np.unique(np.arange(0, n, stride).round().astype(np.intp))
+        level = level[~solved[level]]
+        if level.size == 0:
+            continue
+
+        # Guess from the nearest solved neighbours, which also bracket
+        # the root since quantiles are monotone in p
+        nodes = np.flatnonzero(solved & np.isfinite(slope))
+        j = np.searchsorted(nodes, level)
+        left, right = nodes[j - 1], nodes[j]
+        lo, hi = x[left].copy(), x[right].copy()
+        xk, dk = _hermite(p[level], p[left], p[right], lo, hi, slope[left],
+                          slope[right])
+        pk = p[level]
+
+        # The densest level takes one Newton step with the interpolated
+        # slope (a cdf call only); the others also evaluate the pdf so
+        # their points can seed the next level
+        for it in range(max_iter):
+            cdf = stable_cdf_array(lib, dist, xk, fast=False)
+            if it > 0 or not last:
+                with np.errstate(divide='ignore'):
+                    dk = 1.0 / stable_pdf_array(lib, dist, xk, fast=False)
+            _tighten(pk, lo, hi, xk, cdf)
+            step = xk - (cdf - pk) * dk
+            inside = (step > lo) & (step < hi) & np.isfinite(step)
+            step = np.where(inside, step, 0.5 * (lo + hi))
+            dx = np.abs(step - xk)
+            done = inside & (dx <= tol * np.maximum(np.abs(step), scale))
+            if it == max_iter - 1:
+                # Keep the last iterate, as `stable_q` does, but do not
+                # interpolate from it
+                dk = np.where(done, dk, np.nan)
+                done[:] = True
+
+            k = level[done]
+            x[k], err[k] = step[done], dx[done]
+            # Points where the pdf underflows cannot seed their neighbours
+            slope[k] = np.where(np.isfinite(dk[done]), dk[done], np.nan)
+            solved[k] = True
+            rest = ~done
+            if not rest.any():
+                break
+            level, pk, xk, dk = level[rest], pk[rest], step[rest], dk[rest]
+            lo, hi = lo[rest], hi[rest]
+
+
+def q_sorted(dist: STABLE_DIST, q: ArrayLike,
+             out: tp.Optional[np.ndarray] = None, return_err: bool = False,
+             tol: float = DEFAULT_TOL, max_iter: tp.Optional[int] = None,
+             anchors: int = DEFAULT_ANCHORS, path=None) -> ArrayResult:
+    lib = load_libstable(path)
+    return stable_q_sorted(lib, dist, q, out, return_err, tol, max_iter,
+                           anchors)
+
+
+def stable_q_sorted(lib: ct.CDLL, dist: STABLE_DIST, q: ArrayLike,
+                    out: tp.Optional[np.ndarray] = None,
+                    return_err: bool = False, tol: float = DEFAULT_TOL,
+                    max_iter: tp.Optional[int] = None,
+                    anchors: int = DEFAULT_ANCHORS) -> ArrayResult:
+    '''
+    Evaluate the quantiles at many probabilities at once, e.g. a full
+    quantile curve.
+
+    `stable_q` solves every probability independently from a rough
+    initial guess. Here the probabilities are sorted and deduplicated,
+    `anchors` of them are solved by `stable_q`, and the rest are solved in
+    levels of increasing density: each root starts from a cubic Hermite
+    interpolation of its solved neighbours, which also bracket it. Each
+    Newton iteration is one batched cdf (and pdf) call for all unsolved
+    roots, and every evaluation narrows the brackets of all of them. On
+    dense curves most roots take a single cdf evaluation.
+
+    A root is accepted when the Newton step falls below `tol` relative to
+    max(|x|, sigma). Probabilities of 0 and 1 map to -inf and inf and
+    others outside [0, 1] to NaN, as in `stable_q`; Gauss, Cauchy and Levy
+    distributions are passed to `stable_q_array`.
+
+    Inputs:
+      lib        [ct.CDLL]:     libstable dynamically linked library
+      dist       [STABLE_DIST]: pointer to `StableDist` struct
+      q          [ArrayLike]:   probabilities, in any order
+      out        [np.ndarray]:  optional float64 output buffer, len(q)
+      return_err [bool]:        also return the size of the last Newton
+                                step, an estimate of the absolute error
+      tol        [float]:       relative step tolerance
+      max_iter   [int]:         Newton iterations per root, default
+                                libstable's `INV_MAXITER`
+      anchors    [int]:         probabilities solved by `stable_q`
+
+    Outputs:
+      [np.ndarray]:             quantiles, or (quantiles, err) if requested
+    '''
+    if anchors < 2:
+        raise ValueError('`anchors` must be at least 2')
+    q = utils.as_double_array(q)
+    out = utils.output_array(out, q.size, 'out')
+    err = np.zeros(q.size) if return_err else None
+    if dist.contents.ZONE in CLOSED_FORM_ZONES:
+        return stable_q_array(lib, dist, q, out, err, return_err)
+    if max_iter is None:
+        max_iter = c_stable_get(lib, 'inv_maxiter')()
+    max_iter = max(max_iter, 1)
+
+    interior = (q > 0.0) & (q < 1.0)
+    out[~interior] = np.where(q[~interior] == 0.0, -np.inf,
+                              np.where(q[~interior] == 1.0, np.inf, np.nan))
+    p, inverse = np.unique(q[interior], return_inverse=True)
+    x, e = np.empty(p.size), np.zeros(p.size)
+    if p.size <= anchors:
+        stable_q_array(lib, dist, p, x, fast=False)
+    else:
+        _solve(lib, dist, p, x, e, tol, max_iter, anchors)
+    out[interior] = x[inverse]
+
+    if return_err:
+        err[interior] = e[inverse]
+        return out, err
+    return out
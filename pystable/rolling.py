@@ -0,0 +1,228 @@
+import ctypes as ct
+import time
+import typing as tp
+import numpy as np
+from dataclasses import dataclass
+from pystable.pystable import c_czab, c_cztab, c_stab, c_stable_fit_iter
+from pystable.distribution import StableDistribution
+from pystable.fitting import FitResult
+from pystable import utils
+from pystable.utils import ArrayLike
+
+
+DEFAULT_DRIFT = 0.02
+
+
+@dataclass
+class RollingFitResult(FitResult):
+    '''
+    `FitResult` of one window of a `RollingFit`.
+
+    Parameters:
+      refit [bool]: whether the ML stage was rerun for this window; if not,
+                    alpha and beta were carried over and only sigma and mu
+                    were re-estimated from the window quantiles
+    '''
+    refit: bool = False
+
+
+def mcculloch(lib: ct.CDLL, data: np.ndarray
+              ) -> tp.Tuple[int, float, float, float, float]:
+    '''
+    McCulloch's quantile estimate (`stab`) from sorted data: status, alpha,
+    beta, sigma and 0-parameterization mu
+    '''
+    alpha, beta, c, zeta = (ct.c_double() for _ in range(4))
+    status = c_stab(lib)(utils.pointer(data), data.size, 0, ct.byref(alpha),
+                         ct.byref(beta), ct.byref(c), ct.byref(zeta))
+    return status, alpha.value, beta.value, c.value, zeta.value
+
+
+def quartiles(lib: ct.CDLL, data: np.ndarray) -> tp.Tuple[float, float]:
+    '''`nu_c` and `nu_z` of sorted data (`cztab`), as used by `czab`'''
+    nu_c, nu_z = ct.c_double(), ct.c_double()
+    c_cztab(lib)(utils.pointer(data), data.size, ct.byref(nu_c),
+                 ct.byref(nu_z))
+    return nu_c.value, nu_z.value
+
+
+def czab(lib: ct.CDLL, alpha: float, beta: float, nu_c: float,
+         nu_z: float) -> tp.Tuple[float, float]:
+    '''McCulloch sigma and 0-parameterization mu for given alpha, beta'''
+    c, zeta = ct.c_double(), ct.c_double()
+    c_czab(lib)(alpha, beta, nu_c, nu_z, ct.byref(c), ct.byref(zeta))
+    return c.value, zeta.value
+
+
+class SortedWindow:
+    '''
+    Sliding window of the last `size` values kept both in arrival order
+    (ring buffer) and in sorted order, so order statistics are available
+    at any time without sorting. Each update locates the leaving and
+    entering values by binary search and shifts the values in between by
+    one slot with a single in-place move.
+    '''
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError('`size` must be positive')
+        self.size = size
+        self._ring = np.empty(size, dtype=np.float64)
+        self._sorted = np.empty(size, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        return self._count == self.size
+
+    @property
+    def sorted(self) -> np.ndarray:
+        '''Current values in ascending order (a view, do not modify)'''
+        return self._sorted[:self._count]
+
+    @property
+    def values(self) -> np.ndarray:
+        '''Current values in arrival order'''
+        if not self.full:
+            return self._ring[:self._count].copy()
+        return np.roll(self._ring, -self._head)
+
+    def push(self, value: float) -> None:
+        if np.isnan(value):
+            raise ValueError('cannot add NaN to the window')
+        s = self._sorted
+        if not self.full:
+            n = self._count
+            j = np.searchsorted(s[:n], value)
+            s[j + 1:n + 1] = s[j:n]
+            s[j] = value
+            self._ring[n] = value
+            self._count += 1
+            return
+
+        old = self._ring[self._head]
+        self._ring[self._head] = value
+        self._head = (self._head + 1) % self.size
+        i = np.searchsorted(s, old)
+        j = np.searchsorted(s, value)
+        if j > i:
+            s[i:j - 1] = s[i + 1:j]
+            s[j - 1] = value
+        else:
+            s[j + 1:i + 1] = s[j:i]
+            s[j] = value
+
+    def extend(self, values: ArrayLike) -> None:
+        for value in utils.as_double_array(values):
+            self.push(value)
+
+
+class RollingFit:
+    '''
+    Incremental refitting over a sliding window of `window` points.
+
+    Each `fit()` computes McCulloch's quantile estimate from the window's
+    order statistics, which are maintained incrementally by a
+    `SortedWindow`. The ML stage of `stable_fit` (`stable_fit_iter`) is
+    rerun, warm-started from the previous alpha and beta, only when the
+    McCulloch alpha or beta moved by more than `drift` since the last ML
+    fit. Otherwise the previous alpha and beta are kept and sigma and mu
+    are updated from the window quantiles exactly as `stable_fit_iter`
+    does at its end. With `drift=0` every window is refit.
+
+    Parameters:
+      window [int]:   number of points in the window
+      drift  [float]: McCulloch alpha/beta change that triggers an ML refit
+      path   [str]:   optional path to `libstable.so`
+    '''
+
+    def __init__(self, window: int, drift: float = DEFAULT_DRIFT,
+                 path=None):
+        self.window = SortedWindow(window)
+        self.drift = drift
+        self.dist = StableDistribution(2.0, 0.0, 1.0, 0.0, 1, path)
+        self._lib = self.dist._lib
+        self._anchor: tp.Optional[tp.Tuple[float, float]] = None
+        self._fits = 0
+
+    def __enter__(self) -> 'RollingFit':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.dist.close()
+
+    def push(self, values: ArrayLike) -> None:
+        '''Slide the window over `values`'''
+        self.window.extend(values)
+
+    def fit(self) -> RollingFitResult:
+        '''Fit the current window'''
+        data = np.ascontiguousarray(self.window.sorted)
+        if data.size < 2:
+            raise ValueError('the window needs at least 2 points')
+
+        start = time.perf_counter()
+        status, alpha, beta, sigma, mu = mcculloch(self._lib, data)
+        if status < 0:
+            raise ValueError('degenerate window: interquartile range is 0')
+        nu_c, nu_z = quartiles(self._lib, data)
+
+        refit = (self._anchor is None
+                 or abs(alpha - self._anchor[0]) > self.drift
+                 or abs(beta - self._anchor[1]) > self.drift)
+        if refit:
+            if self._anchor is None:
+                self.dist.setparams(alpha, beta, sigma, mu, 0)
+            else:
+                # Warm start from the previous ML alpha and beta
+                self._set_from_quantiles(self.dist.alpha, self.dist.beta,
+                                         nu_c, nu_z)
+            status = c_stable_fit_iter(self._lib)(
+                self.dist.dist, utils.pointer(data), data.size, nu_c, nu_z)
+            self._anchor = (alpha, beta)
+        else:
+            self._set_from_quantiles(self.dist.alpha, self.dist.beta, nu_c,
+                                     nu_z)
+            status = 0
+        elapsed = time.perf_counter() - start
+
+        result = RollingFitResult(self._fits, status, self.dist.alpha,
+                                  self.dist.beta, self.dist.sigma,
+                                  self.dist.mu_0, self.dist.mu_1, elapsed,
+                                  refit)
+        self._fits += 1
+        return result
+
+    def _set_from_quantiles(self, alpha: float, beta: float, nu_c: float,
+                            nu_z: float) -> None:
+        sigma, mu = czab(self._lib, alpha, beta, nu_c, nu_z)
+        self.dist.setparams(alpha, beta, sigma, mu, 0)
+
+    def update(self, values: ArrayLike) -> RollingFitResult:
+        '''Slide the window over `values` and refit'''
+        self.push(values)
+        return self.fit()
+
+
+def rolling_fit(data: ArrayLike, window: int, step: int,
+                drift: float = DEFAULT_DRIFT,
+                path=None) -> tp.Iterator[RollingFitResult]:
+    '''
+    Fit every window of `window` points of `data`, advancing by `step`
+    points between fits. See `RollingFit`.
+    '''
+    data = utils.as_double_array(data)
+    if step < 1:
+        raise ValueError('`step` must be positive')
+    with RollingFit(window, drift, path) as roller:
+        roller.push(data[:window])
+        yield roller.fit()
+        for start in range(window, data.size - step + 1, step):
+            yield roller.update(data[start:start + step])
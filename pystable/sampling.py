@@ -0,0 +1,108 @@
+import typing as tp
+import numpy as np
+from pystable.cache import DEFAULT_CACHE, DistributionCache
+from pystable.pystable import rnd
+from pystable.stable_dist import STABLE_DIST
+from pystable.tabulated import QuantileTable
+from pystable import utils
+
+
+# Sources of uniforms for `rnd_table`:
+#   random:     independent draws from `numpy.random.default_rng`
+#   antithetic: the second half of the draws (along the first axis) is
+#               1 - u of the first half
+#   sobol:      scrambled Sobol points (requires SciPy, the `qmc` extra),
+#               one point per row of dimension prod(shape[1:])
+UNIFORM_METHODS = ('random', 'antithetic', 'sobol')
+
+# Uniforms are kept in [2^-53, 1 - 2^-53] so that samples stay finite
+_U_MIN = 2.0 ** -53
+
+
+def uniforms(shape: tp.Union[int, tp.Tuple[int, ...]],
+             method: str = 'random',
+             seed: tp.Optional[int] = None) -> np.ndarray:
+    '''
+    Uniform variates on [0, 1) with shape `shape`, e.g. `(sims, steps)`,
+    from one of `UNIFORM_METHODS`.
+
+    Antithetic pairs rows i and i + sims // 2 (with an independent middle
+    row when sims is odd). Sobol points balance best when sims is a power
+    of 2; each row is a point, so the columns of a path are its
+    dimensions. They need SciPy, e.g. `pip install pystable[qmc]`.
+    '''
+    if method not in UNIFORM_METHODS:
+        raise ValueError('unknown uniform method {!r}, expected one of {}'
+                         .format(method, ', '.join(UNIFORM_METHODS)))
+    shape = (int(shape),) if np.isscalar(shape) else tuple(shape)
+    n = shape[0] if shape else 1
+    dim = int(np.prod(shape[1:]))
+
+    if method == 'sobol':
+        try:
+            from scipy.stats import qmc
+        except ImportError as e:
+            raise ImportError("uniforms 'sobol' requires SciPy, install "
+                              "pystable[qmc]") from e
+        if n == 0 or dim == 0:
+            return np.empty(shape)
+        u = qmc.Sobol(dim, scramble=True, seed=seed).random(n)
+        return u.reshape(shape)
+
+    rng = np.random.default_rng(seed)
+    if method == 'random':
+        return rng.random(shape)
+    half = n // 2
+    u = rng.random((n - half,) + shape[1:])
+    return np.concatenate((u, 1 - u[:half])).reshape(shape)
+
+
+def rnd_table(dist: STABLE_DIST, n: tp.Optional[int] = None,
+              seed: tp.Optional[int] = None, path=None,
+              out: tp.Optional[np.ndarray] = None,
+              size: tp.Union[int, tp.Tuple[int, ...]] = None,
+              method: str = 'random',
+              table: tp.Optional[QuantileTable] = None,
+              cache: tp.Optional[DistributionCache] = None) -> np.ndarray:
+    '''
+    Draw samples from `dist` by inverse transform: uniforms (see
+    `uniforms`) are mapped through a `QuantileTable` with NumPy instead of
+    calling libstable's Chambers-Mallows-Stuck generator per sample.
+
+    The table depends only on (alpha, beta) and is built once and kept in
+    `cache` (default `DEFAULT_CACHE`), so refitted scale and location
+    reuse it. Its accuracy is reported by `table.errors`; samples are
+    exact quantiles of the uniforms up to that error. When the errors
+    exceed `MAX_QUANTILE_ERRORS` the samples are drawn by `rnd` instead
+    (seeded with `seed`, ignoring `method`).
+
+    Inputs:
+      dist   [STABLE_DIST]:   pointer to `StableDist` struct
+      n      [int]:           number of samples (ignored if `size` is given)
+      seed   [int]:           optional seed of the uniforms
+      path   [str]:           optional path to `libstable.so`
+      out    [np.ndarray]:    optional C-contiguous float64 buffer to fill
+      size   [int | tuple]:   output shape, e.g. `(sims, steps)`
+      method [str]:           one of `UNIFORM_METHODS`
+      table  [QuantileTable]: optional table to use instead of the cache
+      cache  [DistributionCache]: cache holding the table
+
+    Outputs:
+        [np.ndarray]:         samples with shape `size` (or `out.shape`)
+    '''
+    d = dist.contents
+    if table is None:
+        table = (cache or DEFAULT_CACHE).quantile_table(d.alpha, d.beta,
+                                                        path=path)
+    if not table.accurate:
+        return rnd(dist, n, seed, path, out, size)
+
+    shape = utils.sample_shape(n, size, out)
+    out = utils.output_array(out, int(np.prod(shape)), 'out')
+
+    u = uniforms(shape, method, seed).reshape(-1)
+    flat = out.reshape(-1)
+    table.ppf(np.clip(u, _U_MIN, 1 - _U_MIN), out=flat)
+    flat *= d.sigma
+    flat += d.mu_0
+    return out.reshape(shape)
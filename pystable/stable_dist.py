@@ -1,3 +1,4 @@
+import enum
 import ctypes as ct
 
 
@@ -11,9 +12,44 @@ class STABLE_DIST(ct.Structure):
       scale [ct.c_double]:  Scale parameter
       mu_0  [ct.c_double]:  0-parametrization local parameter
       mu_1  [ct.c_double]:  corresponding 1-parametrization local parameter
+      ZONE  [ct.c_int]:     particular case of the distribution, see `Zone`
+
+    The remaining fields mirror `struct StableDistStruct` in `stable.h`
+    (evaluation function pointers, precalculated constants and the GSL
+    workspace and generator). They are managed by libstable and only read
+    from Python.
     '''
     _fields_ = [('alpha', ct.c_double),
                 ('beta', ct.c_double),
                 ('sigma', ct.c_double),
                 ('mu_0', ct.c_double),
-                ('mu_1', ct.c_double)]
+                ('mu_1', ct.c_double),
+                ('ZONE', ct.c_int),
+                ('stable_pdf_point', ct.c_void_p),
+                ('stable_cdf_point', ct.c_void_p),
+                ('alphainvalpha1', ct.c_double),
+                ('xi', ct.c_double),
+                ('theta0', ct.c_double),
+                ('c1', ct.c_double),
+                ('c2_part', ct.c_double),
+                ('c3', ct.c_double),
+                ('k1', ct.c_double),
+                ('S', ct.c_double),
+                ('Vbeta1', ct.c_double),
+                ('theta0_', ct.c_double),
+                ('beta_', ct.c_double),
+                ('xxipow', ct.c_double),
+                ('gslworkspace', ct.c_void_p),
+                ('gslrand', ct.c_void_p)]
+
+
+class Zone(enum.IntEnum):
+    '''Particular cases of the distribution, see `stable.h`'''
+    NOVALID = -1
+    STABLE = 0
+    ALPHA_1 = 1
+    GAUSS = 2
+    CAUCHY = 3
+    LEVY = 4
+    STABLE_B1 = 5
+    ALPHA_1_B1 = 6
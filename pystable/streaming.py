@@ -0,0 +1,142 @@
+import ctypes as ct
+import os
+import typing as tp
+import numpy as np
+from pystable.pystable import (load_libstable, c_stable_cdf, c_stable_pdf,
+                               c_stable_q)
+from pystable.arrays import _evaluate
+from pystable.stable_dist import STABLE_DIST
+from pystable.utils import ArrayLike
+
+
+# Points per C call: 8 MiB of float64 input and as much output
+DEFAULT_CHUNK_SIZE = 1 << 20
+STREAM_KINDS = {'pdf': c_stable_pdf, 'cdf': c_stable_cdf, 'q': c_stable_q}
+RAW_DTYPE = '<f8'
+
+Source = tp.Union[str, os.PathLike, np.ndarray]
+
+
+def _c_function(lib: ct.CDLL, kind: str) -> ct.CDLL._FuncPtr:
+    if kind not in STREAM_KINDS:
+        raise ValueError('unknown kind {!r}, expected one of {}'
+                         .format(kind, ', '.join(STREAM_KINDS)))
+    return STREAM_KINDS[kind](lib)
+
+
+def open_input(source: Source, dtype: str = RAW_DTYPE) -> np.ndarray:
+    '''
+    Memory-map a `.npy` file or a raw binary file of `dtype` values
+    read-only; arrays are returned as they are (flattened).
+    '''
+    if isinstance(source, np.ndarray):
+        return source.reshape(-1, order='A')
+    if str(source).endswith('.npy'):
+        return np.load(source, mmap_mode='r').reshape(-1, order='A')
+    if os.path.getsize(source) == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(source, dtype=dtype, mode='r')
+
+
+def open_output(target: tp.Union[str, os.PathLike], n: int) -> np.ndarray:
+    '''
+    Create a float64 output memmap of `n` values, as a `.npy` file or, for
+    any other extension, a raw native-endian binary file
+    '''
+    if str(target).endswith('.npy'):
+        return np.lib.format.open_memmap(target, mode='w+', dtype=np.float64,
+                                         shape=(n,))
+    if n == 0:
+        open(target, 'wb').close()
+        return np.empty(0)
+    return np.memmap(target, dtype=np.float64, mode='w+', shape=(n,))
+
+
+def iter_chunks(source: Source, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                dtype: str = RAW_DTYPE) -> tp.Iterator[np.ndarray]:
+    '''
+    Yield consecutive views of at most `chunk_size` values of a file (see
+    `open_input`) or array, without reading ahead
+    '''
+    if chunk_size < 1:
+        raise ValueError('`chunk_size` must be positive')
+    data = open_input(source, dtype)
+    for start in range(0, data.size, chunk_size):
+        yield data[start:start + chunk_size]
+
+
+def stream(dist: STABLE_DIST, chunks: tp.Iterable[ArrayLike],
+           kind: str = 'cdf', path=None) -> tp.Iterator[np.ndarray]:
+    lib = load_libstable(path)
+    return stable_stream(lib, dist, chunks, kind)
+
+
+def stable_stream(lib: ct.CDLL, dist: STABLE_DIST,
+                  chunks: tp.Iterable[ArrayLike],
+                  kind: str = 'cdf') -> tp.Iterator[np.ndarray]:
+    '''
+    Lazily evaluate the pdf, cdf or quantiles of each chunk of an iterable,
+    e.g. `iter_chunks(path)` or a generator reading from a socket. Only one
+    chunk and its result are held at a time.
+
+    Inputs:
+      lib    [ct.CDLL]:     libstable dynamically linked library
+      dist   [STABLE_DIST]: pointer to `StableDist` struct
+      chunks [Iterable]:    float64 buffers (contiguous ones are not copied)
+      kind   [str]:         'pdf', 'cdf' or 'q'
+
+    Outputs:
+      [Iterator]:           one float64 array per input chunk
+    '''
+    c_fn = _c_function(lib, kind)
+    for chunk in chunks:
+        yield _evaluate(c_fn, dist, chunk, None, None, False, kind)
+
+
+def evaluate_file(dist: STABLE_DIST, source: Source,
+                  target: tp.Union[str, os.PathLike], kind: str = 'cdf',
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  dtype: str = RAW_DTYPE, path=None) -> np.ndarray:
+    lib = load_libstable(path)
+    return stable_evaluate_file(lib, dist, source, target, kind, chunk_size,
+                                dtype)
+
+
+def stable_evaluate_file(lib: ct.CDLL, dist: STABLE_DIST, source: Source,
+                         target: tp.Union[str, os.PathLike],
+                         kind: str = 'cdf',
+                         chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         dtype: str = RAW_DTYPE) -> np.ndarray:
+    '''
+    Evaluate the pdf, cdf or quantiles of every value of a file into an
+    output file, chunk by chunk.
+
+    Both files are memory-mapped and libstable reads and writes the mapped
+    pages directly, so memory use does not grow with the file size (the
+    OS pages the mappings in and out). Inputs in a non-native byte order
+    are converted one chunk at a time.
+
+    Inputs:
+      lib        [ct.CDLL]:     libstable dynamically linked library
+      dist       [STABLE_DIST]: pointer to `StableDist` struct
+      source     [str]:         `.npy` or raw binary input file, or array
+      target     [str]:         `.npy` or raw float64 output file
+      kind       [str]:         'pdf', 'cdf' or 'q'
+      chunk_size [int]:         values per C call
+      dtype      [str]:         element type of a raw input file
+
+    Outputs:
+      [np.ndarray]:             the output memmap, flushed
+    '''
+    c_fn = _c_function(lib, kind)
+    if chunk_size < 1:
+        raise ValueError('`chunk_size` must be positive')
+    data = open_input(source, dtype)
+    out = open_output(target, data.size)
+    for start in range(0, data.size, chunk_size):
+        stop = start + chunk_size
+        _evaluate(c_fn, dist, data[start:stop], out[start:stop], None, False,
+                  kind)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
@@ -0,0 +1,567 @@
+import ctypes as ct
+import math
+import typing as tp
+import numpy as np
+from statistics import NormalDist
+from pystable.pystable import (load_libstable, stable_checkparams,
+                               stable_create, stable_free, stable_q)
+from pystable.arrays import stable_cdf_array, stable_pdf_array
+from pystable.quantile import stable_q_sorted
+from pystable.stable_dist import STABLE_DIST, Zone
+from pystable.utils import ArrayLike, as_double_array
+
+
+DEFAULT_KNOTS = 2049
+DEFAULT_TAIL = 1e-6
+DEFAULT_QUANTILE_KNOTS = 4097
+# Largest `StableTable.errors` of a usable table. Beyond them the
+# interpolation (or the exact evaluation it is checked against) is
+# unreliable: `TabulatedDistribution` refuses the table and
+# `pdf_batch`/`cdf_batch` evaluate exactly instead
+MAX_ERRORS = {'pdf_rel': 5e-2, 'cdf_abs': 1e-3, 'q_rel': 1e-1,
+              'tail_rel': 0.25}
+# Largest `QuantileTable.errors` of a usable table; `rnd_table` falls back
+# to libstable's generator beyond them
+MAX_QUANTILE_ERRORS = {'q_rel': 1e-1, 'cdf_abs': 1e-3, 'tail_rel': 0.25}
+# Knots at each end of a `StableTable` whose log-density slopes are taken
+# from exact evaluations
+_EDGE_KNOTS = 4
+
+# S0(2, beta, 1, 0) is a normal distribution with variance 2
+_GAUSS = NormalDist(0.0, math.sqrt(2.0))
+
+
+def _hermite(t: np.ndarray, h, y0, m0, y1, m1) -> np.ndarray:
+    '''Cubic Hermite interpolation on [0, 1] with interval width `h`'''
+    t2 = t * t
+    t3 = t2 * t
+    return ((2 * t3 - 3 * t2 + 1) * y0 + (t3 - 2 * t2 + t) * h * m0
+            + (-2 * t3 + 3 * t2) * y1 + (t3 - t2) * h * m1)
+
+
+def _within(errors: tp.Dict[str, float],
+            bounds: tp.Dict[str, float]) -> bool:
+    return all(errors[name] <= bound for name, bound in bounds.items())
+
+
+def _power_tail(scale: float, ratio: np.ndarray, power: float) -> np.ndarray:
+    '''`scale * ratio**-power`, zero where `ratio` <= 0 (outside support)'''
+    pos = ratio > 0
+    return np.where(pos, scale * np.where(pos, ratio, 1.0) ** -power, 0.0)
+
+
+class _LightTail:
+    '''
+    Light tail of a totally skewed distribution S0(alpha, +-1, 1, 0) with
+    alpha < 2: the lower tail when beta = 1, the upper one when beta = -1.
+
+    With w = beta * z (so that the tail lies at w -> -inf or at the edge of
+    the support) and y = w + tan(pi alpha / 2) the 1-parameterization
+    variable, the log tail probability decays as g(w) (Zolotarev):
+      alpha > 1: g = -|y|^(alpha / (alpha - 1))   (y < 0)
+      alpha = 1: g = -exp(-pi w / 2)
+      alpha < 1: g = -y^(-alpha / (1 - alpha))    (y > 0, 0 below the edge
+                                                   y = 0 of the support)
+    The tail probability P(w) = p0 exp(c (g(w) - g(w0))) is anchored to the
+    tail probability p0 and density f0 at the table edge w0, which fixes c.
+    '''
+
+    def __init__(self, alpha: float, beta: float, z0: float, p0: float,
+                 f0: float):
+        self.alpha = alpha
+        self.sign = 1.0 if beta > 0 else -1.0
+        self.shift = 0.0 if alpha == 1 else math.tan(math.pi * alpha / 2)
+        self.w0 = self.sign * z0
+        self.p0 = p0
+        self.g0, dg0 = self._g(np.array([self.w0]))
+        self.g0 = float(self.g0[0])
+        self.c = f0 / (p0 * float(dg0[0]))
+
+    def _g(self, w: np.ndarray) -> tp.Tuple[np.ndarray, np.ndarray]:
+        '''g(w) and g'(w), -inf and 0 beyond the support'''
+        a = self.alpha
+        y = w + self.shift
+        with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+            if a > 1:
+                k = a / (a - 1)
+                r = np.maximum(-y, 0.0)
+                return -r ** k, k * r ** (k - 1)
+            if a == 1:
+                e = np.exp(-math.pi * w / 2)
+                return -e, math.pi / 2 * e
+            k = a / (1 - a)
+            inside = y > 0
+            y = np.where(inside, y, 1.0)
+            return (np.where(inside, -y ** -k, -np.inf),
+                    np.where(inside, k * y ** (-k - 1), 0.0))
+
+    def prob(self, z: np.ndarray) -> np.ndarray:
+        '''Tail probability P(w) beyond z'''
+        g, _ = self._g(self.sign * z)
+        return self.p0 * np.exp(self.c * (g - self.g0))
+
+    def pdf(self, z: np.ndarray) -> np.ndarray:
+        g, dg = self._g(self.sign * z)
+        return self.p0 * np.exp(self.c * (g - self.g0)) * self.c * dg
+
+    def ppf(self, p: np.ndarray) -> np.ndarray:
+        '''z with tail probability p < p0'''
+        a = self.alpha
+        g = self.g0 + np.log(p / self.p0) / self.c
+        if a > 1:
+            w = -(-g) ** ((a - 1) / a) - self.shift
+        elif a == 1:
+            w = -2 / math.pi * np.log(-g)
+        else:
+            w = (-g) ** (-(1 - a) / a) - self.shift
+        return self.sign * w
+
+
+def _light_tail(alpha: float, beta: float, zone: Zone, z: np.ndarray,
+                p: tp.Tuple[float, float], f: tp.Tuple[float, float]
+                ) -> tp.Optional[_LightTail]:
+    '''
+    `_LightTail` anchored at the edge of a table spanning `z`, with tail
+    probabilities `p` and densities `f` at its two edges, if the
+    distribution has one (|beta| = 1, alpha < 2)
+    '''
+    if zone == Zone.GAUSS or abs(beta) != 1:
+        return None
+    i = 0 if beta > 0 else -1
+    if not p[i] > 0:
+        return None
+    tail = _LightTail(alpha, beta, z[i], p[i], f[i])
+    # An anchor outside the support means the table edge itself is wrong
+    return tail if 0 < tail.c < np.inf else None
+
+
+class StableTable:
+    '''
+    Interpolation table of the standardized distribution S0(alpha, beta, 1, 0)
+    (Nolan's 0-parameterization), shared by every (sigma, mu) with the same
+    shape parameters since x = mu_0 + sigma * z.
+
+    Knots are uniform in u = asinh(z) between the `p_tail` and `1 - p_tail`
+    quantiles. Inside the table the cdf is a cubic Hermite interpolant using
+    the exact density as derivative and the log-density is a cubic Hermite
+    interpolant with finite-difference slopes. Beyond the table the tails
+    follow the power law |z|^-alpha of stable tails (or the normal tail when
+    alpha = 2), anchored to the table edges. The light tail of a totally
+    skewed distribution (|beta| = 1) decays as described in `_LightTail`
+    instead, and vanishes beyond the edge of the support when alpha < 1.
+
+    The table is validated on construction against the exact C evaluation
+    at the midpoints between knots and at tail points beyond the table; the
+    largest deviations are kept in `errors`:
+      pdf_rel   [float]: max relative pdf error inside the table
+      cdf_abs   [float]: max absolute cdf error inside the table
+      q_rel     [float]: max error of the quantile, relative to 1 + |z|
+      tail_rel  [float]: max relative error of the tail probabilities
+    `accurate` tells whether they are within `MAX_ERRORS`.
+    '''
+
+    def __init__(self, alpha: float, beta: float, knots: int = DEFAULT_KNOTS,
+                 p_tail: float = DEFAULT_TAIL, path=None):
+        if knots < 4:
+            raise ValueError('`knots` must be at least 4')
+        if not 0 < p_tail < 0.5:
+            raise ValueError('`p_tail` must lie in (0, 0.5)')
+
+        lib = load_libstable(path)
+        zone = stable_checkparams(lib, alpha, beta, 1.0, 0.0, 0)
+        if zone == Zone.NOVALID:
+            raise ValueError('invalid stable parameters: alpha={}, beta={}'
+                             .format(alpha, beta))
+        self.alpha = alpha
+        self.beta = beta
+        self.zone = Zone(zone)
+        self.p_tail = p_tail
+
+        # libstable's Levy cdf and quantile for beta = -1 return those of
+        # the reflected distribution; tabulate beta = 1 and reflect, since
+        # S0(alpha, -beta) = -S0(alpha, beta)
+        self._mirror = self.zone == Zone.LEVY and beta < 0
+        dist = stable_create(lib, alpha, -beta if self._mirror else beta,
+                             1.0, 0.0, 0)
+        try:
+            self._build(lib, dist, knots)
+            self.errors = self._validate(lib, dist)
+        finally:
+            stable_free(lib, dist)
+
+    def _exact_pdf(self, lib: ct.CDLL, dist: STABLE_DIST,
+                   z: np.ndarray) -> np.ndarray:
+        return stable_pdf_array(lib, dist, -z if self._mirror else z)
+
+    def _exact_cdf(self, lib: ct.CDLL, dist: STABLE_DIST,
+                   z: np.ndarray) -> np.ndarray:
+        if self._mirror:
+            return 1 - stable_cdf_array(lib, dist, -z)
+        return stable_cdf_array(lib, dist, z)
+
+    def _exact_q(self, lib: ct.CDLL, dist: STABLE_DIST,
+                 p: np.ndarray) -> np.ndarray:
+        if self._mirror:
+            return -np.array(stable_q(lib, dist, list(1 - p), len(p)))
+        return np.array(stable_q(lib, dist, list(p), len(p)))
+
+    def _build(self, lib: ct.CDLL, dist: STABLE_DIST, knots: int) -> None:
+        zmin, zmax = self._exact_q(lib, dist,
+                                   np.array([self.p_tail, 1 - self.p_tail]))
+        self.u = np.linspace(math.asinh(zmin), math.asinh(zmax), knots)
+        self.du = self.u[1] - self.u[0]
+        self.z = np.sinh(self.u)
+
+        f = self._exact_pdf(lib, dist, self.z)
+        F = self._exact_cdf(lib, dist, self.z)
+        self.f = np.maximum(f, np.finfo(float).tiny)
+        self.logf = np.log(self.f)
+        self.dlogf = np.gradient(self.logf, self.du, edge_order=2)
+        # The log-density bends sharply towards the edge of a light tail,
+        # where one-sided differences are poor: use fine central
+        # differences of the exact density at the outer knots
+        edges = np.r_[:_EDGE_KNOTS, -_EDGE_KNOTS:0]
+        h = self.du / 64
+        ends = np.sinh(np.concatenate([self.u[edges] + h, self.u[edges] - h]))
+        logf = np.log(np.maximum(self._exact_pdf(lib, dist, ends),
+                                 np.finfo(float).tiny))
+        up, down = logf.reshape(2, -1)
+        self.dlogf[edges] = (up - down) / (2 * h)
+        # Integration noise can break monotonicity deep in the tails
+        self.F = np.clip(np.maximum.accumulate(F), 0.0, 1.0)
+        self.dF = self.f * np.cosh(self.u)
+        self._light = _light_tail(self.alpha, self.beta, self.zone, self.z,
+                                  (self.F[0], 1 - self.F[-1]),
+                                  (self.f[0], self.f[-1]))
+
+    def _validate(self, lib: ct.CDLL, dist: STABLE_DIST
+                  ) -> tp.Dict[str, float]:
+        z = np.sinh(self.u[:-1] + self.du / 2)
+        f = self._exact_pdf(lib, dist, z)
+        F = self._exact_cdf(lib, dist, z)
+
+        pos = f > np.finfo(float).tiny
+        pdf_rel = np.max(np.abs(self.pdf(z[pos]) - f[pos]) / f[pos])
+        cdf_abs = np.max(np.abs(self.cdf(z) - F))
+        inner = (F > self.F[0]) & (F < self.F[-1])
+        q_rel = np.max(np.abs(self.ppf(F[inner]) - z[inner])
+                       / (1 + np.abs(z[inner])))
+
+        p = self.p_tail * np.array([1e-1, 1e-2])
+        zt = self._exact_q(lib, dist, np.concatenate([p, 1 - p]))
+        Ft = self._exact_cdf(lib, dist, zt)
+        exact = np.concatenate([Ft[:2], 1 - Ft[2:]])
+        approx = self.cdf(zt)
+        approx = np.concatenate([approx[:2], 1 - approx[2:]])
+        ok = exact > 0
+        tail_rel = np.max(np.abs(approx[ok] - exact[ok]) / exact[ok],
+                          initial=0.0)
+
+        return {'pdf_rel': float(pdf_rel), 'cdf_abs': float(cdf_abs),
+                'q_rel': float(q_rel), 'tail_rel': float(tail_rel)}
+
+    @property
+    def accurate(self) -> bool:
+        '''Whether all `errors` are within `MAX_ERRORS`'''
+        return _within(self.errors, MAX_ERRORS)
+
+    @property
+    def nbytes(self) -> int:
+        '''Memory held by the table arrays'''
+        return sum(a.nbytes for a in (self.u, self.z, self.f, self.logf,
+                                      self.dlogf, self.F, self.dF))
+
+    def _locate(self, z: np.ndarray) -> tp.Tuple[np.ndarray, np.ndarray]:
+        '''Interval index and position in [0, 1] of each inner point'''
+        pos = (np.arcsinh(z) - self.u[0]) / self.du
+        i = np.clip(pos.astype(np.intp), 0, len(self.u) - 2)
+        return i, pos - i
+
+    def _split(self, z: np.ndarray):
+        lo = z < self.z[0]
+        hi = z > self.z[-1]
+        return lo, hi, ~(lo | hi | np.isnan(z))
+
+    def pdf(self, z: ArrayLike) -> np.ndarray:
+        '''Standardized density'''
+        z = as_double_array(z)
+        out = np.full(z.shape, np.nan)
+        lo, hi, mid = self._split(z)
+
+        i, t = self._locate(z[mid])
+        out[mid] = np.exp(_hermite(t, self.du, self.logf[i], self.dlogf[i],
+                                   self.logf[i + 1], self.dlogf[i + 1]))
+        if self.zone == Zone.GAUSS:
+            tails = lo | hi
+            out[tails] = [_GAUSS.pdf(v) for v in z[tails]]
+        else:
+            a = self.alpha + 1
+            out[lo] = _power_tail(self.f[0], z[lo] / self.z[0], a)
+            out[hi] = _power_tail(self.f[-1], z[hi] / self.z[-1], a)
+            if self._light is not None:
+                light = lo if self.beta > 0 else hi
+                out[light] = self._light.pdf(z[light])
+        return out
+
+    def cdf(self, z: ArrayLike) -> np.ndarray:
+        '''Standardized cumulative distribution'''
+        z = as_double_array(z)
+        out = np.full(z.shape, np.nan)
+        lo, hi, mid = self._split(z)
+
+        i, t = self._locate(z[mid])
+        out[mid] = _hermite(t, self.du, self.F[i], self.dF[i],
+                            self.F[i + 1], self.dF[i + 1])
+        if self.zone == Zone.GAUSS:
+            tails = lo | hi
+            out[tails] = [_GAUSS.cdf(v) for v in z[tails]]
+        else:
+            a = self.alpha
+            out[lo] = _power_tail(self.F[0], z[lo] / self.z[0], a)
+            out[hi] = 1 - _power_tail(1 - self.F[-1], z[hi] / self.z[-1], a)
+            if self._light is not None and self.beta > 0:
+                out[lo] = self._light.prob(z[lo])
+            elif self._light is not None:
+                out[hi] = 1 - self._light.prob(z[hi])
+        return np.clip(out, 0.0, 1.0)
+
+    def ppf(self, p: ArrayLike) -> np.ndarray:
+        '''Standardized quantile function'''
+        p = as_double_array(p)
+        out = np.full(p.shape, np.nan)
+        out[p <= 0] = -np.inf
+        out[p >= 1] = np.inf
+        lo = (p > 0) & (p < self.F[0])
+        hi = (p < 1) & (p > self.F[-1])
+        mid = (p >= self.F[0]) & (p <= self.F[-1])
+
+        # Hermite interpolation of u(F), then one Newton step on F(u)
+        pm = p[mid]
+        i = np.clip(np.searchsorted(self.F, pm, side='right') - 1, 0,
+                    len(self.F) - 2)
+        h = self.F[i + 1] - self.F[i]
+        safe = h > 0
+        t = np.where(safe, (pm - self.F[i]) / np.where(safe, h, 1), 0.0)
+        u = _hermite(t, h, self.u[i], 1 / self.dF[i],
+                     self.u[i + 1], 1 / self.dF[i + 1])
+        u = np.clip(u, self.u[i], self.u[i + 1])
+        z = np.sinh(u)
+        dF = self.pdf(z) * np.cosh(u)
+        u = u - np.where(dF > 0, (self.cdf(z) - pm) / dF, 0.0)
+        out[mid] = np.sinh(np.clip(u, self.u[i], self.u[i + 1]))
+
+        if self.zone == Zone.GAUSS:
+            tails = lo | hi
+            out[tails] = [_GAUSS.inv_cdf(v) for v in p[tails]]
+        else:
+            a = self.alpha
+            out[lo] = self.z[0] * (p[lo] / self.F[0]) ** (-1 / a)
+            out[hi] = self.z[-1] * ((1 - p[hi]) / (1 - self.F[-1])) ** (-1 / a)
+            if self._light is not None and self.beta > 0:
+                out[lo] = self._light.ppf(p[lo])
+            elif self._light is not None:
+                out[hi] = self._light.ppf(1 - p[hi])
+        return out
+
+
+def _logit(p: np.ndarray) -> np.ndarray:
+    return np.log(p) - np.log1p(-p)
+
+
+class QuantileTable:
+    '''
+    High-resolution table of the quantile function of the standardized
+    distribution S0(alpha, beta, 1, 0), for inverse-transform sampling
+    (see `rnd_table`). Like `StableTable` it serves every (sigma, mu) with
+    the same shape parameters.
+
+    Knots are uniform in t = logit(p) between `p_tail` and `1 - p_tail`,
+    which resolves both tails, and are solved by `stable_q_sorted`. The
+    quantile is a cubic Hermite interpolant in t with the exact slope
+    dz/dt = p (1 - p) / pdf(z). Beyond the table, heavy tails follow the
+    power law z ~ p^(-1/alpha) (or the normal quantile when alpha = 2)
+    anchored to the table edges; the light tail of a totally skewed
+    distribution (|beta| = 1) is the inverse of `_LightTail` instead, which
+    stays within the support when alpha < 1.
+
+    The table is validated on construction against exact quantiles at the
+    midpoints between knots and at tail points beyond the table; the
+    largest deviations are kept in `errors`:
+      q_rel    [float]: max quantile error inside the table, relative to
+                        1 + |z|
+      cdf_abs  [float]: max |cdf(z_k) - p_k| at the knots (root accuracy)
+      tail_rel [float]: max relative quantile error beyond the table
+    `accurate` tells whether they are within `MAX_QUANTILE_ERRORS`.
+    '''
+
+    def __init__(self, alpha: float, beta: float,
+                 knots: int = DEFAULT_QUANTILE_KNOTS,
+                 p_tail: float = DEFAULT_TAIL, path=None):
+        if knots < 4:
+            raise ValueError('`knots` must be at least 4')
+        if not 0 < p_tail < 0.5:
+            raise ValueError('`p_tail` must lie in (0, 0.5)')
+
+        lib = load_libstable(path)
+        zone = stable_checkparams(lib, alpha, beta, 1.0, 0.0, 0)
+        if zone == Zone.NOVALID:
+            raise ValueError('invalid stable parameters: alpha={}, beta={}'
+                             .format(alpha, beta))
+        self.alpha = alpha
+        self.beta = beta
+        self.zone = Zone(zone)
+        self.p_tail = p_tail
+
+        # libstable's Levy quantile for beta = -1 mirrors its cdf's upper
+        # tail; solve beta = 1 instead and reflect, since
+        # S0(alpha, -beta) = -S0(alpha, beta)
+        self._mirror = self.zone == Zone.LEVY and beta < 0
+        dist = stable_create(lib, alpha, -beta if self._mirror else beta,
+                             1.0, 0.0, 0)
+        try:
+            self._build(lib, dist, knots)
+            self.errors = self._validate(lib, dist)
+        finally:
+            stable_free(lib, dist)
+
+    def _exact(self, lib: ct.CDLL, dist: STABLE_DIST,
+               p: np.ndarray) -> np.ndarray:
+        if self._mirror:
+            return -stable_q_sorted(lib, dist, 1 - p)
+        return stable_q_sorted(lib, dist, p)
+
+    def _build(self, lib: ct.CDLL, dist: STABLE_DIST, knots: int) -> None:
+        t_tail = math.log(self.p_tail) - math.log1p(-self.p_tail)
+        self.t = np.linspace(t_tail, -t_tail, knots)
+        self.dt = self.t[1] - self.t[0]
+        self.p = 1 / (1 + np.exp(-self.t))
+        self.z = np.maximum.accumulate(self._exact(lib, dist, self.p))
+
+        f = stable_pdf_array(lib, dist, -self.z if self._mirror else self.z)
+        f = np.maximum(f, np.finfo(float).tiny)
+        self._light = _light_tail(self.alpha, self.beta, self.zone, self.z,
+                                  (self.p[0], 1 - self.p[-1]), (f[0], f[-1]))
+        # Limit the slopes to 3 times the adjacent secants (Fritsch and
+        # Carlson) so the interpolant stays monotone where the pdf is
+        # inaccurate
+        secant = np.diff(self.z) / self.dt
+        bound = 3 * np.minimum(np.append(secant, np.inf),
+                               np.insert(secant, 0, np.inf))
+        self.dz = np.minimum(self.p * (1 - self.p) / f, bound)
+
+        F = stable_cdf_array(lib, dist, -self.z if self._mirror else self.z)
+        self._cdf_abs = float(np.max(np.abs((1 - F if self._mirror else F)
+                                            - self.p)))
+
+    def _validate(self, lib: ct.CDLL, dist: STABLE_DIST
+                  ) -> tp.Dict[str, float]:
+        p = 1 / (1 + np.exp(-(self.t[:-1] + self.dt / 2)))
+        z = self._exact(lib, dist, p)
+        q_rel = np.max(np.abs(self.ppf(p) - z) / (1 + np.abs(z)))
+
+        p = self.p_tail * np.array([1e-1, 1e-2])
+        p = np.concatenate([p, 1 - p])
+        z = self._exact(lib, dist, p)
+        ok = np.isfinite(z) & (z != 0)
+        tail_rel = np.max(np.abs(self.ppf(p[ok]) - z[ok]) / np.abs(z[ok]),
+                          initial=0.0)
+        return {'q_rel': float(q_rel), 'cdf_abs': self._cdf_abs,
+                'tail_rel': float(tail_rel)}
+
+    @property
+    def accurate(self) -> bool:
+        '''Whether all `errors` are within `MAX_QUANTILE_ERRORS`'''
+        return _within(self.errors, MAX_QUANTILE_ERRORS)
+
+    @property
+    def nbytes(self) -> int:
+        '''Memory held by the table arrays'''
+        return sum(a.nbytes for a in (self.t, self.p, self.z, self.dz))
+
+    def ppf(self, p: ArrayLike, out: tp.Optional[np.ndarray] = None
+            ) -> np.ndarray:
+        '''Standardized quantile function'''
+        p = as_double_array(p)
+        if out is None:
+            out = np.empty(p.shape)
+        out.fill(np.nan)
+        out[p <= 0] = -np.inf
+        out[p >= 1] = np.inf
+        lo = (p > 0) & (p < self.p[0])
+        hi = (p < 1) & (p > self.p[-1])
+        mid = (p >= self.p[0]) & (p <= self.p[-1])
+
+        pos = (_logit(p[mid]) - self.t[0]) / self.dt
+        i = np.clip(pos.astype(np.intp), 0, len(self.t) - 2)
+        out[mid] = _hermite(pos - i, self.dt, self.z[i], self.dz[i],
+                            self.z[i + 1], self.dz[i + 1])
+
+        if self.zone == Zone.GAUSS:
+            tails = lo | hi
+            out[tails] = [_GAUSS.inv_cdf(v) for v in p[tails]]
+        else:
+            a = self.alpha
+            out[lo] = self.z[0] * (p[lo] / self.p[0]) ** (-1 / a)
+            out[hi] = self.z[-1] * ((1 - p[hi]) / (1 - self.p[-1])) ** (-1 / a)
+            if self._light is not None and self.beta > 0:
+                out[lo] = self._light.ppf(p[lo])
+            elif self._light is not None:
+                out[hi] = self._light.ppf(1 - p[hi])
+        return out
+
+
+class TabulatedDistribution:
+    '''
+    Fast approximate pdf, cdf and quantiles of S0(alpha, beta, sigma, mu_0)
+    from a `StableTable`. See `StableTable.errors` for the accuracy of the
+    standardized table; the cdf error carries over unchanged, the pdf and
+    quantile errors are relative and scale-free. Tables whose errors
+    exceed `MAX_ERRORS` are refused with a ValueError; evaluate such
+    distributions exactly.
+    '''
+
+    def __init__(self, table: StableTable, sigma: float, mu_0: float):
+        if not table.accurate:
+            raise ValueError(
+                'table of alpha={}, beta={} exceeds MAX_ERRORS: {}'
+                .format(table.alpha, table.beta, table.errors))
+        self.table = table
+        self.sigma = sigma
+        self.mu_0 = mu_0
+
+    @property
+    def errors(self) -> tp.Dict[str, float]:
+        return self.table.errors
+
+    def pdf(self, x: ArrayLike) -> np.ndarray:
+        z = (as_double_array(x) - self.mu_0) / self.sigma
+        return self.table.pdf(z) / self.sigma
+
+    def cdf(self, x: ArrayLike) -> np.ndarray:
+        z = (as_double_array(x) - self.mu_0) / self.sigma
+        return self.table.cdf(z)
+
+    def ppf(self, q: ArrayLike) -> np.ndarray:
+        return self.mu_0 + self.sigma * self.table.ppf(q)
+
+
+def tabulate(dist: STABLE_DIST, knots: int = DEFAULT_KNOTS,
+             p_tail: float = DEFAULT_TAIL, path=None
+             ) -> TabulatedDistribution:
+    '''
+    Build a `TabulatedDistribution` for `dist`. Construction costs a few
+    thousand exact evaluations; lookups are then pure NumPy.
+
+    Inputs:
+      dist   [STABLE_DIST]: pointer to `StableDist` struct
+      knots  [int]:         table size
+      p_tail [float]:       tail probability at which the table ends
+      path   [str]:         optional path to `libstable.so`
+
+    Outputs:
+        [TabulatedDistribution]
+    '''
+    table = StableTable(dist.contents.alpha, dist.contents.beta, knots,
+                        p_tail, path)
+    return TabulatedDistribution(table, dist.contents.sigma,
+                                 dist.contents.mu_0)
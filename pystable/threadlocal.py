@@ -0,0 +1,186 @@
+import threading
+import typing as tp
+import weakref
+import numpy as np
+from pystable.pystable import stable_rnd_seed
+from pystable.arrays import ArrayResult, DEFAULT_METHOD
+from pystable.distribution import StableDistribution
+from pystable.stable_dist import Zone
+from pystable.utils import ArrayLike
+
+
+class ThreadLocalDistribution:
+    '''
+    Stable distribution that can be used from many threads at once.
+
+    A `StableDist` holds one GSL integration workspace and one random
+    number generator, so concurrent calls on the same struct race. This
+    class keeps a private `stable_copy` clone per thread, created on the
+    thread's first call and freed when the thread exits or on `close()`.
+    The parameters live in a template distribution that is never evaluated;
+    `setparams` updates it and each clone re-syncs on its thread's next
+    call.
+
+    Each clone's generator is seeded from its own substream of `seed`
+    (`numpy.random.SeedSequence`), since clones would otherwise share
+    libstable's default seed and draw identical samples.
+
+    Parameters:
+      alpha            [float]: Stability index
+      beta             [float]: Skewness parameter
+      sigma            [float]: Scale parameter
+      mu               [float]: Location parameter
+      parameterization [int]:   0 or 1 (Nolan, 1997)
+      path             [str]:   Optional path to `libstable.so`
+      seed             [int]:   Optional seed for the clones' generators
+    '''
+
+    def __init__(self, alpha: float, beta: float, sigma: float, mu: float,
+                 parameterization: int = 1, path=None,
+                 seed: tp.Optional[int] = None):
+        self._init(StableDistribution(alpha, beta, sigma, mu,
+                                      parameterization, path), seed)
+
+    @classmethod
+    def from_distribution(cls, dist: StableDistribution,
+                          seed: tp.Optional[int] = None
+                          ) -> 'ThreadLocalDistribution':
+        '''Share a copy of `dist` across threads'''
+        obj = cls.__new__(cls)
+        obj._init(dist.copy(), seed)
+        return obj
+
+    def _init(self, template: StableDistribution,
+              seed: tp.Optional[int]) -> None:
+        self._template = template
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._version = 0
+        self._seeds = np.random.SeedSequence(seed)
+        self._clones: tp.MutableSet[StableDistribution] = weakref.WeakSet()
+
+    def __enter__(self) -> 'ThreadLocalDistribution':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        if self.closed:
+            return 'ThreadLocalDistribution(closed)'
+        return ('ThreadLocalDistribution(alpha={}, beta={}, sigma={}, '
+                'mu_1={}, clones={})'.format(self.alpha, self.beta,
+                                             self.sigma, self.mu_1,
+                                             self.clones))
+
+    def close(self) -> None:
+        '''
+        Free the template and the clones of every thread. No calls may be
+        running on other threads.
+        '''
+        with self._lock:
+            for clone in list(self._clones):
+                clone.close()
+            self._template.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._template.closed
+
+    @property
+    def clones(self) -> int:
+        '''Number of live per-thread clones'''
+        return len(self._clones)
+
+    def local(self) -> StableDistribution:
+        '''
+        This thread's clone, up to date with the current parameters. It
+        must not be shared with other threads.
+        '''
+        local = self._local
+        clone = getattr(local, 'dist', None)
+        if clone is not None and local.version == self._version:
+            return clone
+
+        with self._lock:
+            template = self._template
+            if clone is None:
+                clone = template.copy()
+                seed = self._seeds.spawn(1)[0].generate_state(1)[0]
+                stable_rnd_seed(clone._lib, clone.dist, int(seed))
+                self._clones.add(clone)
+                local.dist = clone
+            else:
+                clone.setparams(template.alpha, template.beta,
+                                template.sigma, template.mu_0, 0)
+            local.version = self._version
+        return clone
+
+    @property
+    def alpha(self) -> float:
+        return self._template.alpha
+
+    @property
+    def beta(self) -> float:
+        return self._template.beta
+
+    @property
+    def sigma(self) -> float:
+        return self._template.sigma
+
+    @property
+    def mu_0(self) -> float:
+        return self._template.mu_0
+
+    @property
+    def mu_1(self) -> float:
+        return self._template.mu_1
+
+    @property
+    def params(self) -> tp.Dict[str, float]:
+        return self._template.params
+
+    def setparams(self, alpha: float, beta: float, sigma: float, mu: float,
+                  parameterization: int = 1) -> Zone:
+        '''
+        Reparameterize for all threads. Calls already running on other
+        threads finish with the previous parameters.
+        '''
+        with self._lock:
+            zone = self._template.setparams(alpha, beta, sigma, mu,
+                                            parameterization)
+            self._version += 1
+        return zone
+
+    def pdf(self, x: ArrayLike, out: tp.Optional[np.ndarray] = None,
+            return_err: bool = False) -> ArrayResult:
+        return self.local().pdf(x, out, return_err)
+
+    def cdf(self, x: ArrayLike, out: tp.Optional[np.ndarray] = None,
+            return_err: bool = False) -> ArrayResult:
+        return self.local().cdf(x, out, return_err)
+
+    def ppf(self, q: ArrayLike, out: tp.Optional[np.ndarray] = None,
+            return_err: bool = False) -> ArrayResult:
+        return self.local().ppf(q, out, return_err)
+
+    def rvs(self, size: tp.Union[int, tp.Tuple[int, ...]] = 1,
+            seed: tp.Optional[int] = None,
+            out: tp.Optional[np.ndarray] = None) -> np.ndarray:
+        '''
+        Draw samples from this thread's generator, reseeding it first if
+        `seed` is given
+        '''
+        return self.local().rvs(size, seed, out)
+
+    def fit(self, data: ArrayLike, method: str = DEFAULT_METHOD) -> int:
+        '''
+        Fit to `data` on a temporary copy, then reparameterize all threads
+        with the result
+        '''
+        with self._lock:
+            work = self._template.copy()
+        with work:
+            status = work.fit(data, method)
+            self.setparams(work.alpha, work.beta, work.sigma, work.mu_0, 0)
+        return status
@@ -1,5 +1,9 @@
+import ctypes as ct
 import platform
 import os
+import typing as tp
+import numpy as np
+from pystable import native
 
 BASE = 'pystable/_extensions/'
 PATH_LINUX_GLIBC_2_31 = '{}linux/gclib-2-31/libstable.so'.format(BASE)
@@ -9,7 +13,12 @@ PATH_MAC_OS_I386 = '{}macOS/i386/libstable.so'.format(BASE)
 
 
 def libstable_path(libstable_path=None) -> str:
-    '''Get path to libstable.so'''
+    '''
+    Get path to libstable.so: the compiled binding `pystable._native` if it
+    is built (see `native`), otherwise the prebuilt library of the platform
+    '''
+    if libstable_path is None and native.AVAILABLE:
+        return native.library_path()
     if libstable_path is None:
         platform_id = platform.platform()
 
@@ -41,3 +50,54 @@ def libstable_path(libstable_path=None) -> str:
     path = os.path.dirname(os.path.realpath(__file__))
     path = os.path.abspath(os.path.join(path, os.pardir))
     return os.path.abspath(os.path.join(path, libstable_path))
+
+
+LP_c_double = ct.POINTER(ct.c_double)
+ArrayLike = tp.Union[np.ndarray, memoryview, tp.Sequence[float]]
+
+
+def as_double_array(x: ArrayLike) -> np.ndarray:
+    '''
+    View `x` as a contiguous float64 NumPy array. Objects exposing a
+    contiguous float64 buffer (NumPy arrays, memoryviews, `array.array('d')`)
+    are viewed without copying; anything else is converted once.
+    '''
+    return np.ascontiguousarray(x, dtype=np.float64).reshape(-1)
+
+
+def output_array(out: tp.Optional[np.ndarray], n: int,
+                 name: str = 'out') -> np.ndarray:
+    '''Validate a caller-supplied output buffer or allocate a new one'''
+    if out is None:
+        return np.empty(n, dtype=np.float64)
+    if not isinstance(out, np.ndarray):
+        raise TypeError('{} must be a numpy.ndarray'.format(name))
+    if out.dtype != np.float64 or not out.flags.c_contiguous:
+        raise ValueError('{} must be a C-contiguous float64 array'
+                         .format(name))
+    if not out.flags.writeable:
+        raise ValueError('{} must be writeable'.format(name))
+    if out.size != n:
+        raise ValueError('{} has size {}, expected {}'
+                         .format(name, out.size, n))
+    return out
+
+
+def pointer(arr: tp.Optional[np.ndarray]) -> LP_c_double:
+    '''Pointer to the first element of `arr`, or NULL when `arr` is None'''
+    if arr is None:
+        return LP_c_double()
+    return arr.ctypes.data_as(LP_c_double)
+
+
+def sample_shape(n: tp.Optional[int], size, out: tp.Optional[np.ndarray]
+                 ) -> tp.Tuple[int, ...]:
+    '''Resolve the output shape of a sampler from `size`, `n` or `out`'''
+    if size is None:
+        if n is not None:
+            size = n
+        elif out is not None:
+            size = out.shape
+        else:
+            raise ValueError('one of `n`, `size` or `out` is required')
+    return (int(size),) if np.isscalar(size) else tuple(size)
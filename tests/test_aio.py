@@ -0,0 +1,164 @@
+import asyncio
+import gc
+import threading
+import numpy as np
+import unittest
+import pystable
+from pystable import aio
+
+
+class TestAio(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.dist = pystable.StableDistribution(1.5, 0.2, 1.0, 0.0, 1)
+        self.x = np.linspace(-5, 5, 101)
+        self.executor = aio.AsyncExecutor(workers=2, max_pending=4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self.dist.close()
+
+    async def test_evaluate(self):
+        '''Test coroutines match the synchronous array functions'''
+        q = np.linspace(0.01, 0.99, 25)
+        pdf, cdf, quantiles = await asyncio.gather(
+            aio.apdf(self.dist, self.x, executor=self.executor,
+                     chunk_size=10),
+            aio.acdf(self.dist.dist, self.x, executor=self.executor),
+            aio.aq(self.dist, q, executor=self.executor, chunk_size=7))
+        np.testing.assert_array_equal(self.dist.pdf(self.x), pdf)
+        np.testing.assert_array_equal(self.dist.cdf(self.x), cdf)
+        np.testing.assert_array_equal(self.dist.ppf(q), quantiles)
+
+        out = np.empty_like(self.x)
+        pdf, err = await aio.apdf(self.dist, self.x, out=out,
+                                  return_err=True, executor=self.executor)
+        self.assertIs(out, pdf)
+        self.assertEqual(self.x.shape, err.shape)
+
+    async def test_shared_distribution(self):
+        '''Test concurrent calls on one distribution are serialized'''
+        expected = self.dist.pdf(self.x)
+        results = await asyncio.gather(*(
+            aio.apdf(self.dist, self.x, executor=self.executor,
+                     chunk_size=16) for _ in range(8)))
+        for pdf in results:
+            np.testing.assert_array_equal(expected, pdf)
+
+    async def test_alpha_regimes(self):
+        '''Test concurrent calls on both sides of alpha = 1 stay exact'''
+        executor = aio.AsyncExecutor(workers=4)
+        x = np.linspace(-50, 50, 400)
+        params = [(0.6, 0.5), (1.6, 0.5), (1.0, 0.5), (1.0, -0.5)] * 2
+        expected = []
+        for alpha, beta in params:
+            # libstable's constants are those of the last parameterization
+            with pystable.StableDistribution(alpha, beta, 1.0, 0.0, 1) as d:
+                expected.append(d.pdf(x))
+
+        dists = [pystable.StableDistribution(alpha, beta, 1.0, 0.0, 1)
+                 for alpha, beta in params]
+        try:
+            results = await asyncio.gather(*(
+                aio.apdf(d, x, executor=executor, chunk_size=25)
+                for d in dists))
+        finally:
+            executor.shutdown()
+            for d in dists:
+                d.close()
+        for pdf, actual in zip(expected, results):
+            np.testing.assert_array_equal(pdf, actual)
+
+    async def test_fit_and_rnd(self):
+        '''Test `afit` and `arnd` against their synchronous versions'''
+        with self.dist.copy() as other:
+            expected = other.rvs((10, 20), seed=3)
+        samples = await aio.arnd(self.dist, size=(10, 20), seed=3,
+                                 executor=self.executor)
+        np.testing.assert_array_equal(expected, samples)
+
+        data = samples.reshape(-1)
+        with pystable.StableDistribution(2.0, 0.0, 1.0, 0.0, 1) as fitted:
+            fitted.fit(data, 'mcculloch')
+            status = await aio.afit(self.dist, data, 'mcculloch',
+                                    executor=self.executor)
+            self.assertEqual(0, status)
+            self.assertEqual(fitted.alpha, self.dist.alpha)
+            self.assertEqual(fitted.beta, self.dist.beta)
+
+    async def test_backpressure(self):
+        '''Test no more than `max_pending` calls are submitted at once'''
+        release = threading.Event()
+        seen = []
+
+        def blocked(cancelled):
+            seen.append(self.executor.pending)
+            release.wait(5)
+
+        tasks = [asyncio.ensure_future(self.executor.run(blocked))
+                 for _ in range(10)]
+        await asyncio.sleep(0.1)
+        self.assertEqual(4, self.executor.pending)
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(0, self.executor.pending)
+        self.assertLessEqual(max(seen), 4)
+
+    async def test_cancel(self):
+        '''Test cancelled calls do not run, or stop between chunks'''
+        executor = aio.AsyncExecutor(workers=1)
+        release = threading.Event()
+        ran = []
+
+        first = asyncio.ensure_future(
+            executor.run(lambda cancelled: release.wait(5)))
+        second = asyncio.ensure_future(
+            executor.run(lambda cancelled: ran.append(True)))
+        await asyncio.sleep(0.05)
+        second.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await second
+        release.set()
+        await first
+        await executor.run(lambda cancelled: None)
+        self.assertEqual([], ran)
+
+        # A cancelled call keeps its slot until its thread is done
+        release.clear()
+        running = asyncio.ensure_future(
+            executor.run(lambda cancelled: release.wait(5)))
+        await asyncio.sleep(0.05)
+        running.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await running
+        self.assertEqual(1, executor.pending)
+        release.set()
+        await executor.run(lambda cancelled: None)
+        self.assertEqual(0, executor.pending)
+        executor.shutdown()
+
+        cancelled = threading.Event()
+        cancelled.set()
+        out = np.zeros_like(self.x)
+        aio._evaluate_chunks(pystable.pystable.c_stable_pdf(self.dist._lib),
+                             'pdf', self.dist.dist, self.x, out, None, 10,
+                             cancelled)
+        np.testing.assert_array_equal(np.zeros_like(self.x), out)
+
+    def test_dist_lock(self):
+        '''Test one lock per distribution, shared by pointer and object'''
+        lock = aio.dist_lock(self.dist)
+        self.assertIs(lock, aio.dist_lock(self.dist.dist))
+        with self.dist.copy() as other:
+            self.assertIsNot(lock, aio.dist_lock(other))
+
+        # Unused locks are dropped
+        count = len(aio._LOCKS)
+        with self.dist.copy() as other:
+            aio.dist_lock(other)
+        gc.collect()
+        self.assertEqual(count, len(aio._LOCKS))
+
+
+if __name__ == '__main__':
+    unittest.main()
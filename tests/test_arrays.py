@@ -0,0 +1,139 @@
+import os
+import array
+import pandas as pd
+import numpy as np
+import unittest
+import pystable
+
+
+HAS_VECTOR = hasattr(pystable.load_libstable(), 'stable_pdf_v')
+
+
+class TestArrays(unittest.TestCase):
+
+    def get_fit(self):
+        '''Get fit dist parameter'''
+        base = os.path.dirname(os.path.abspath(__file__))
+        base = os.path.join(base, 'helpers/fit.csv')
+        return pd.read_csv(base).to_dict(orient='records')[0]
+
+    def get_helper(self, file_name: str) -> pd.DataFrame:
+        base = os.path.dirname(os.path.abspath(__file__))
+        base = os.path.join(base, 'helpers')
+        return pd.read_csv(os.path.join(base, file_name))
+
+    def get_dist(self):
+        fit = self.get_fit()
+        return pystable.create(fit['alpha'], fit['beta'], fit['sigma'],
+                               fit['mu'], fit['parameterization'])
+
+    def test_as_double_array_no_copy(self):
+        '''Test `as_double_array` views float64 buffers without copying'''
+        x = np.linspace(-1, 1, 11)
+        self.assertTrue(np.shares_memory(x, pystable.as_double_array(x)))
+
+        buf = array.array('d', [0.1, 0.2, 0.3])
+        actual = pystable.as_double_array(memoryview(buf))
+        actual[0] = 1.0
+        self.assertEqual(1.0, buf[0])
+
+    def test_pdf_array(self):
+        '''Test `pdf_array` wrapper'''
+        pdfs = self.get_helper('pdfs.csv')
+        expected = pdfs['value'].to_numpy()
+
+        actual = pystable.pdf_array(self.get_dist(), pdfs['x'].to_numpy())
+        self.assertIsInstance(actual, np.ndarray)
+        np.testing.assert_allclose(expected, actual, rtol=1e-06)
+
+    def test_cdf_array(self):
+        '''Test `cdf_array` wrapper with a caller-supplied output'''
+        cdfs = self.get_helper('cdfs.csv')
+        expected = cdfs['value'].to_numpy()
+        x = cdfs['x'].to_numpy()
+
+        out = np.empty_like(x)
+        actual = pystable.cdf_array(self.get_dist(), x, out=out)
+        self.assertIs(out, actual)
+        np.testing.assert_allclose(expected, actual, rtol=1e-08)
+
+    def test_q_array_err(self):
+        '''Test `q_array` returns per-point error estimates'''
+        quantiles = self.get_helper('quantiles.csv')
+        expected = quantiles['value'].to_numpy()
+
+        actual, err = pystable.q_array(self.get_dist(),
+                                       quantiles['q'].to_numpy(),
+                                       return_err=True)
+        np.testing.assert_allclose(expected, actual, rtol=1e-05)
+        self.assertEqual(actual.shape, err.shape)
+        self.assertTrue(np.all(np.isfinite(err)))
+
+    def test_pdf_array_bad_out(self):
+        '''Test `pdf_array` rejects mismatched output buffers'''
+        dist = self.get_dist()
+        x = np.zeros(4)
+        with self.assertRaises(ValueError):
+            pystable.pdf_array(dist, x, out=np.empty(3))
+        with self.assertRaises(ValueError):
+            pystable.pdf_array(dist, x, out=np.empty(4, dtype=np.float32))
+        with self.assertRaises(TypeError):
+            pystable.pdf_array(dist, x, out=[0.0] * 4)
+
+    def test_fit_array(self):
+        '''Test `fit_array` matches `fit` on the same samples'''
+        dist = self.get_dist()
+        pystable.stable_rnd_seed(pystable.load_libstable(), dist, 1)
+        samples = pystable.rnd(dist, 1000)
+
+        expected = pystable.create(2, 0, 1, 0, 1)
+        pystable.fit(expected, samples, len(samples))
+
+        actual = pystable.create(2, 0, 1, 0, 1)
+        pystable.fit_array(actual, np.asarray(samples))
+        self.assertAlmostEqual(expected.contents.alpha,
+                               actual.contents.alpha, places=10)
+        self.assertAlmostEqual(expected.contents.sigma,
+                               actual.contents.sigma, places=10)
+
+    def test_fit_array_degenerate(self):
+        '''Test a rejected McCulloch estimate is reported'''
+        dist = pystable.create(1.5, 0.5, 2.0, 1.0, 1)
+        data = pystable.rnd(dist, 500, seed=1)
+        self.assertEqual(0, pystable.fit_array(dist, data, 'mcculloch'))
+
+        expected = (dist.contents.alpha, dist.contents.sigma)
+        for method in ('mcculloch', 'koutrouvelis'):
+            status = pystable.fit_array(dist, np.full(100, 3.0), method)
+            self.assertEqual(pystable.FIT_INIT_FAILED, status)
+            self.assertEqual(expected, (dist.contents.alpha,
+                                        dist.contents.sigma))
+
+    def test_engine_unknown(self):
+        '''Test an unknown engine is rejected'''
+        with self.assertRaises(ValueError):
+            pystable.pdf_array(self.get_dist(), np.zeros(4), engine='simd')
+
+    @unittest.skipIf(HAS_VECTOR, 'libstable has the vector engine')
+    def test_vector_engine_unavailable(self):
+        '''Test a libstable without `stable_pdf_v` raises clearly'''
+        with self.assertRaises(NotImplementedError):
+            pystable.cdf_array(self.get_dist(), np.zeros(4), engine='vector')
+
+    @unittest.skipUnless(HAS_VECTOR, 'libstable lacks the vector engine')
+    def test_vector_engine(self):
+        '''Test the vector engine agrees with the point engine'''
+        x = np.concatenate((np.linspace(-20, 20, 801), [np.nan, np.inf]))
+        for params in ((0.7, 0.3, 1.0, 0.0, 1), (1.5, 0.5, 2.0, 1.0, 0),
+                       (1.5, 1.0, 1.0, 0.0, 1), (1.0, 0.5, 1.0, 0.0, 1)):
+            dist = pystable.create(*params)
+            pdf, err = pystable.pdf_array(dist, x, return_err=True,
+                                          engine='vector')
+            np.testing.assert_allclose(pystable.pdf_array(dist, x), pdf,
+                                       rtol=1e-5, atol=1e-12)
+            self.assertEqual(x.shape, err.shape)
+
+            cdf = pystable.cdf_array(dist, x, engine='vector')
+            np.testing.assert_allclose(pystable.cdf_array(dist, x), cdf,
+                                       atol=1e-3)
+            self.assertTrue(np.all(np.diff(cdf[:-2]) >= -1e-12))
@@ -0,0 +1,120 @@
+import numpy as np
+import unittest
+import pystable
+
+
+class TestBatch(unittest.TestCase):
+
+    alpha = 1.4430192097069168
+    beta = 0.042938293127910906
+    sigma = np.array([0.004747879945834797, 0.002, 0.01])
+    mu = np.array([-0.0004197632840157609, 0.0, 0.001])
+    x = np.linspace(-0.03, 0.03, 25)
+
+    def expected(self, fn: str, parameterization: int) -> np.ndarray:
+        rows = []
+        for sigma, mu in zip(self.sigma, self.mu):
+            dist = pystable.create(self.alpha, self.beta, sigma, mu,
+                                   parameterization)
+            rows.append(getattr(pystable, fn)(dist, self.x, len(self.x)))
+        return np.array(rows)
+
+    def test_mu_0_of(self):
+        '''Test parameterization conversion matches libstable'''
+        dist = pystable.create(self.alpha, self.beta, 0.5, 0.3, 1)
+        actual = pystable.mu_0_of(self.alpha, self.beta, 0.5, 0.3, 1)
+        self.assertAlmostEqual(dist.contents.mu_0, float(actual), places=12)
+
+        dist = pystable.create(1.0, 0.5, 0.5, 0.3, 1)
+        actual = pystable.mu_0_of(1.0, 0.5, 0.5, 0.3, 1)
+        self.assertAlmostEqual(dist.contents.mu_0, float(actual), places=12)
+
+    def test_pdf_batch(self):
+        '''Test `pdf_batch` matches per-distribution evaluation'''
+        for parameterization in (0, 1):
+            actual = pystable.pdf_batch(self.alpha, self.beta, self.sigma,
+                                        self.mu, self.x, parameterization)
+            self.assertEqual((3, 25), actual.shape)
+            np.testing.assert_allclose(self.expected('pdf', parameterization),
+                                       actual, rtol=1e-08)
+
+    def test_cdf_batch(self):
+        '''Test `cdf_batch` matches per-distribution evaluation'''
+        actual = pystable.cdf_batch(self.alpha, self.beta, self.sigma,
+                                    self.mu, self.x)
+        np.testing.assert_allclose(self.expected('cdf', 1), actual,
+                                   rtol=1e-08)
+
+    def test_tabulated(self):
+        '''Test the tabulated batch agrees with the exact one'''
+        actual = pystable.pdf_batch(self.alpha, self.beta, self.sigma,
+                                    self.mu, self.x, tabulated=True)
+        np.testing.assert_allclose(self.expected('pdf', 1), actual,
+                                   rtol=1e-04)
+
+    def test_rows(self):
+        '''Test per-row points and invalid inputs'''
+        x = np.vstack([self.x, self.x + 0.01, self.x - 0.01])
+        actual = pystable.cdf_batch(self.alpha, self.beta, self.sigma,
+                                    self.mu, x)
+        self.assertEqual((3, 25), actual.shape)
+
+        with self.assertRaises(ValueError):
+            pystable.pdf_batch(self.alpha, self.beta, self.sigma,
+                               self.mu[:2], self.x)
+        with self.assertRaises(ValueError):
+            pystable.pdf_batch(self.alpha, self.beta, -self.sigma,
+                               self.mu, self.x)
+        with self.assertRaises(ValueError):
+            pystable.pdf_batch(3.0, self.beta, self.sigma, self.mu, self.x)
+
+    def test_grid(self):
+        '''Test `pdf_grid` and `cdf_grid` match per-distribution evaluation'''
+        alpha = np.array([1.5, 0.8, 2.0, 1.0, 1.95])
+        beta = np.array([0.3, -0.5, 0.0, 0.2, 1.0])
+        sigma = np.array([1.0, 0.5, 2.0, 1.5, 0.7])
+        mu = np.array([0.0, 0.2, -1.0, 0.5, 0.0])
+        x = np.linspace(-5, 5, 21)
+        for fn in ('pdf', 'cdf'):
+            expected = np.array([getattr(pystable, fn)(
+                pystable.create(*params, 1), x, x.size)
+                for params in zip(alpha, beta, sigma, mu)])
+            grid = getattr(pystable, fn + '_grid')
+            for workers in (1, 3):
+                actual = grid(alpha, beta, sigma, mu, x, workers=workers)
+                self.assertEqual((5, 21), actual.shape)
+                np.testing.assert_allclose(expected, actual, rtol=1e-06)
+
+    def test_grid_regimes(self):
+        '''Test rows on both sides of alpha = 1 do not corrupt each other'''
+        alpha = np.tile([0.6, 1.6, 1.0, 1.0], 4)
+        beta = np.tile([0.5, 0.5, 0.5, -0.5], 4)
+        x = np.linspace(-50, 50, 101)
+        expected = pystable.pdf_grid(alpha, beta, 1.0, 0.0, x, workers=1)
+        for workers in (2, 4, 8):
+            actual = pystable.pdf_grid(alpha, beta, 1.0, 0.0, x,
+                                       workers=workers)
+            np.testing.assert_allclose(expected, actual, rtol=1e-12)
+
+    def test_grid_rows(self):
+        '''Test per-row points, broadcasting and invalid parameter sets'''
+        x = np.vstack([self.x, self.x + 0.01, self.x - 0.01])
+        out = np.empty((3, 25))
+        actual, err = pystable.pdf_grid(self.alpha, [self.beta, 2.0, 0.0],
+                                        self.sigma, self.mu, x, out=out,
+                                        return_err=True, workers=2)
+        self.assertTrue(np.shares_memory(out, actual))
+        self.assertEqual((3, 25), err.shape)
+        self.assertTrue(np.all(np.isnan(actual[1])))
+        self.assertTrue(np.all(np.isnan(err[1])))
+        expected = pystable.pdf_array(
+            pystable.create(self.alpha, 0.0, self.sigma[2], self.mu[2], 1),
+            x[2])
+        np.testing.assert_allclose(expected, actual[2], rtol=1e-06)
+
+        with self.assertRaises(ValueError):
+            pystable.pdf_grid([1.5, 1.6], self.beta, self.sigma, self.mu,
+                              self.x)
+        with self.assertRaises(ValueError):
+            pystable.cdf_grid(self.alpha, self.beta, self.sigma, self.mu,
+                              x[:2])
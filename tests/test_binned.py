@@ -0,0 +1,82 @@
+import numpy as np
+import unittest
+import pystable
+
+
+class TestBinned(unittest.TestCase):
+
+    def setUp(self):
+        dist = pystable.create(1.5, 0.2, 1.0, 0.0, 1)
+        self.data = pystable.rnd(dist, 5000, seed=2)
+
+    def test_quantile_bins(self):
+        '''Test bins conserve count and sum, with exact extreme points'''
+        points, weights = pystable.quantile_bins(self.data, 200)
+        self.assertLessEqual(points.size, 200)
+        self.assertEqual(self.data.size, weights.sum())
+        self.assertAlmostEqual(self.data.sum(), points @ weights, 6)
+        self.assertTrue(np.all(np.diff(points) >= 0))
+        self.assertEqual(1, weights[0])
+        self.assertEqual(1, weights[-1])
+        self.assertEqual(self.data.min(), points[0])
+        self.assertEqual(self.data.max(), points[-1])
+
+        points, weights = pystable.quantile_bins(self.data[:100], 200)
+        np.testing.assert_array_equal(np.sort(self.data[:100]), points)
+        np.testing.assert_array_equal(np.ones(100), weights)
+
+    def test_histogram_bins(self):
+        '''Test equal-width bins conserve count and sum'''
+        points, weights = pystable.histogram_bins(self.data, 500)
+        self.assertEqual(self.data.size, weights.sum())
+        self.assertAlmostEqual(self.data.sum(), points @ weights, 6)
+        self.assertTrue(np.all(weights > 0))
+
+    def test_stratified_subsample(self):
+        '''Test the sample size, weights and reproducibility'''
+        points, weights = pystable.stratified_subsample(self.data, 500, 50,
+                                                        seed=1)
+        self.assertEqual(500, points.size)
+        self.assertAlmostEqual(self.data.size, weights.sum())
+        self.assertTrue(np.all(np.isin(points, self.data)))
+        again, _ = pystable.compress(self.data, 'subsample', size=500,
+                                     strata=50, seed=1)
+        np.testing.assert_array_equal(points, again)
+        with self.assertRaises(ValueError):
+            pystable.compress(self.data, 'kde')
+
+    def test_stratified_subsample_large(self):
+        '''Test sizes close to the sample size never overdraw a stratum'''
+        for n, size, strata in ((16, 15, 10), (1000, 999, 64),
+                                (1001, 10, 10)):
+            data = np.arange(float(n))
+            points, weights = pystable.stratified_subsample(data, size,
+                                                            strata, seed=1)
+            self.assertEqual(size, points.size)
+            self.assertEqual(size, np.unique(points).size)
+            self.assertAlmostEqual(n, weights.sum())
+
+    def test_fit_binned(self):
+        '''Test binned fits approach the exact fit and report errors'''
+        result = pystable.fit_binned(self.data, bins=200, reference='fit')
+        self.assertEqual(0, result.status)
+        self.assertLessEqual(result.points, 200)
+        self.assertIsNotNone(result.exact)
+        self.assertLess(result.param_error['alpha'], 0.02)
+        self.assertLess(result.param_error['beta'], 0.05)
+        self.assertLess(result.param_error['sigma'], 0.01)
+        self.assertLess(result.loglike_error, 1e-3)
+
+        result = pystable.fit_binned(self.data, 'subsample', 1000, seed=1,
+                                     reference='loglike')
+        self.assertIsNone(result.exact)
+        self.assertIsNone(result.param_error)
+        self.assertLess(result.loglike_error, 0.05)
+        self.assertLess(abs(result.alpha - 1.5), 0.1)
+
+        with self.assertRaises(ValueError):
+            pystable.fit_binned(self.data, reference='exact')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import threading
+import numpy as np
+import unittest
+import pystable
+
+
+class TestDistributionCache(unittest.TestCase):
+
+    def test_get(self):
+        '''Test repeated lookups return the same distribution'''
+        cache = pystable.DistributionCache()
+        expected = cache.get(1.5, 0.1, 1.0, 0.0, 1)
+        actual = cache.get(1.5 + 1e-15, 0.1, 1.0, 0.0, 1)
+        self.assertIs(expected, actual)
+
+        stats = cache.stats()
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(1, stats.entries)
+        self.assertGreater(stats.nbytes, 0)
+
+    def test_read_only(self):
+        '''Test callers cannot modify the shared entry'''
+        cache = pystable.DistributionCache()
+        dist = cache.get(1.5, 0.1, 1.0, 0.0, 1)
+        x = np.linspace(-3, 3, 7)
+        expected = dist.pdf(x)
+        data = pystable.rnd(pystable.create(1.2, 0.5, 2.0, 1.0, 1), 500,
+                            seed=1)
+        with self.assertRaises(ValueError):
+            dist.setparams(1.9, 0.0, 1.0, 0.0, 1)
+        with self.assertRaises(ValueError):
+            dist.fit(data)
+        with self.assertRaises(ValueError):
+            dist.close()
+
+        private = dist.copy()
+        private.fit(data)
+        self.assertNotAlmostEqual(1.5, private.alpha)
+        actual = cache.get(1.5, 0.1, 1.0, 0.0, 1)
+        self.assertIs(dist, actual)
+        self.assertEqual(1.5, actual.alpha)
+        np.testing.assert_array_equal(expected, actual.pdf(x))
+
+    def test_lru_eviction(self):
+        '''Test least recently used entries are evicted first'''
+        cache = pystable.DistributionCache(max_entries=2)
+        first = cache.get(1.5, 0.0, 1.0, 0.0)
+        cache.get(1.6, 0.0, 1.0, 0.0)
+        cache.get(1.5, 0.0, 1.0, 0.0)
+        cache.get(1.7, 0.0, 1.0, 0.0)
+
+        self.assertIs(first, cache.get(1.5, 0.0, 1.0, 0.0))
+        stats = cache.stats()
+        self.assertEqual(1, stats.evictions)
+        self.assertEqual(2, stats.entries)
+        self.assertFalse(first.closed)
+
+    def test_max_bytes(self):
+        '''Test the memory bound evicts entries'''
+        cache = pystable.DistributionCache(max_bytes=1)
+        cache.get(1.5, 0.0, 1.0, 0.0)
+        cache.get(1.6, 0.0, 1.0, 0.0)
+        self.assertEqual(1, len(cache))
+
+    def test_max_bytes_clones(self):
+        '''Test per-thread clones count towards the memory bound'''
+        cache = pystable.DistributionCache()
+        dist = cache.get(1.5, 0.0, 1.0, 0.0)
+        single = cache.stats().nbytes
+        ready, done = threading.Barrier(4), threading.Event()
+
+        def work():
+            # Clones live as long as their threads
+            dist.pdf([0.0])
+            ready.wait()
+            done.wait()
+
+        threads = [threading.Thread(target=work) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        try:
+            ready.wait()
+            self.assertEqual(3, dist.clones)
+            self.assertEqual(4 * single, cache.stats().nbytes)
+            cache.max_bytes = 5 * single - 1
+            cache.get(1.6, 0.0, 1.0, 0.0)
+            self.assertEqual(1, len(cache))
+            self.assertEqual(single, cache.stats().nbytes)
+        finally:
+            done.set()
+            for thread in threads:
+                thread.join()
+
+    def test_table_shared(self):
+        '''Test one table serves every (sigma, mu) with the same shape'''
+        cache = pystable.DistributionCache()
+        first = cache.tabulate(1.5, 0.1, 1.0, 0.0, knots=257)
+        second = cache.tabulate(1.5, 0.1, 2.0, 1.0, knots=257)
+        self.assertIs(first.table, second.table)
+
+        x = np.linspace(-3, 3, 7)
+        expected = cache.get(1.5, 0.1, 2.0, 1.0).pdf(x)
+        np.testing.assert_allclose(expected, second.pdf(x), rtol=1e-03)
+
+    def test_invalidate(self):
+        '''Test explicit invalidation'''
+        cache = pystable.DistributionCache()
+        cache.tabulate(1.5, 0.1, 1.0, 0.0, knots=257)
+        cache.get(1.5, 0.1, 2.0, 0.0)
+        cache.get(1.2, 0.1, 2.0, 0.0)
+
+        self.assertEqual(1, cache.invalidate(1.5, 0.1, sigma=2.0))
+        self.assertEqual(2, cache.invalidate(1.5, 0.1))
+        self.assertEqual(1, len(cache))
+        cache.clear()
+        self.assertEqual(0, cache.stats().nbytes)
+
+    def test_threads(self):
+        '''Test concurrent lookups share one entry'''
+        cache = pystable.DistributionCache()
+        results = []
+
+        def work():
+            results.append(cache.get(1.3, 0.2, 1.0, 0.0))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(1, len({id(r) for r in results}))
+        self.assertEqual(1, len(cache))
+
+    def test_create_cached(self):
+        '''Test the module-level default cache'''
+        expected = pystable.create_cached(1.4, 0.0, 1.0, 0.0)
+        self.assertIs(expected, pystable.create_cached(1.4, 0.0, 1.0, 0.0))
@@ -0,0 +1,83 @@
+import numpy as np
+import unittest
+import pystable
+from pystable.closed_form import (CDF_MAX_POINTS, Q_MAX_POINTS,
+                                  closed_form, zone)
+from pystable.stable_dist import Zone
+
+
+class TestClosedForm(unittest.TestCase):
+
+    # (alpha, beta, sigma, mu, parameterization, zone)
+    CASES = [(2.0, 0.0, 1.5, 0.3, 1, Zone.GAUSS),
+             (2.0, 0.7, 0.5, -1.0, 0, Zone.GAUSS),
+             (1.0, 0.0, 2.0, 0.5, 1, Zone.CAUCHY),
+             (0.5, 1.0, 1.0, 0.0, 1, Zone.LEVY),
+             (0.5, 1.0, 0.7, 2.0, 0, Zone.LEVY),
+             (0.5, -1.0, 1.3, 0.0, 1, Zone.LEVY)]
+
+    def setUp(self):
+        self.x = np.concatenate((np.linspace(-30, 30, 241), [0.0, 1e-3]))
+        self.p = np.concatenate((np.linspace(0.001, 0.999, 101),
+                                 [0.0, 1.0]))
+
+    def assert_close(self, expected, actual):
+        np.testing.assert_allclose(expected, actual, rtol=1e-12, atol=1e-15)
+
+    def test_zone(self):
+        '''Test the zone is read from the struct'''
+        for *params, expected in self.CASES:
+            self.assertEqual(expected, zone(pystable.create(*params)))
+        self.assertEqual(Zone.STABLE,
+                         zone(pystable.create(1.5, 0.0, 1.0, 0.0, 1)))
+
+    def test_agrees_with_c(self):
+        '''Test closed forms against the C path for every case'''
+        for *params, _ in self.CASES:
+            dist = pystable.create(*params)
+            # In chunks the closed forms take
+            for x in np.array_split(self.x, 2):
+                for fn in (pystable.pdf_array, pystable.cdf_array):
+                    self.assert_close(fn(dist, x, fast=False), fn(dist, x))
+            for p in np.array_split(self.p[:-1], 4):
+                self.assert_close(pystable.q_array(dist, p, fast=False),
+                                  pystable.q_array(dist, p))
+
+    def test_dispatch(self):
+        '''Test which cases bypass libstable'''
+        x = np.linspace(-3, 3, 11)
+        out = np.empty_like(x)
+        stable = pystable.create(1.5, 0.0, 1.0, 0.0, 1)
+        self.assertFalse(closed_form('pdf', stable, x, out))
+
+        gauss = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+        self.assertTrue(closed_form('cdf', gauss, x, out))
+        big = np.full(CDF_MAX_POINTS + 1, 0.5)
+        self.assertTrue(closed_form('pdf', gauss, big, np.empty_like(big)))
+        self.assertFalse(closed_form('cdf', gauss, big, np.empty_like(big)))
+        self.assertTrue(closed_form('cdf', gauss, big[1:], big[1:].copy()))
+        self.assertFalse(closed_form('q', gauss, big[:Q_MAX_POINTS + 1],
+                                     big[:Q_MAX_POINTS + 1].copy()))
+
+        levy = pystable.create(0.5, -1.0, 1.0, 0.0, 1)
+        self.assertTrue(closed_form('pdf', levy, x, out))
+        self.assertFalse(closed_form('cdf', levy, x, out))
+        self.assertFalse(closed_form('q', levy, x, out))
+
+    def test_err_and_lists(self):
+        '''Test error estimates are 0 and the list API uses closed forms'''
+        dist = pystable.create(1.0, 0.0, 2.0, 0.5, 1)
+        _, err = pystable.cdf_array(dist, self.x, return_err=True)
+        np.testing.assert_array_equal(np.zeros_like(self.x), err)
+        x = self.x.tolist()
+        self.assert_close(pystable.cdf_array(dist, self.x, fast=False),
+                          pystable.cdf(dist, x, len(x)))
+        self.assert_close(pystable.pdf_array(dist, self.x, fast=False),
+                          pystable.pdf(dist, x, len(x)))
+        p = self.p[:-1].tolist()
+        self.assert_close(pystable.q_array(dist, p, fast=False),
+                          pystable.q(dist, p, len(p)))
+
+
+if __name__ == '__main__':
+    unittest.main()
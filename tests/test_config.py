@@ -0,0 +1,70 @@
+import unittest
+from dataclasses import asdict
+import pystable
+
+
+class TestConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = pystable.get_config()
+
+    def tearDown(self):
+        pystable.set_config(**asdict(self.previous))
+
+    def test_get_config(self):
+        '''Test `get_config` reads every libstable setting'''
+        actual = pystable.get_config()
+        self.assertGreater(actual.threads, 0)
+        self.assertGreater(actual.reltol, 0)
+        self.assertGreater(actual.it_max, 0)
+        self.assertIsInstance(actual.method1, pystable.Method)
+
+    def test_set_threads(self):
+        '''Test `set_threads` and `get_threads`'''
+        pystable.set_threads(3)
+        self.assertEqual(3, pystable.get_threads())
+
+    def test_set_config(self):
+        '''Test `set_config` returns previous settings'''
+        previous = pystable.set_config(abstol=1e-10, inv_maxiter=50)
+        self.assertEqual(self.previous, previous)
+        self.assertEqual(1e-10, pystable.get_abstol())
+        self.assertEqual(50, pystable.get_inv_maxiter())
+
+    def test_set_reltol_methods(self):
+        '''Test explicit methods are applied after `reltol`'''
+        pystable.set_config(reltol=1e-6, method1=pystable.Method.QAG2)
+        self.assertEqual(1e-6, pystable.get_reltol())
+        self.assertEqual(pystable.Method.QAG2, pystable.get_methods()[0])
+
+    def test_set_config_errors(self):
+        '''Test invalid settings raise'''
+        with self.assertRaises(TypeError):
+            pystable.set_config(threds=2)
+        with self.assertRaises(ValueError):
+            pystable.set_config(reltol=0)
+        with self.assertRaises(ValueError):
+            pystable.set_config(threads=-1)
+        with self.assertRaises(ValueError):
+            pystable.set_config(threads=65536)
+        with self.assertRaises(ValueError):
+            pystable.set_config(it_max=65536)
+
+    def test_set_config_limit(self):
+        '''Test the largest `unsigned short` value is stored as is'''
+        with pystable.configure(it_max=65535, inv_maxiter=65535):
+            config = pystable.get_config()
+            self.assertEqual(65535, config.it_max)
+            self.assertEqual(65535, config.inv_maxiter)
+
+    def test_configure(self):
+        '''Test `configure` restores previous settings on exit'''
+        with pystable.configure(threads=1, reltol=1e-4) as actual:
+            self.assertEqual(1, actual.threads)
+            self.assertEqual(1e-4, actual.reltol)
+        self.assertEqual(self.previous, pystable.get_config())
+
+        with self.assertRaises(RuntimeError):
+            with pystable.configure(threads=2):
+                raise RuntimeError
+        self.assertEqual(self.previous, pystable.get_config())
@@ -0,0 +1,110 @@
+import os
+import gc
+import ctypes as ct
+import pandas as pd
+import numpy as np
+import unittest
+import pystable
+
+
+class TestStableDistribution(unittest.TestCase):
+
+    def get_fit(self):
+        '''Get fit dist parameter'''
+        base = os.path.dirname(os.path.abspath(__file__))
+        base = os.path.join(base, 'helpers/fit.csv')
+        return pd.read_csv(base).to_dict(orient='records')[0]
+
+    def get_helper(self, file_name: str) -> pd.DataFrame:
+        base = os.path.dirname(os.path.abspath(__file__))
+        base = os.path.join(base, 'helpers')
+        return pd.read_csv(os.path.join(base, file_name))
+
+    def get_dist(self) -> pystable.StableDistribution:
+        fit = self.get_fit()
+        return pystable.StableDistribution(fit['alpha'], fit['beta'],
+                                           fit['sigma'], fit['mu'],
+                                           fit['parameterization'])
+
+    def test_params(self):
+        '''Test parameters match `create`'''
+        fit = self.get_fit()
+        expected = pystable.create(fit['alpha'], fit['beta'], fit['sigma'],
+                                   fit['mu'], fit['parameterization'])
+        actual = self.get_dist()
+        self.assertAlmostEqual(expected.contents.alpha, actual.alpha,
+                               places=10)
+        self.assertAlmostEqual(expected.contents.mu_0, actual.mu_0,
+                               places=10)
+        self.assertAlmostEqual(expected.contents.mu_1, actual.mu_1,
+                               places=10)
+
+    def test_invalid_params(self):
+        '''Test invalid parameters raise'''
+        with self.assertRaises(ValueError):
+            pystable.StableDistribution(3.0, 0.0, 1.0, 0.0, 1)
+
+    def test_pdf_cdf_ppf(self):
+        '''Test `pdf`, `cdf` and `ppf` against stored values'''
+        dist = self.get_dist()
+
+        pdfs = self.get_helper('pdfs.csv')
+        np.testing.assert_allclose(pdfs['value'],
+                                   dist.pdf(pdfs['x'].to_numpy()), rtol=1e-06)
+        cdfs = self.get_helper('cdfs.csv')
+        np.testing.assert_allclose(cdfs['value'],
+                                   dist.cdf(cdfs['x'].to_numpy()), rtol=1e-08)
+        quantiles = self.get_helper('quantiles.csv')
+        np.testing.assert_allclose(quantiles['value'],
+                                   dist.ppf(quantiles['q'].to_numpy()),
+                                   rtol=1e-05)
+
+    def test_rvs_fit(self):
+        '''Test `rvs` samples refit close to the original parameters'''
+        dist = self.get_dist()
+        samples = dist.rvs(5000, seed=1)
+
+        with pystable.StableDistribution(2, 0, 1, 0, 1) as fitted:
+            fitted.fit(samples)
+            np.testing.assert_allclose([dist.alpha, dist.sigma],
+                                       [fitted.alpha, fitted.sigma],
+                                       rtol=1.5e-01)
+
+    def test_copy(self):
+        '''Test `copy` yields an independent distribution'''
+        dist = self.get_dist()
+        actual = dist.copy()
+        self.assertIsNot(dist, actual)
+        for name, value in dist.params.items():
+            self.assertAlmostEqual(value, actual.params[name], places=15)
+
+        dist.close()
+        self.assertTrue(dist.closed)
+        self.assertFalse(actual.closed)
+        self.assertGreater(actual.sigma, 0)
+
+    def test_setparams(self):
+        '''Test `setparams` reparameterizes in place'''
+        dist = self.get_dist()
+        address = ct.addressof(dist.dist.contents)
+        dist.setparams(1.5, 0.2, 2.0, 0.5, 1)
+        self.assertEqual(address, ct.addressof(dist.dist.contents))
+        self.assertAlmostEqual(1.5, dist.alpha, places=10)
+        self.assertAlmostEqual(2.0, dist.sigma, places=10)
+
+        with self.assertRaises(ValueError):
+            dist.setparams(1.5, 2.0, 1.0, 0.0, 1)
+        self.assertAlmostEqual(0.2, dist.beta, places=10)
+
+    def test_close(self):
+        '''Test context manager and explicit `close` release the struct'''
+        with self.get_dist() as dist:
+            self.assertFalse(dist.closed)
+        self.assertTrue(dist.closed)
+        with self.assertRaises(ValueError):
+            dist.pdf([0.0])
+        dist.close()
+
+        dist = self.get_dist()
+        del dist
+        gc.collect()
@@ -0,0 +1,104 @@
+import numpy as np
+import unittest
+import pystable
+
+
+class TestFitting(unittest.TestCase):
+
+    params = [(1.5, 0.0, 1.0, 0.0), (1.8, 0.3, 2.0, 1.0),
+              (1.2, -0.2, 0.5, -1.0)]
+
+    def get_datasets(self, n: int = 2000):
+        datasets = []
+        for i, (alpha, beta, sigma, mu) in enumerate(self.params):
+            dist = pystable.create(alpha, beta, sigma, mu, 1)
+            datasets.append(pystable.rnd(dist, n, seed=i + 1))
+        return datasets
+
+    def test_fit_many(self):
+        '''Test `fit_many` matches sequential `fit_array`'''
+        datasets = self.get_datasets()
+        actual = pystable.fit_many(datasets, workers=2)
+
+        self.assertEqual([0, 1, 2], [r.index for r in actual])
+        for result, data in zip(actual, datasets):
+            expected = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+            status = pystable.fit_array(expected, data)
+            self.assertEqual(status, result.status)
+            self.assertAlmostEqual(expected.contents.alpha, result.alpha,
+                                   places=10)
+            self.assertAlmostEqual(expected.contents.sigma, result.sigma,
+                                   places=10)
+            self.assertGreater(result.elapsed, 0)
+
+    def test_fit_many_recovers_params(self):
+        '''Test fitted parameters are close to the generating ones'''
+        actual = pystable.fit_many(self.get_datasets(), workers=3,
+                                   executor='thread')
+        expected = [[a, s] for a, _, s, _ in self.params]
+        np.testing.assert_allclose(expected,
+                                   [[r.alpha, r.sigma] for r in actual],
+                                   rtol=1.5e-01)
+
+    def test_fit_many_regimes(self):
+        '''Test thread fits on both sides of alpha = 1 do not interfere'''
+        datasets = [pystable.rnd(pystable.create(alpha, 0.5, 1.0, 0.0, 1),
+                                 300, seed=i + 1)
+                    for i, alpha in enumerate((0.7, 1.6) * 4)]
+        expected = []
+        for data in datasets:
+            dist = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+            pystable.fit_array(dist, data, 'mle2d')
+            expected.append([dist.contents.alpha, dist.contents.sigma])
+        for _ in range(3):
+            actual = pystable.fit_many(datasets, 'mle2d', workers=4,
+                                       executor='thread')
+            np.testing.assert_array_equal(
+                expected, [[r.alpha, r.sigma] for r in actual])
+
+    def test_fit_iter(self):
+        '''Test `fit_iter` yields every series once'''
+        actual = list(pystable.fit_iter(self.get_datasets(500), workers=2))
+        self.assertEqual([0, 1, 2], sorted(r.index for r in actual))
+
+    def test_errors(self):
+        '''Test invalid method and executor'''
+        with self.assertRaises(ValueError):
+            pystable.fit_many([np.zeros(10)], method='nope')
+        with self.assertRaises(ValueError):
+            pystable.fit_many([np.zeros(10)], executor='gpu')
+
+    def test_methods(self):
+        '''Test every fit method recovers the generating parameters'''
+        alpha, beta, sigma, mu = self.params[0]
+        data = self.get_datasets(5000)[0]
+        for method in pystable.FIT_METHODS:
+            dist = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+            pystable.fit_array(dist, data, method)
+            np.testing.assert_allclose([alpha, sigma],
+                                       [dist.contents.alpha,
+                                        dist.contents.sigma],
+                                       rtol=1.5e-01, err_msg=method)
+
+    def test_mle2d_matches_fit(self):
+        '''Test 'mle2d' is the default `stable_fit`'''
+        data = self.get_datasets(1000)[1]
+        expected = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+        pystable.fit(expected, data, len(data))
+        actual = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+        pystable.fit_array(actual, data, 'mle2d')
+        self.assertEqual(expected.contents.alpha, actual.contents.alpha)
+
+    def test_presets(self):
+        '''Test presets resolve to methods and settings'''
+        self.assertEqual(('mcculloch', {}),
+                         pystable.resolve_method('fastest'))
+        method, config = pystable.resolve_method('balanced')
+        self.assertEqual('mle2d', method)
+        self.assertIn('reltol', config)
+
+        previous = pystable.get_config()
+        actual = pystable.fit_many(self.get_datasets(500), method='fast',
+                                   workers=2, executor='thread')
+        self.assertEqual(3, len(actual))
+        self.assertEqual(previous, pystable.get_config())
@@ -0,0 +1,103 @@
+import ctypes as ct
+import numpy as np
+import unittest
+import pystable
+from pystable.pystable import c_stable_loglikelihood
+
+
+class TestLikelihood(unittest.TestCase):
+
+    def setUp(self):
+        dist = pystable.create(1.5, 0.3, 2.0, 0.5, 0)
+        self.data = pystable.rnd(dist, 1000, seed=3)
+        self.params = np.array([[1.5, 0.3, 2.0, 0.5],
+                                [1.2, -0.5, 1.0, 0.0],
+                                [2.0, 0.0, 3.0, 1.0],
+                                [1.0, 1.0, 0.5, -1.0]])
+
+    def expected(self, row, parameterization=0) -> float:
+        lib = pystable.load_libstable()
+        dist = pystable.create(*row, parameterization)
+        data = (ct.c_double * self.data.size)(*self.data)
+        return c_stable_loglikelihood(lib)(dist, data, self.data.size)
+
+    def test_matches_stable_loglikelihood(self):
+        '''Test values agree with libstable for one and many vectors'''
+        expected = [self.expected(row) for row in self.params]
+        with pystable.LogLikelihood(self.data) as ll:
+            self.assertAlmostEqual(expected[0], ll(self.params[0]), 6)
+            np.testing.assert_allclose(expected, ll(self.params),
+                                       rtol=1e-12)
+            out = np.empty(len(self.params))
+            self.assertIs(out, ll(self.params, out=out))
+            np.testing.assert_allclose(expected, out, rtol=1e-12)
+
+    def test_parameterization(self):
+        '''Test mu is read in the requested parameterization'''
+        row = self.params[1]
+        with pystable.LogLikelihood(self.data, parameterization=1) as ll:
+            self.assertAlmostEqual(self.expected(row, 1), ll(row), 6)
+
+    def test_invalid(self):
+        '''Test invalid parameters give -inf and bad shapes raise'''
+        with pystable.LogLikelihood(self.data) as ll:
+            values = ll([[2.5, 0.0, 1.0, 0.0], [1.5, 0.0, -1.0, 0.0],
+                         [1.5, 0.3, 2.0, 0.5]])
+            self.assertEqual(-np.inf, values[0])
+            self.assertEqual(-np.inf, values[1])
+            self.assertTrue(np.isfinite(values[2]))
+            with self.assertRaises(ValueError):
+                ll([1.5, 0.0, 1.0])
+
+    def test_gradient(self):
+        '''Test the gradient against coarse differences, and at alpha=2'''
+        with pystable.LogLikelihood(self.data) as ll:
+            value, grad = ll.gradient(self.params[:2], return_value=True)
+            np.testing.assert_allclose(ll(self.params[:2]), value)
+            for k, row in enumerate(self.params[:2]):
+                for i in range(4):
+                    h = 1e-3 * (row[2] if i >= 2 else 1.0)
+                    up, down = row.copy(), row.copy()
+                    up[i] += h
+                    down[i] -= h
+                    coarse = (ll(up) - ll(down)) / (2 * h)
+                    self.assertAlmostEqual(coarse, grad[k, i],
+                                           delta=1e-3 * max(1, abs(coarse)))
+
+            # alpha = 2 and beta = 1 only have one valid side
+            grad = ll.gradient([2.0, 0.0, 1.0, 0.0])
+            self.assertEqual((4,), grad.shape)
+            self.assertTrue(np.all(np.isfinite(grad)))
+            grad = ll.gradient([1.0, 1.0, 0.5, -1.0])
+            self.assertTrue(np.all(np.isfinite(grad)))
+
+    def test_weights(self):
+        '''Test integer weights match repeating the points'''
+        data, weights = self.data[:50], np.arange(1.0, 51.0)
+        repeated = np.repeat(data, weights.astype(int))
+        with pystable.LogLikelihood(repeated) as ll:
+            expected = ll(self.params)
+        with pystable.LogLikelihood(data, weights=weights) as ll:
+            np.testing.assert_allclose(expected, ll(self.params),
+                                       rtol=1e-12)
+            with self.assertRaises(ValueError):
+                ll.bind(data, weights[1:])
+
+    def test_loglikelihood(self):
+        '''Test the function form reuses its workspace across datasets'''
+        expected = self.expected(self.params[0])
+        self.assertAlmostEqual(expected,
+                               pystable.loglikelihood(self.params[0],
+                                                      self.data), 6)
+        other = self.data[::-1].copy()
+        self.assertAlmostEqual(expected,
+                               pystable.loglikelihood(self.params[0], other),
+                               6)
+        value, grad = pystable.loglikelihood(self.params[:2], self.data,
+                                             gradient=True)
+        self.assertEqual((2,), value.shape)
+        self.assertEqual((2, 4), grad.shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import numpy as np
+import unittest
+import pystable
+from pystable import metrics
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.dist = pystable.create(1.5, 0.5, 1.0, 0.0, 1)
+        self.x = np.linspace(-5, 5, 50)
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_disabled(self):
+        '''Test nothing is recorded while metrics are off'''
+        pystable.pdf_array(self.dist, self.x)
+        pystable.pdf(self.dist, [0.0], 1)
+        snapshot = metrics.snapshot()
+        self.assertFalse(snapshot['enabled'])
+        self.assertEqual({}, snapshot['functions'])
+        self.assertEqual({}, snapshot['distributions'])
+
+    def test_functions(self):
+        '''Test calls, points and histograms are recorded per function'''
+        with metrics.recording():
+            pystable.pdf_array(self.dist, self.x)
+            pystable.pdf_array(self.dist, self.x[:5])
+            pystable.cdf(self.dist, [0.0, 1.0], 2)
+            pystable.rnd(self.dist, 100, seed=1)
+            pystable.fit_array(self.dist, pystable.rnd(self.dist, 100),
+                               'mcculloch')
+        self.assertFalse(metrics.is_enabled())
+
+        functions = metrics.snapshot()['functions']
+        self.assertEqual({'pdf_array', 'cdf', 'rnd', 'fit_array[mcculloch]'},
+                         set(functions))
+        pdf = functions['pdf_array']
+        self.assertEqual(2, pdf['calls'])
+        self.assertEqual(55, pdf['points'])
+        self.assertEqual(2, sum(pdf['latency']))
+        self.assertGreater(pdf['seconds'], 0.0)
+        # 5 points fall in the (1, 10] bucket and 50 in (10, 100]
+        self.assertEqual([0, 1, 1, 0, 0, 0, 0, 0], pdf['batch'])
+        self.assertEqual({'STABLE': 2}, pdf['zones'])
+        self.assertEqual(2, functions['rnd']['calls'])
+
+    def test_err(self):
+        '''Test libstable's error estimates are summarized'''
+        with metrics.recording():
+            pdf = pystable.pdf_array(self.dist, self.x)
+            pystable.pdf(self.dist, self.x.tolist(), self.x.size)
+        _, err = pystable.pdf_array(self.dist, self.x, return_err=True)
+
+        functions = metrics.snapshot()['functions']
+        for name in ('pdf_array', 'pdf'):
+            stats = functions[name]
+            self.assertEqual(self.x.size, stats['err_points'])
+            self.assertAlmostEqual(err.max(), stats['err_max'])
+            self.assertAlmostEqual(err.sum(), stats['err_sum'])
+            self.assertAlmostEqual(np.max(err / pdf), stats['err_rel_max'])
+
+    def test_distributions(self):
+        '''Test metrics are also recorded per distribution'''
+        gauss = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+        with metrics.recording():
+            pystable.pdf_array(self.dist, self.x)
+            pystable.cdf_array(self.dist, self.x)
+            pystable.pdf_array(gauss, self.x)
+
+        distributions = metrics.snapshot()['distributions']
+        self.assertEqual(2, len(distributions))
+        stats = distributions[metrics.distribution_label(self.dist)]
+        self.assertEqual(2, stats['calls'])
+        stats = distributions[metrics.distribution_label(gauss)]
+        self.assertEqual({'GAUSS': 1}, stats['zones'])
+        self.assertEqual(0.0, stats['err_max'])
+
+    def test_max_distributions(self):
+        '''Test distributions beyond the limit are pooled'''
+        limit = metrics.MAX_DISTRIBUTIONS
+        metrics.MAX_DISTRIBUTIONS = 2
+        try:
+            with metrics.recording():
+                for beta in (0.0, 0.1, 0.2, 0.3):
+                    pystable.rnd(pystable.create(1.5, beta, 1.0, 0.0, 1), 1)
+        finally:
+            metrics.MAX_DISTRIBUTIONS = limit
+        distributions = metrics.snapshot()['distributions']
+        self.assertEqual(3, len(distributions))
+        self.assertEqual(2, distributions[metrics.OTHER]['calls'])
+
+    def test_callback(self):
+        '''Test callbacks receive every call and are removed on exit'''
+        events = []
+        with metrics.recording(events.append):
+            pystable.cdf_array(self.dist, self.x, engine='point')
+            pystable.q(self.dist, [0.5], 1)
+        pystable.q(self.dist, [0.5], 1)
+
+        self.assertEqual(['cdf_array', 'q'], [e.function for e in events])
+        self.assertEqual(self.x.size, events[0].points)
+        self.assertEqual(metrics.distribution_label(self.dist),
+                         events[0].distribution)
+        self.assertEqual('STABLE', events[0].zone)
+        self.assertGreaterEqual(events[0].err_max, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
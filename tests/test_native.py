@@ -0,0 +1,97 @@
+import ctypes as ct
+import numpy as np
+import unittest
+import pystable
+from pystable import native, utils
+
+
+FUNCTIONS = ('c_stable_pdf', 'c_stable_cdf', 'c_stable_q', 'c_stable_rnd',
+             'c_stable_fit', 'c_stable_fit_koutrouvelis', 'c_stable_fit_mle')
+# Whether the default library is the compiled binding
+NATIVE = native.is_native(pystable.load_libstable())
+
+
+class TestNative(unittest.TestCase):
+
+    def setUp(self):
+        self.lib = pystable.load_libstable()
+        self.dist = pystable.create(1.5, 0.5, 1.0, 0.0, 1)
+
+    def test_library_path(self):
+        '''Test the compiled binding is recognised as libstable'''
+        if native.AVAILABLE:
+            lib = ct.CDLL(native.library_path())
+            self.assertTrue(native.is_native(lib))
+            self.assertIsNotNone(native.function(lib, 'stable_pdf'))
+        else:
+            self.assertIsNone(native.library_path())
+        self.assertIsNone(native.function(self.lib, 'stable_create'))
+
+    @unittest.skipIf(NATIVE, 'libstable is the compiled binding')
+    def test_ctypes(self):
+        '''Test other libraries are called through ctypes'''
+        self.assertFalse(native.is_native(self.lib))
+        self.assertIsNone(pystable.c_stable_pdf(self.lib).native)
+
+    @unittest.skipUnless(NATIVE, 'libstable is not the compiled binding')
+    def test_bound(self):
+        '''Test the wrapped functions are bound to their native ones'''
+        for name in FUNCTIONS:
+            c_fn = getattr(pystable, name)(self.lib)
+            self.assertIs(getattr(native._native, c_fn.__name__), c_fn.native)
+
+    @unittest.skipUnless(NATIVE, 'libstable is not the compiled binding')
+    def test_same_as_ctypes(self):
+        '''Test native calls match the ctypes calls of the same library'''
+        x = np.linspace(-10, 10, 101)
+        address = ct.addressof(self.dist.contents)
+        for name in ('c_stable_pdf', 'c_stable_cdf', 'c_stable_q'):
+            c_fn = getattr(pystable, name)(self.lib)
+            points = x if name != 'c_stable_q' else (x + 10.5) / 21
+            expected, expected_err = np.empty(101), np.empty(101)
+            c_fn(self.dist, utils.pointer(points), 101,
+                 utils.pointer(expected), utils.pointer(expected_err))
+            actual, err = np.empty(101), np.empty(101)
+            c_fn.native(address, points, actual, err)
+            np.testing.assert_array_equal(expected, actual)
+            np.testing.assert_array_equal(expected_err, err)
+            c_fn.native(address, points, actual)
+            np.testing.assert_array_equal(expected, actual)
+
+        c_fn = pystable.c_stable_rnd(self.lib)
+        pystable.stable_rnd_seed(self.lib, self.dist, 7)
+        expected = np.empty(10)
+        c_fn(self.dist, utils.pointer(expected), 10)
+        np.testing.assert_array_equal(expected,
+                                      pystable.rnd(self.dist, 10, seed=7))
+
+        data = pystable.rnd(self.dist, 500, seed=1)
+        expected = pystable.create(1.5, 0.5, 1.0, 0.0, 1)
+        pystable.c_stable_fit(self.lib)(expected, utils.pointer(data), 500)
+        actual = pystable.create(1.5, 0.5, 1.0, 0.0, 1)
+        self.assertEqual(0, pystable.fit_array(actual, data))
+        self.assertEqual(expected.contents.alpha, actual.contents.alpha)
+        self.assertEqual(expected.contents.beta, actual.contents.beta)
+
+    @unittest.skipUnless(NATIVE, 'libstable is not the compiled binding')
+    def test_buffers(self):
+        '''Test buffers of the wrong type or length are rejected'''
+        fn = pystable.c_stable_pdf(self.lib).native
+        address = ct.addressof(self.dist.contents)
+        x = np.zeros(4)
+        with self.assertRaises(TypeError):
+            fn(address, np.zeros(4, dtype=np.float32), np.empty(4))
+        with self.assertRaises(ValueError):
+            fn(address, x[::2], np.empty(2))
+        with self.assertRaises(ValueError):
+            fn(address, x, np.empty(3))
+        with self.assertRaises(ValueError):
+            fn(address, x, np.empty(4), np.empty(5))
+        with self.assertRaises(ValueError):
+            fn(0, x, np.empty(4))
+        with self.assertRaises((TypeError, BufferError)):
+            fn(address, x, x.tobytes())
+
+
+if __name__ == '__main__':
+    unittest.main()
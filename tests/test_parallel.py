@@ -0,0 +1,58 @@
+import os
+import pandas as pd
+import numpy as np
+import unittest
+import pystable
+
+
+class TestParallel(unittest.TestCase):
+
+    def get_dist(self):
+        base = os.path.dirname(os.path.abspath(__file__))
+        base = os.path.join(base, 'helpers/fit.csv')
+        fit = pd.read_csv(base).to_dict(orient='records')[0]
+        return pystable.create(fit['alpha'], fit['beta'], fit['sigma'],
+                               fit['mu'], fit['parameterization'])
+
+    def test_substream_seeds(self):
+        '''Test `substream_seeds` is deterministic and distinct'''
+        expected = pystable.substream_seeds(7, 16)
+        actual = pystable.substream_seeds(7, 16)
+        np.testing.assert_array_equal(expected, actual)
+        self.assertEqual(16, len(np.unique(actual)))
+        np.testing.assert_array_equal(expected[:4],
+                                      pystable.substream_seeds(7, 4))
+
+    def test_rnd_parallel_worker_invariant(self):
+        '''Test `rnd_parallel` output does not depend on worker count'''
+        dist = self.get_dist()
+        expected = pystable.rnd_parallel(dist, size=(4, 2500), seed=11,
+                                         workers=1, block_size=1000)
+        for workers in (2, 3, 8):
+            actual = pystable.rnd_parallel(dist, size=(4, 2500), seed=11,
+                                           workers=workers, block_size=1000)
+            np.testing.assert_array_equal(expected, actual)
+
+    def test_rnd_parallel_blocks(self):
+        '''Test each block is drawn from its own substream'''
+        lib = pystable.load_libstable()
+        dist = self.get_dist()
+        seeds = pystable.substream_seeds(3, 2)
+        actual = pystable.rnd_parallel(dist, 150, seed=3, workers=2,
+                                       block_size=100)
+
+        # Workers sample from `stable_copy`s of the dist
+        local = pystable.copy(dist)
+        pystable.stable_rnd_seed(lib, local, int(seeds[1]))
+        expected = pystable.stable_rnd(lib, local, 50)
+        pystable.free(local)
+        np.testing.assert_array_equal(expected, actual[100:])
+
+    def test_rnd_parallel_out(self):
+        '''Test `rnd_parallel` writes into a caller-supplied buffer'''
+        dist = self.get_dist()
+        out = np.zeros((2, 300))
+        actual = pystable.rnd_parallel(dist, out=out, seed=5, workers=2,
+                                       block_size=128)
+        self.assertTrue(np.shares_memory(out, actual))
+        self.assertTrue(np.all(out != 0))
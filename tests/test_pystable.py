@@ -20,6 +20,40 @@ class TestPystable(unittest.TestCase):
         base = os.path.join(base, 'helpers/rnd.csv')
         return pd.read_csv(base).to_dict(orient='records')[0]
 
+    def test_load_libstable_cached(self):
+        '''Test `load_libstable` loads the library once per path'''
+        lib = pystable.load_libstable()
+        self.assertIs(lib, pystable.load_libstable())
+
+    def test_wrap_function_cached(self):
+        '''Test `wrap_function` binds each C function once'''
+        lib = pystable.load_libstable()
+        first = pystable.c_stable_pdf(lib)
+        second = pystable.c_stable_pdf(lib)
+        self.assertIs(first, second)
+
+    def test_wrap_function_signature(self):
+        '''Test a different signature gets its own binding'''
+        lib = pystable.load_libstable()
+        pdf = pystable.c_stable_pdf(lib)
+        other = pystable.wrap_function(lib, 'stable_pdf', ct.c_int,
+                                       pdf.argtypes)
+        self.assertIsNot(pdf, other)
+        self.assertIs(ct.c_int, other.restype)
+        self.assertIsNot(ct.c_int, pdf.restype)
+        self.assertIs(other, pystable.wrap_function(lib, 'stable_pdf',
+                                                    ct.c_int, pdf.argtypes))
+
+    def test_clear_registry(self):
+        '''Test `clear_registry` drops cached libraries and functions'''
+        lib = pystable.load_libstable()
+        fn = pystable.c_stable_cdf(lib)
+        pystable.clear_registry()
+
+        actual = pystable.c_stable_cdf(pystable.load_libstable())
+        self.assertIsNot(fn, actual)
+        self.assertEqual('stable_cdf', actual.__name__)
+
     def test_checkparams(self):
         '''
         Test `checkparams` wrapper.
@@ -386,3 +420,66 @@ class TestPystable(unittest.TestCase):
         lib = pystable.load_libstable()
         actual = pystable.c_stable_rnd_point(lib)
         self.assertEqual('stable_rnd_point', actual.__name__)
+
+    def test_rnd_size(self):
+        '''Test `rnd` fills a `(sims, steps)` array in one call'''
+        fit = self.get_fit()
+        dist = pystable.create(fit['alpha'], fit['beta'], fit['sigma'],
+                               fit['mu'], fit['parameterization'])
+        actual = pystable.rnd(dist, size=(3, 5), seed=1)
+        self.assertEqual((3, 5), actual.shape)
+        self.assertEqual(np.float64, actual.dtype)
+
+    def test_rnd_out(self):
+        '''Test `rnd` writes into a caller-supplied buffer'''
+        fit = self.get_fit()
+        dist = pystable.create(fit['alpha'], fit['beta'], fit['sigma'],
+                               fit['mu'], fit['parameterization'])
+        out = np.zeros(100)
+        actual = pystable.rnd(dist, out=out)
+        self.assertTrue(np.shares_memory(out, actual))
+        self.assertTrue(np.all(out != 0))
+
+        with self.assertRaises(ValueError):
+            pystable.rnd(dist, 10, out=np.zeros(5))
+
+    def test_stable_rnd(self):
+        '''Test `stable_rnd` matches repeated `stable_rnd_point` draws'''
+        lib = pystable.load_libstable()
+        fit = self.get_fit()
+        dist = pystable.create(fit['alpha'], fit['beta'], fit['sigma'],
+                               fit['mu'], fit['parameterization'])
+
+        pystable.stable_rnd_seed(lib, dist, 42)
+        expected = [pystable.stable_rnd_point(lib, dist) for _ in range(50)]
+
+        pystable.stable_rnd_seed(lib, dist, 42)
+        actual = pystable.stable_rnd(lib, dist, 50)
+        np.testing.assert_array_equal(expected, actual)
+
+    def test_c_stable_rnd(self):
+        '''Test `stable_rnd` low-level function'''
+        lib = pystable.load_libstable()
+        actual = pystable.c_stable_rnd(lib)
+        self.assertEqual('stable_rnd', actual.__name__)
+
+    def test_copy(self):
+        '''Test `copy` wrapper creates an independent dist'''
+        fit = self.get_fit()
+        dist = pystable.create(fit['alpha'], fit['beta'], fit['sigma'],
+                               fit['mu'], fit['parameterization'])
+        actual = pystable.copy(dist)
+        self.assertNotEqual(ct.addressof(dist.contents),
+                            ct.addressof(actual.contents))
+        self.assertAlmostEqual(dist.contents.alpha, actual.contents.alpha,
+                               places=10)
+        self.assertAlmostEqual(dist.contents.mu_1, actual.contents.mu_1,
+                               places=10)
+        pystable.free(actual)
+
+    def test_c_stable_free(self):
+        '''Test `stable_free` low-level function'''
+        lib = pystable.load_libstable()
+        actual = pystable.c_stable_free(lib)
+        self.assertEqual('stable_free', actual.__name__)
+        self.assertIsNone(actual.restype)
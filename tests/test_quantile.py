@@ -0,0 +1,60 @@
+import numpy as np
+import unittest
+import pystable
+
+
+class TestQuantile(unittest.TestCase):
+
+    def setUp(self):
+        self.dist = pystable.create(1.45, 0.05, 1.0, 0.0, 1)
+        self.q = np.concatenate((np.geomspace(1e-5, 0.4, 100),
+                                 1 - np.geomspace(0.4, 1e-5, 100)))
+
+    def assert_quantiles(self, expected, actual):
+        scale = np.maximum(np.abs(expected), 1.0)
+        np.testing.assert_array_less(np.abs(actual - expected) / scale, 1e-7)
+
+    def test_matches_stable_q(self):
+        '''Test a sorted curve against the per-point path'''
+        expected = pystable.q_array(self.dist, self.q)
+        actual, err = pystable.q_sorted(self.dist, self.q, return_err=True)
+        self.assert_quantiles(expected, actual)
+        self.assertTrue(np.all(err >= 0.0))
+        self.assertTrue(np.all(np.diff(actual) > 0.0))
+
+    def test_order_and_duplicates(self):
+        '''Test unsorted input with repeats keeps its order'''
+        rng = np.random.default_rng(0)
+        q = rng.choice(self.q, size=300)
+        out = np.empty_like(q)
+        actual = pystable.q_sorted(self.dist, q, out=out)
+        self.assertIs(out, actual)
+        self.assert_quantiles(pystable.q_sorted(self.dist, np.sort(q)),
+                              np.sort(actual))
+        self.assert_quantiles(pystable.q_array(self.dist, q[:20]),
+                              actual[:20])
+
+    def test_special_values(self):
+        '''Test probabilities outside (0, 1) and small inputs'''
+        q = np.concatenate(([0.0, 1.0, -0.5, 2.0, np.nan], self.q))
+        actual = pystable.q_sorted(self.dist, q)
+        np.testing.assert_array_equal([-np.inf, np.inf], actual[:2])
+        self.assertTrue(np.all(np.isnan(actual[2:5])))
+        self.assert_quantiles(pystable.q_array(self.dist, self.q),
+                              actual[5:])
+
+        small = [0.01, 0.5, 0.99]
+        np.testing.assert_array_equal(pystable.q_array(self.dist, small),
+                                      pystable.q_sorted(self.dist, small))
+        self.assertEqual(0, pystable.q_sorted(self.dist, []).size)
+
+    def test_closed_form(self):
+        '''Test closed-form zones are passed to `q_array`'''
+        dist = pystable.create(1.0, 0.0, 2.0, 0.5, 1)
+        q = np.linspace(0.01, 0.99, 50)
+        np.testing.assert_array_equal(pystable.q_array(dist, q),
+                                      pystable.q_sorted(dist, q))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import numpy as np
+import unittest
+import pystable
+
+
+class TestRolling(unittest.TestCase):
+
+    def get_data(self, n: int, seed: int = 1) -> np.ndarray:
+        dist = pystable.create(1.5, 0.1, 1.0, 0.0, 1)
+        return pystable.rnd(dist, n, seed=seed)
+
+    def test_sorted_window(self):
+        '''Test the sorted order is maintained while sliding'''
+        data = self.get_data(500)
+        window = pystable.SortedWindow(100)
+        for i, value in enumerate(data):
+            window.push(value)
+            start = max(0, i + 1 - 100)
+            np.testing.assert_array_equal(data[start:i + 1], window.values)
+            np.testing.assert_array_equal(np.sort(data[start:i + 1]),
+                                          window.sorted)
+
+    def test_sorted_window_duplicates(self):
+        '''Test repeated values leave and enter correctly'''
+        window = pystable.SortedWindow(4)
+        window.extend([1.0, 1.0, 2.0, 0.0, 1.0, 3.0, 1.0])
+        np.testing.assert_array_equal([0.0, 1.0, 1.0, 3.0], window.sorted)
+        with self.assertRaises(ValueError):
+            window.push(np.nan)
+
+    def test_first_fit_matches_stable_fit(self):
+        '''Test the first window reproduces `stable_fit`'''
+        data = self.get_data(2000)
+        expected = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+        pystable.fit_array(expected, data)
+
+        with pystable.RollingFit(2000) as roller:
+            actual = roller.update(data)
+        self.assertTrue(actual.refit)
+        np.testing.assert_allclose(
+            [expected.contents.alpha, expected.contents.beta,
+             expected.contents.sigma, expected.contents.mu_1],
+            [actual.alpha, actual.beta, actual.sigma, actual.mu_1],
+            rtol=1e-06, atol=1e-09)
+
+    def test_drift(self):
+        '''Test small shifts skip the ML stage and large ones refit'''
+        data = self.get_data(3000)
+        with pystable.RollingFit(2000, drift=0.05) as roller:
+            first = roller.update(data[:2000])
+            second = roller.update(data[2000:2040])
+            self.assertFalse(second.refit)
+            self.assertEqual(first.alpha, second.alpha)
+
+            # A different regime moves the McCulloch estimate
+            gauss = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+            third = roller.update(pystable.rnd(gauss, 2000, seed=3))
+            self.assertTrue(third.refit)
+
+    def test_rolling_fit(self):
+        '''Test `rolling_fit` stays close to fitting each window afresh'''
+        data = self.get_data(2400)
+        actual = list(pystable.rolling_fit(data, 2000, 100, drift=0.0))
+        self.assertEqual(5, len(actual))
+        self.assertTrue(all(r.refit for r in actual))
+
+        expected = pystable.create(2.0, 0.0, 1.0, 0.0, 1)
+        pystable.fit_array(expected, data[400:])
+        self.assertAlmostEqual(expected.contents.alpha, actual[-1].alpha,
+                               delta=0.05)
+        self.assertAlmostEqual(expected.contents.sigma, actual[-1].sigma,
+                               delta=0.05)
@@ -0,0 +1,108 @@
+import numpy as np
+import unittest
+import pystable
+
+try:
+    import scipy  # NOQA: F401
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+class TestSampling(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dist = pystable.create(1.45, 0.05, 0.01, 0.001, 1)
+        cls.cache = pystable.DistributionCache()
+        cls.table = cls.cache.quantile_table(cls.dist.contents.alpha,
+                                             cls.dist.contents.beta)
+
+    def test_table(self):
+        '''Test the quantile table against `stable_q`'''
+        errors = self.table.errors
+        self.assertLess(errors['q_rel'], 1e-5)
+        self.assertLess(errors['cdf_abs'], 1e-8)
+        self.assertLess(errors['tail_rel'], 1e-3)
+
+        p = np.array([1e-7, 1e-3, 0.2, 0.5, 0.7, 0.999, 1 - 1e-7])
+        d = self.dist.contents
+        expected = pystable.q_array(self.dist, p)
+        actual = d.mu_0 + d.sigma * self.table.ppf(p)
+        np.testing.assert_allclose(expected, actual, rtol=1e-3)
+        np.testing.assert_array_equal([-np.inf, np.inf],
+                                      self.table.ppf([0.0, 1.0]))
+
+    def test_levy(self):
+        '''Test the table mirrors totally skewed Levy distributions'''
+        p = np.linspace(0.01, 0.99, 25)
+        right = pystable.create(0.5, 1.0, 1.0, 0.0, 0)
+        table = pystable.QuantileTable(0.5, -1.0, knots=513)
+        np.testing.assert_allclose(-pystable.q_array(right, 1 - p),
+                                   table.ppf(p), rtol=1e-6)
+
+    def test_skewed(self):
+        '''Test the light tail of totally skewed tables stays light'''
+        for alpha, beta, p in ((1.2, 1.0, 1e-9), (1.5, -1.0, 1 - 1e-9)):
+            table = pystable.QuantileTable(alpha, beta)
+            self.assertTrue(table.accurate)
+            dist = pystable.create(alpha, beta, 1.0, 0.0, 0)
+            expected = pystable.q_array(dist, [p])
+            np.testing.assert_allclose(expected, table.ppf([p]), rtol=0.1)
+
+        dist = pystable.create(1.5, -1.0, 1.0, 0.0, 0)
+        samples = pystable.rnd_table(dist, 2_000_000, seed=5,
+                                     cache=self.cache)
+        self.assertLess(samples.max(), 5.0)
+
+    def test_inaccurate(self):
+        '''Test `rnd_table` falls back to `rnd` beyond the bounds'''
+        table = pystable.QuantileTable(1.5, 0.5, knots=257)
+        self.assertTrue(table.accurate)
+        table.errors = dict(table.errors, tail_rel=1.0)
+        self.assertFalse(table.accurate)
+        dist = pystable.create(1.5, 0.5, 1.0, 0.0, 1)
+        actual = pystable.rnd_table(dist, 100, seed=6, table=table)
+        np.testing.assert_array_equal(pystable.rnd(dist, 100, seed=6),
+                                      actual)
+
+    def test_uniforms(self):
+        '''Test shapes, seeding and antithetic pairs'''
+        u = pystable.uniforms((5, 3), 'antithetic', seed=1)
+        self.assertEqual((5, 3), u.shape)
+        np.testing.assert_allclose(np.ones((2, 3)), u[:2] + u[3:])
+        np.testing.assert_array_equal(u, pystable.uniforms((5, 3),
+                                                           'antithetic', 1))
+        u = pystable.uniforms(1000, seed=2)
+        self.assertTrue(np.all((u >= 0) & (u < 1)))
+        with self.assertRaises(ValueError):
+            pystable.uniforms(10, 'halton')
+
+    @unittest.skipUnless(HAS_SCIPY, 'requires scipy')
+    def test_sobol(self):
+        '''Test Sobol points are stratified in every dimension'''
+        u = pystable.uniforms((256, 4), 'sobol', seed=3)
+        counts = np.apply_along_axis(
+            lambda c: np.histogram(c, 16, (0, 1))[0], 0, u)
+        np.testing.assert_array_equal(np.full((16, 4), 16), counts)
+
+    def test_rnd_table(self):
+        '''Test samples are the quantiles of the uniforms'''
+        samples = pystable.rnd_table(self.dist, seed=4, size=(50, 4),
+                                     cache=self.cache)
+        self.assertEqual((50, 4), samples.shape)
+        u = pystable.uniforms((50, 4), seed=4).reshape(-1)
+        expected = pystable.q_array(self.dist, u).reshape(50, 4)
+        np.testing.assert_allclose(expected, samples, rtol=1e-4,
+                                   atol=1e-8)
+
+        out = np.empty(200)
+        again = pystable.rnd_table(self.dist, 200, seed=4, out=out,
+                                   table=self.table)
+        self.assertTrue(np.shares_memory(out, again))
+        np.testing.assert_array_equal(samples.reshape(-1), out)
+        self.assertEqual(0, self.cache.stats().misses - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import numpy as np
+import unittest
+import pystable
+
+
+class TestStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.dist = pystable.create(1.5, 0.2, 1.0, 0.0, 1)
+        self.x = np.linspace(-20, 20, 1001)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.tmp.name, name)
+
+    def test_iter_chunks(self):
+        '''Test chunks are views covering the input in order'''
+        raw = self.path('x.bin')
+        self.x.tofile(raw)
+        chunks = list(pystable.iter_chunks(raw, 300))
+        self.assertEqual([300, 300, 300, 101], [c.size for c in chunks])
+        np.testing.assert_array_equal(self.x, np.concatenate(chunks))
+        with self.assertRaises(ValueError):
+            next(pystable.iter_chunks(raw, 0))
+
+    def test_stream(self):
+        '''Test lazily evaluating an iterator of chunks'''
+        chunks = (self.x[i:i + 128] for i in range(0, self.x.size, 128))
+        result = np.concatenate(list(pystable.stream(self.dist, chunks,
+                                                     'pdf')))
+        np.testing.assert_array_equal(pystable.pdf_array(self.dist, self.x),
+                                      result)
+        q = np.linspace(0.01, 0.99, 50)
+        result = np.concatenate(list(pystable.stream(self.dist, [q[:20],
+                                                                 q[20:]],
+                                                     'q')))
+        np.testing.assert_array_equal(pystable.q_array(self.dist, q), result)
+        with self.assertRaises(ValueError):
+            list(pystable.stream(self.dist, [q], 'ppf'))
+
+    def test_evaluate_file(self):
+        '''Test raw and .npy inputs and outputs against in-memory results'''
+        expected = pystable.cdf_array(self.dist, self.x)
+        raw, npy = self.path('x.bin'), self.path('x.npy')
+        self.x.tofile(raw)
+        np.save(npy, self.x)
+
+        for source in (raw, npy, self.x):
+            for target in ('cdf.bin', 'cdf.npy'):
+                out = pystable.evaluate_file(self.dist, source,
+                                             self.path(target),
+                                             chunk_size=256)
+                np.testing.assert_array_equal(expected, out)
+                del out
+        np.testing.assert_array_equal(
+            expected, np.fromfile(self.path('cdf.bin'), dtype=np.float64))
+        np.testing.assert_array_equal(expected,
+                                      np.load(self.path('cdf.npy')))
+
+    def test_byte_order_and_empty(self):
+        '''Test big-endian raw input and empty files'''
+        raw = self.path('x.be')
+        self.x.astype('>f8').tofile(raw)
+        out = pystable.evaluate_file(self.dist, raw, self.path('pdf.npy'),
+                                     'pdf', 100, dtype='>f8')
+        np.testing.assert_array_equal(pystable.pdf_array(self.dist, self.x),
+                                      out)
+
+        empty = self.path('empty.bin')
+        open(empty, 'wb').close()
+        out = pystable.evaluate_file(self.dist, empty, self.path('e.bin'))
+        self.assertEqual(0, out.size)
+        self.assertEqual(0, os.path.getsize(self.path('e.bin')))
+
+
+if __name__ == '__main__':
+    unittest.main()
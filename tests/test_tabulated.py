@@ -0,0 +1,119 @@
+import os
+import pandas as pd
+import numpy as np
+import unittest
+import pystable
+from pystable.tabulated import DEFAULT_TAIL
+
+
+class TestTabulated(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        base = os.path.dirname(os.path.abspath(__file__))
+        base = os.path.join(base, 'helpers/fit.csv')
+        fit = pd.read_csv(base).to_dict(orient='records')[0]
+        cls.dist = pystable.create(fit['alpha'], fit['beta'], fit['sigma'],
+                                   fit['mu'], fit['parameterization'])
+        cls.table = pystable.tabulate(cls.dist)
+
+    def get_helper(self, file_name: str) -> pd.DataFrame:
+        base = os.path.dirname(os.path.abspath(__file__))
+        base = os.path.join(base, 'helpers')
+        return pd.read_csv(os.path.join(base, file_name))
+
+    def test_errors(self):
+        '''Test the declared errors are small'''
+        errors = self.table.errors
+        self.assertLess(errors['pdf_rel'], 1e-4)
+        self.assertLess(errors['cdf_abs'], 1e-6)
+        self.assertLess(errors['q_rel'], 1e-4)
+        self.assertLess(errors['tail_rel'], 5e-2)
+
+    def test_pdf(self):
+        '''Test tabulated pdf against stored values'''
+        pdfs = self.get_helper('pdfs.csv')
+        actual = self.table.pdf(pdfs['x'].to_numpy())
+        np.testing.assert_allclose(pdfs['value'], actual, rtol=1e-04)
+
+    def test_cdf(self):
+        '''Test tabulated cdf against stored values'''
+        cdfs = self.get_helper('cdfs.csv')
+        actual = self.table.cdf(cdfs['x'].to_numpy())
+        np.testing.assert_allclose(cdfs['value'], actual, atol=1e-06)
+
+    def test_ppf(self):
+        '''Test tabulated quantiles against stored values'''
+        quantiles = self.get_helper('quantiles.csv')
+        actual = self.table.ppf(quantiles['q'].to_numpy())
+        np.testing.assert_allclose(quantiles['value'], actual, rtol=1e-04)
+
+    def test_tails(self):
+        '''Test evaluation beyond the table'''
+        z = np.array([-1e8, 1e8])
+        x = self.table.mu_0 + self.table.sigma * z
+        pdf = self.table.pdf(x)
+        cdf = self.table.cdf(x)
+        self.assertTrue(np.all(pdf > 0))
+        self.assertTrue(0 < cdf[0] < 1e-6 and 1 - 1e-6 < cdf[1] < 1)
+        np.testing.assert_array_equal([-np.inf, np.inf],
+                                      self.table.ppf([0.0, 1.0]))
+
+    def test_gauss(self):
+        '''Test the normal case against the closed form'''
+        dist = pystable.create(2.0, 0.0, 1.0, 0.0, 0)
+        table = pystable.tabulate(dist, knots=513)
+        x = np.array([-20.0, -1.0, 0.0, 2.5, 20.0])
+        expected = np.exp(-x ** 2 / 4) / np.sqrt(4 * np.pi)
+        np.testing.assert_allclose(expected, table.pdf(x), rtol=1e-04)
+
+    def test_shared_table(self):
+        '''Test one standardized table serves other sigma/mu'''
+        dist = pystable.StableDistribution(self.dist.contents.alpha,
+                                           self.dist.contents.beta,
+                                           2.0, 1.0, 0)
+        x = np.linspace(-5, 5, 11)
+        actual = pystable.TabulatedDistribution(self.table.table, 2.0, 1.0)
+        np.testing.assert_allclose(dist.pdf(x), actual.pdf(x), rtol=1e-04)
+
+    def test_skewed_tails(self):
+        '''Test the light tail of totally skewed distributions'''
+        p = DEFAULT_TAIL * np.array([1e-1, 1e-3])
+        for alpha in (0.5, 1.2, 1.5):
+            # Reference on the lower tail of beta = 1, reflected for
+            # beta = -1 since S0(alpha, -1) = -S0(alpha, 1)
+            dist = pystable.create(alpha, 1.0, 1.0, 0.0, 0)
+            z = np.array(pystable.q(dist, list(p), 2))
+            tail = pystable.cdf_array(dist, z)
+            for beta in (1.0, -1.0):
+                table = pystable.StableTable(alpha, beta)
+                self.assertTrue(table.accurate)
+                self.assertLess(table.errors['tail_rel'], 5e-2)
+                cdf = table.cdf(beta * z)
+                np.testing.assert_allclose(
+                    tail, cdf if beta > 0 else 1 - cdf, rtol=0.1)
+                np.testing.assert_allclose(
+                    beta * z, table.ppf(tail if beta > 0 else 1 - tail),
+                    rtol=1e-2)
+                pdf = table.pdf(beta * z)
+                self.assertTrue(0 < pdf[1] < pdf[0])
+
+        # Far beyond the table the light tail vanishes
+        table = pystable.StableTable(1.2, 1.0)
+        self.assertLess(table.pdf([-5.159])[0], 1e-20)
+        # and is zero beyond the support [-tan(pi alpha / 2), inf)
+        table = pystable.StableTable(0.5, 1.0)
+        np.testing.assert_array_equal([0.0, 0.0], table.pdf([-1.0, -2.0]))
+        np.testing.assert_array_equal([0.0, 0.0], table.cdf([-1.0, -2.0]))
+        table = pystable.StableTable(0.5, -1.0)
+        np.testing.assert_array_equal([0.0, 0.0], table.pdf([1.0, 2.0]))
+        np.testing.assert_array_equal([1.0, 1.0], table.cdf([1.0, 2.0]))
+
+    def test_accuracy_bound(self):
+        '''Test tables beyond `MAX_ERRORS` are refused'''
+        table = pystable.StableTable(1.5, 0.5, knots=257)
+        self.assertTrue(table.accurate)
+        table.errors = dict(table.errors, tail_rel=1.0)
+        self.assertFalse(table.accurate)
+        with self.assertRaises(ValueError):
+            pystable.TabulatedDistribution(table, 1.0, 0.0)
@@ -0,0 +1,96 @@
+import threading
+import numpy as np
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import pystable
+
+
+THREADS = 8
+
+
+class TestThreadLocal(unittest.TestCase):
+
+    def setUp(self):
+        self.dist = pystable.ThreadLocalDistribution(1.5, 0.2, 1.0, 0.0, 1,
+                                                     seed=7)
+        rng = np.random.default_rng(0)
+        self.chunks = [rng.uniform(-10, 10, 50) for _ in range(64)]
+
+    def tearDown(self):
+        self.dist.close()
+
+    def test_hammer_evaluate(self):
+        '''Test concurrent pdf/cdf/ppf calls match serial evaluation'''
+        with pystable.StableDistribution(1.5, 0.2, 1.0, 0.0, 1) as serial:
+            expected = [(serial.pdf(x), serial.cdf(x)) for x in self.chunks]
+            q = np.linspace(0.01, 0.99, 20)
+            expected_q = serial.ppf(q)
+
+        def work(i):
+            x = self.chunks[i % len(self.chunks)]
+            return i, self.dist.pdf(x), self.dist.cdf(x), self.dist.ppf(q)
+
+        with ThreadPoolExecutor(THREADS) as pool:
+            results = list(pool.map(work, range(4 * len(self.chunks))))
+        for i, pdf, cdf, quantiles in results:
+            pdf_0, cdf_0 = expected[i % len(expected)]
+            np.testing.assert_allclose(pdf_0, pdf, rtol=1e-12)
+            np.testing.assert_allclose(cdf_0, cdf, rtol=1e-12)
+            np.testing.assert_allclose(expected_q, quantiles, rtol=1e-12)
+        self.assertLessEqual(self.dist.clones, THREADS)
+
+    def test_hammer_rvs(self):
+        '''Test seeded draws are reproducible and clones draw differently'''
+        with pystable.StableDistribution(1.5, 0.2, 1.0, 0.0, 1) as serial:
+            expected = [serial.rvs(100, seed=i + 1) for i in range(32)]
+
+        with ThreadPoolExecutor(THREADS) as pool:
+            results = list(pool.map(
+                lambda i: self.dist.rvs(100, seed=i + 1), range(32)))
+        for want, got in zip(expected, results):
+            np.testing.assert_allclose(want, got, rtol=1e-12)
+
+        barrier = threading.Barrier(2)
+
+        def unseeded(_):
+            barrier.wait(5)
+            return self.dist.rvs(10)
+
+        with ThreadPoolExecutor(2) as pool:
+            a, b = pool.map(unseeded, range(2))
+        self.assertFalse(np.array_equal(a, b))
+
+    def test_setparams(self):
+        '''Test new parameters reach clones of running threads'''
+        x = self.chunks[0]
+        with ThreadPoolExecutor(THREADS) as pool:
+            list(pool.map(lambda _: self.dist.pdf(x), range(THREADS)))
+            self.dist.setparams(1.2, -0.3, 2.0, 1.0, 1)
+            results = list(pool.map(lambda _: self.dist.pdf(x),
+                                    range(4 * THREADS)))
+        with pystable.StableDistribution(1.2, -0.3, 2.0, 1.0, 1) as serial:
+            expected = serial.pdf(x)
+        for pdf in results:
+            np.testing.assert_allclose(expected, pdf, rtol=1e-12)
+        self.assertAlmostEqual(1.2, self.dist.alpha)
+
+    def test_fit_and_close(self):
+        '''Test fitting updates the shared parameters and close frees all'''
+        data = self.dist.rvs(1000, seed=3)
+        with pystable.StableDistribution(2.0, 0.0, 1.0, 0.0, 1) as serial:
+            serial.fit(data, 'mcculloch')
+            expected = serial.params
+        self.dist.fit(data, 'mcculloch')
+        self.assertAlmostEqual(expected['alpha'], self.dist.alpha)
+        self.assertAlmostEqual(expected['mu_0'], self.dist.mu_0)
+
+        local = self.dist.local()
+        self.dist.close()
+        self.assertTrue(self.dist.closed)
+        self.assertTrue(local.closed)
+        with self.assertRaises(ValueError):
+            self.dist.pdf([0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()